@@ -0,0 +1,4 @@
+import time
+
+# Used to measure the startup time, see main.OpenSlidesBackendGunicornApplication.
+STARTUP_TIME = time.perf_counter()
@@ -1,14 +1,28 @@
-from typing import Callable, Dict, Iterable, List, Type
+import random
+import threading
+import time
+from collections import Counter
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
 
-import fastjsonschema  # type: ignore
 from fastjsonschema import JsonSchemaException  # type: ignore
 
-from ..shared.exceptions import ActionException, EventStoreException
+from ..services.database.cache import DatabaseCache
+from ..services.permission import PermissionCache
+from ..shared import codec
+from ..shared.exceptions import (
+    ActionException,
+    DatabaseException,
+    EventStoreException,
+    ModelLocked,
+    PermissionDenied,
+)
 from ..shared.handlers import Base as HandlerBase
-from ..shared.interfaces import WriteRequestElement
-from ..shared.schema import schema_version
-from .actions_interface import ActionResult, Payload
-from .base import Action
+from ..shared.interfaces import Database, Permission, WriteRequestElement
+from ..shared.patterns import FullQualifiedId
+from ..shared.schema import compile_schema, schema_version
+from .actions_interface import ActionPayloadWithLabel, ActionResult, Payload
+from .base import Action, compact_write_request_elements
 
 
 def prepare_actions_map() -> None:
@@ -40,8 +54,8 @@ def register_action(name: str) -> Callable[[Type[Action]], Type[Action]]:
 prepare_actions_map()
 
 
-payload_schema = fastjsonschema.compile(
-    {
+payload_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Schema for actions API",
         "description": "An array of actions.",
@@ -79,15 +93,50 @@ payload_schema = fastjsonschema.compile(
 )
 
 
+# Counters for all retries of this worker, see ActionsHandler.handle_request.
+retry_stats: Counter = Counter()
+retry_stats_lock = threading.Lock()
+
+
+def count_retry_stat(key: str) -> None:
+    """
+    Increments the given retry counter. Worker processes may run several
+    threads, so the counters are locked.
+    """
+    with retry_stats_lock:
+        retry_stats[key] += 1
+
+
 class ActionsHandler(HandlerBase):
     """
     Actions handler. It is the concret implementation of Actions interface.
     """
 
-    def handle_request(self, payload: Payload, user_id: int) -> List[ActionResult]:
+    max_retries = 3
+    retry_backoff = 0.05  # Seconds
+
+    # Use None to send one write request element per instance, "action" to
+    # compact all elements of one action into one element or "payload" to
+    # compact all elements of the whole request into one element.
+    write_request_compaction: Optional[str] = "action"
+
+    # Use True to fetch all permissions of the user once per request instead
+    # of asking the permission service for the single permissions.
+    permission_preload = False
+
+    # Use True to perform consecutive actions with the same name at once, see
+    # plan_actions.
+    merge_actions = True
+
+    def handle_request(
+        self, payload: Payload, user_id: int, atomic: bool = True
+    ) -> List[ActionResult]:
         """
         Takes payload and user id and handles this request by validating and
         parsing all actions. In the end it sends everything to the event store.
+
+        If atomic is False, every action is handled separately (see
+        handle_separately).
         """
         self.user_id = user_id
 
@@ -97,26 +146,148 @@ class ActionsHandler(HandlerBase):
         except JsonSchemaException as exception:
             raise ActionException(exception.message)
 
-        # TODO: Start a loop here and retry parsing actions and writing to event
-        # store for some time if event store sends ModelLocked Exception
+        if not atomic:
+            return self.handle_separately(payload)
 
-        # Parse actions and creates events
-        write_request_elements = self.parse_actions(payload)
+        # Parse actions and send events to event store. Retry this with fresh
+        # data if the event store reports that some locked fields were modified
+        # in the meantime.
+        count_retry_stat("requests")
+        attempt = 0
+        while True:
+            # Parse actions and creates events. Use a copy of the payload because
+            # actions may change it.
+            write_request_elements = self.parse_actions(deepcopy(payload))
 
-        # Send events to database
-        try:
-            self.services.event_store().send(write_request_elements)
-        except EventStoreException as exception:
-            raise ActionException(exception.message)
+            # Send events to database. Skip this if nothing has changed.
+            if not write_request_elements:
+                break
+            try:
+                self.services.event_store().send(write_request_elements)
+            except ModelLocked as exception:
+                if attempt >= self.max_retries:
+                    count_retry_stat("failures")
+                    raise ActionException(exception.message)
+                attempt += 1
+                self.wait_for_retry(attempt, exception)
+            except EventStoreException as exception:
+                raise ActionException(exception.message)
+            else:
+                break
 
-        # Return action result
-        # TODO: This is a fake result because in this place all actions were
-        # always successful.
         self.logger.debug("Request was successful. Send response now.")
         return [
             ActionResult(success=True, message="Action handled successfully")
         ] * len(payload)
 
+    def handle_separately(self, payload: Payload) -> List[ActionResult]:
+        """
+        Handles every action of the payload independently and returns one
+        result per action. Failing actions do not affect the others.
+
+        The actions are handled in rounds. All actions of one round share one
+        database cache and all their write request elements are sent with one
+        event store request. An action that writes to an object that an
+        earlier action of the same round writes to is deferred to the next
+        round so that it reads the new data.
+        """
+        results: List[Optional[ActionResult]] = [None] * len(payload)
+        permission = PermissionCache(self.permission(), preload=self.permission_preload)
+        count_retry_stat("requests")
+        attempt = 0
+        pending = list(enumerate(payload))
+        while pending:
+            database = DatabaseCache(self.database())
+            group: List[Tuple[int, List[WriteRequestElement]]] = []
+            written_fqids: Set[FullQualifiedId] = set()
+            deferred = []
+            for index, element in pending:
+                try:
+                    write_request_elements = self.perform_action(
+                        deepcopy(element), permission, database
+                    )
+                except (
+                    ActionException,
+                    PermissionDenied,
+                    DatabaseException,
+                ) as exception:
+                    results[index] = ActionResult(
+                        success=False, message=exception.message
+                    )
+                    continue
+                fqids = {
+                    event["fqid"]
+                    for write_request_element in write_request_elements
+                    for event in write_request_element["events"]
+                }
+                if not written_fqids.isdisjoint(fqids):
+                    deferred.append((index, element))
+                    continue
+                written_fqids.update(fqids)
+                group.append((index, write_request_elements))
+            if group:
+                all_write_request_elements = [
+                    write_request_element
+                    for _, write_request_elements in group
+                    for write_request_element in write_request_elements
+                ]
+                if (
+                    self.write_request_compaction == "payload"
+                    and all_write_request_elements
+                ):
+                    all_write_request_elements = [
+                        compact_write_request_elements(all_write_request_elements)
+                    ]
+                try:
+                    if all_write_request_elements:
+                        self.services.event_store().send(all_write_request_elements)
+                except ModelLocked as exception:
+                    if attempt < self.max_retries:
+                        attempt += 1
+                        self.wait_for_retry(attempt, exception)
+                        deferred = sorted(
+                            deferred + [(index, payload[index]) for index, _ in group],
+                            key=lambda item: item[0],
+                        )
+                    else:
+                        count_retry_stat("failures")
+                        for index, _ in group:
+                            results[index] = ActionResult(
+                                success=False, message=exception.message
+                            )
+                except EventStoreException as exception:
+                    for index, _ in group:
+                        results[index] = ActionResult(
+                            success=False, message=exception.message
+                        )
+                else:
+                    for index, _ in group:
+                        results[index] = ActionResult(
+                            success=True, message="Action handled successfully"
+                        )
+            pending = deferred
+        self.logger.debug("All actions handled. Send response now.")
+        return [result for result in results if result is not None]
+
+    def wait_for_retry(self, attempt: int, exception: ModelLocked) -> None:
+        """
+        Counts and logs the given retry and waits before it.
+        """
+        count_retry_stat("retries")
+        self.logger.debug(
+            f"Event store reports locked fields: {exception.message} "
+            f"Retry request ({attempt}/{self.max_retries})."
+        )
+        time.sleep(self.get_retry_delay(attempt))
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Returns the delay in seconds before the given retry. Uses exponential
+        backoff with full jitter so that concurrent requests do not collide
+        again.
+        """
+        return random.uniform(0, self.retry_backoff * 2 ** (attempt - 1))
+
     def validate(self, payload: Payload) -> None:
         """
         Validates actions requests sent by client. Raises JsonSchemaException if
@@ -129,22 +300,108 @@ class ActionsHandler(HandlerBase):
         """
         Parses actions request send by client. Raises ActionException or
         PermissionDenied if something went wrong.
+
+        All actions share one database cache and one permission cache so that
+        every object is fetched and every permission is checked only once
+        during this request.
         """
         all_write_request_elements: List[WriteRequestElement] = []
+        database = DatabaseCache(self.database())
+        permission = PermissionCache(self.permission(), preload=self.permission_preload)
+        if self.merge_actions:
+            payload = self.plan_actions(payload)
         for element in payload:
-            self.logger.debug(
-                f"Actions map contains the following actions: {actions_map}."
+            all_write_request_elements.extend(
+                self.perform_action(element, permission, database)
             )
-            action = actions_map.get(element["action"])
-            if action is None:
-                raise ActionException(f"Action {element['action']} does not exist.")
-            self.logger.debug(f"Perform action {element['action']}.")
-            write_request_elements = action(self.permission(), self.database()).perform(
-                element["data"], self.user_id
+        if self.write_request_compaction == "payload" and all_write_request_elements:
+            all_write_request_elements = [
+                compact_write_request_elements(all_write_request_elements)
+            ]
+        self.logger.debug("All write request elements ready.")
+        return all_write_request_elements
+
+    def plan_actions(self, payload: Payload) -> Payload:
+        """
+        Merges consecutive actions with the same name into one action with
+        the concatenated data so that all instances are prepared in one
+        perform call. Actions with object data are never merged. An action is
+        not merged either if it contains an instance (or an id) that is
+        already part of the merged action.
+        """
+        planned_payload: Payload = []
+        ids: Set[Any] = set()
+        instances: Set[bytes] = set()
+        for element in payload:
+            data = element["data"]
+            last_element = planned_payload[-1] if planned_payload else None
+            data_instances = (
+                get_instance_keys(data) if isinstance(data, list) else set()
             )
+            if (
+                last_element is not None
+                and last_element["action"] == element["action"]
+                and isinstance(last_element["data"], list)
+                and isinstance(data, list)
+                and instances.isdisjoint(data_instances)
+                and ids.isdisjoint(get_ids(data))
+            ):
+                last_element["data"].extend(data)
+                ids.update(get_ids(data))
+                instances.update(data_instances)
+            else:
+                planned_payload.append(
+                    ActionPayloadWithLabel(
+                        action=element["action"],
+                        data=list(data) if isinstance(data, list) else data,
+                    )
+                )
+                ids = set(get_ids(data)) if isinstance(data, list) else set()
+                instances = data_instances
+        if len(planned_payload) < len(payload):
             self.logger.debug(
-                f"Prepared write request element {write_request_elements}."
+                f"Merged {len(payload)} actions into {len(planned_payload)} actions."
             )
-            all_write_request_elements.extend(write_request_elements)
-        self.logger.debug("All write request elements ready.")
-        return all_write_request_elements
+        return planned_payload
+
+    def perform_action(
+        self,
+        element: ActionPayloadWithLabel,
+        permission: Permission,
+        database: Database,
+    ) -> List[WriteRequestElement]:
+        """
+        Performs one action of the payload and returns its write request
+        elements. Raises ActionException or PermissionDenied if something went
+        wrong.
+        """
+        action = actions_map.get(element["action"])
+        if action is None:
+            raise ActionException(f"Action {element['action']} does not exist.")
+        self.logger.debug(f"Perform action {element['action']}.")
+        write_request_elements = list(
+            action(permission, database).perform(element["data"], self.user_id)
+        )
+        if self.write_request_compaction == "action" and write_request_elements:
+            write_request_elements = [
+                compact_write_request_elements(write_request_elements)
+            ]
+        self.logger.debug(f"Prepared write request element {write_request_elements}.")
+        return write_request_elements
+
+
+def get_instance_keys(data: List[Dict[str, Any]]) -> Set[bytes]:
+    """
+    Returns a canonical JSON representation of every given instance so that
+    equal instances can be found with a set.
+    """
+    return {codec.dumpb(instance, sort_keys=True) for instance in data}
+
+
+def get_ids(data: List[Dict[str, Any]]) -> Iterable[Any]:
+    """
+    Yields the ids of all given instances that have one.
+    """
+    for instance in data:
+        if isinstance(instance, dict) and "id" in instance:
+            yield instance["id"]
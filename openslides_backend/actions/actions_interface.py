@@ -17,8 +17,11 @@ class Actions(Protocol):  # pragma: no cover
     Interface for actions component.
 
     The handle_request method raises ActionException or PermissionDenied if
-    the request fails.
+    the request fails. If atomic is False, it returns the results of all
+    actions instead.
     """
 
-    def handle_request(self, payload: Payload, user_id: int,) -> List[ActionResult]:
+    def handle_request(
+        self, payload: Payload, user_id: int, atomic: bool = True
+    ) -> List[ActionResult]:
         ...
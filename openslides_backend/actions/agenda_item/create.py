@@ -1,16 +1,14 @@
 from typing import Any, Dict
 
-import fastjsonschema  # type: ignore
-
 from ...models.agenda_item import AgendaItem
-from ...shared.patterns import Collection, FullQualifiedId
+from ...shared.patterns import FullQualifiedId
 from ...shared.permissions.topic import TOPIC_CAN_MANAGE
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..generics import CreateAction
 
-create_agenda_item_schema = fastjsonschema.compile(
-    {
+create_agenda_item_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "New agenda items schema",
         "description": "An array of new agenda items.",
@@ -44,8 +42,7 @@ class AgendaItemCreate(CreateAction):
     permissions = [TOPIC_CAN_MANAGE]
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
-        collection_name, id = instance["content_object_id"].split("/")
-        instance["content_object_id"] = FullQualifiedId(
-            Collection(collection_name), int(id)
+        instance["content_object_id"] = FullQualifiedId.parse(
+            instance["content_object_id"]
         )
         return instance
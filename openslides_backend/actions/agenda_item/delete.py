@@ -1,13 +1,11 @@
-import fastjsonschema  # type: ignore
-
 from ...models.agenda_item import AgendaItem
 from ...shared.permissions.topic import TOPIC_CAN_MANAGE
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..generics import DeleteAction
 
-delete_agenda_item_schema = fastjsonschema.compile(
-    {
+delete_agenda_item_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Delete agenda items schema",
         "description": "An array of agenda items to be deleted.",
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from fastjsonschema import JsonSchemaException  # type: ignore
 from mypy_extensions import TypedDict
@@ -7,11 +7,12 @@ from ..models.base import Model
 from ..models.fields import RelationMixin
 from ..shared.exceptions import ActionException
 from ..shared.interfaces import Database, Event, Permission, WriteRequestElement
-from ..shared.patterns import FullQualifiedId
+from ..shared.patterns import Collection, FullQualifiedField, FullQualifiedId
 from .actions_interface import ActionPayload
 from .relations import Relations, RelationsHandler
 
 DataSet = TypedDict("DataSet", {"position": int, "data": Any})
+RelationFields = List[Tuple[str, RelationMixin, bool]]
 
 
 class BaseAction:  # pragma: no cover
@@ -19,6 +20,7 @@ class BaseAction:  # pragma: no cover
     Abstract base class for actions.
     """
 
+    model: Model
     permission: Permission
     database: Database
     user_id: int
@@ -42,6 +44,7 @@ class Action(BaseAction):
     def __init__(self, permission: Permission, database: Database) -> None:
         self.permission = permission
         self.database = database
+        self.accumulated_relations: Relations = {}
 
     def perform(
         self, payload: ActionPayload, user_id: int
@@ -96,17 +99,33 @@ class Action(BaseAction):
 
         By default it calls self.create_element_write_request_element and uses
         get_relations_updates() for relations.
+
+        If some instances change the same relation field, only the last one
+        gets an update event for it. Its value contains the changes of all
+        instances (see get_relations()).
         """
         position = dataset["position"]
-        for element in dataset["data"]:
+        last_changes: Dict[FullQualifiedField, int] = {}
+        for index, element in enumerate(dataset["data"]):
+            for fqfield in element["relations"].keys():
+                last_changes[fqfield] = index
+        for index, element in enumerate(dataset["data"]):
             element_write_request_element = self.create_instance_write_request_element(
                 position, element
             )
-            for relation in self.get_relations_updates(position, element):
-                element_write_request_element = merge_write_request_elements(
-                    (element_write_request_element, relation)
+            relations = {
+                fqfield: data
+                for fqfield, data in element["relations"].items()
+                if last_changes[fqfield] == index
+            }
+            yield merge_write_request_elements(
+                (
+                    element_write_request_element,
+                    *self.get_relations_updates(
+                        position, relations, element.get("model")
+                    ),
                 )
-            yield element_write_request_element
+            )
 
     def create_instance_write_request_element(
         self, position: int, element: Any
@@ -117,22 +136,26 @@ class Action(BaseAction):
         raise NotImplementedError
 
     def get_relations_updates(
-        self, position: int, element: Any
+        self, position: int, relations: Relations, model: Model = None
     ) -> Iterable[WriteRequestElement]:
         """
-        Creates write request elements (with update events) for all relations.
+        Creates write request elements (with update events) for all relations
+        of an instance of the given model which defaults to the model of this
+        action.
         """
-        for fqfield, data in element["relations"].items():
+        if model is None:
+            model = self.model
+        for fqfield, data in relations.items():
             event = Event(
                 type="update",
                 fqid=FullQualifiedId(fqfield.collection, fqfield.id),
                 fields={fqfield.field: data["value"]},
             )
             if data["type"] == "add":
-                info_text = f"Object attached to {self.model}"
+                info_text = f"Object attached to {model}"
             else:
                 # data["type"] == "remove"
-                info_text = f"Object attachment to {self.model} reset"
+                info_text = f"Object attachment to {model} reset"
             yield WriteRequestElement(
                 events=[event],
                 information={
@@ -159,6 +182,7 @@ class Action(BaseAction):
         obj: Dict[str, Any],
         relation_fields: Iterable[Tuple[str, RelationMixin, bool]],
         shortcut: bool = False,
+        deleted: Set[FullQualifiedId] = None,
     ) -> Relations:
         """
         Updates (reverse) relations of the given model for the given fields. Use
@@ -166,10 +190,37 @@ class Action(BaseAction):
 
         If shortcut is True, we assume a create case. That means that all
         relations are added.
+
+        All changes are accumulated over all instances of this action, so if
+        some instances change the same relation field, every instance gets the
+        value including the changes of the instances before.
+
+        Related objects in deleted are deleted by this action, too. They are
+        not changed.
         """
         relations: Relations = {}
+        for handler in self.get_relations_handlers(
+            model, id, obj, relation_fields, shortcut, deleted
+        ):
+            result = handler.perform()
+            relations.update(result)
+            self.accumulated_relations.update(result)
+        return relations
+
+    def get_relations_handlers(
+        self,
+        model: Model,
+        id: int,
+        obj: Dict[str, Any],
+        relation_fields: Iterable[Tuple[str, RelationMixin, bool]],
+        shortcut: bool = False,
+        deleted: Set[FullQualifiedId] = None,
+    ) -> Iterable[RelationsHandler]:
+        """
+        Yields a relations handler for each of the given relation fields.
+        """
         for field_name, field, is_reverse in relation_fields:
-            handler = RelationsHandler(
+            yield RelationsHandler(
                 self.database,
                 self.set_min_position,
                 model,
@@ -180,10 +231,70 @@ class Action(BaseAction):
                 is_reverse,
                 only_add=shortcut,
                 only_remove=False,
+                accumulated_relations=self.accumulated_relations,
+                deleted=deleted,
             )
-            result = handler.perform()
-            relations.update(result)
-        return relations
+
+    def prefetch_relations(
+        self,
+        instances: Iterable[Tuple[int, Dict[str, Any], RelationFields]],
+        shortcut: bool = False,
+        model: Model = None,
+        deleted: Set[FullQualifiedId] = None,
+    ) -> None:
+        """
+        Fetches all objects that are read during get_relations() for all given
+        instances in advance. Use this method in prepare_dataset method before
+        calling get_relations() for every single instance.
+
+        The instances are given as tuples of id, object and relation fields. If
+        shortcut is True, we assume a create case (see get_relations()). The
+        instances belong to the given model which defaults to the model of
+        this action. See get_relations() for deleted.
+
+        All fields of one collection are fetched with one getMany call so the
+        relations handlers are served by the database cache afterwards.
+        """
+        instances = list(instances)
+        if model is None:
+            model = self.model
+
+        # Fetch current relation fields of all instances. In create case there
+        # is nothing in the database yet.
+        if not shortcut:
+            mapped_fields: Set[str] = set()
+            for _, _, relation_fields in instances:
+                for field_name, field, _ in relation_fields:
+                    mapped_fields.add(field_name)
+                    if field.structured_relation is not None:
+                        mapped_fields.add(field.structured_relation)
+            if mapped_fields:
+                _, position = self.database.getMany(
+                    model.collection,
+                    [id for id, _, _ in instances],
+                    mapped_fields=sorted(mapped_fields),
+                )
+                self.set_min_position(position)
+
+        # Collect all related objects and their related fields per collection.
+        requests: Dict[Collection, Tuple[Set[int], Set[str]]] = {}
+        for id, obj, relation_fields in instances:
+            for handler in self.get_relations_handlers(
+                model, id, obj, relation_fields, shortcut, deleted
+            ):
+                for fqfield in handler.get_related_fqfields():
+                    ids, fields = requests.setdefault(
+                        fqfield.collection, (set(), set())
+                    )
+                    ids.add(fqfield.id)
+                    fields.add(fqfield.field)
+
+        # Fetch them.
+        for collection, (ids, fields) in requests.items():
+            _, position = self.database.getMany(
+                collection, sorted(ids), mapped_fields=sorted(fields)
+            )
+            self.set_min_position(position)
 
 
 def merge_write_request_elements(
@@ -199,10 +310,7 @@ def merge_write_request_elements(
     for element in write_request_elements:
         events.extend(element["events"])
         for fqid, info_text in element["information"].items():
-            if information.get(fqid) is None:
-                information[fqid] = info_text
-            else:
-                information[fqid].extend(info_text)
+            information.setdefault(fqid, []).extend(info_text)
         if user_id is None:
             user_id = element["user_id"]
         else:
@@ -223,3 +331,35 @@ def merge_write_request_elements(
         user_id=user_id,
         locked_fields=locked_fields,
     )
+
+
+def compact_write_request_elements(
+    write_request_elements: Iterable[WriteRequestElement],
+) -> WriteRequestElement:
+    """
+    Merges the given write request elements to one big write request element
+    like merge_write_request_elements() does. Additionally all update events on
+    the same fqid are coalesced into one event. Fields of later events win.
+    Update events are never coalesced across a create or delete event on the
+    same fqid.
+    """
+    write_request_element = merge_write_request_elements(write_request_elements)
+    events: List[Event] = []
+    update_events: Dict[FullQualifiedId, Event] = {}
+    for event in write_request_element["events"]:
+        fqid = event["fqid"]
+        if event["type"] == "update":
+            update_event = update_events.get(fqid)
+            if update_event is None:
+                update_event = Event(
+                    type="update", fqid=fqid, fields=dict(event["fields"])
+                )
+                update_events[fqid] = update_event
+                events.append(update_event)
+            else:
+                update_event["fields"].update(event["fields"])
+        else:
+            update_events.pop(fqid, None)
+            events.append(event)
+    write_request_element["events"] = events
+    return write_request_element
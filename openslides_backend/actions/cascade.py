@@ -0,0 +1,96 @@
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+from ..models.fields import RelationMixin, ReverseRelations
+from ..shared.interfaces import Database
+from ..shared.patterns import Collection, FullQualifiedId
+
+
+class CascadeHandler:
+    """
+    Finds all objects that have to be deleted together with some objects
+    because of relation fields with on_delete "cascade".
+
+    The reverse relations are walked breadth first. Every level of dependent
+    objects is fetched with one getMany call per collection. Objects that are
+    reached more than once, e. g. because of cycles, are deleted only once.
+    """
+
+    def __init__(
+        self, database: Database, set_min_position: Callable[[int], None],
+    ) -> None:
+        self.database = database
+        self.set_min_position = set_min_position
+
+    def get_cascade(
+        self, collection: Collection, ids: Iterable[int]
+    ) -> Dict[Collection, List[int]]:
+        """
+        Returns the ids of all objects to be deleted per collection in order
+        of their level. The given objects are included.
+        """
+        result: Dict[Collection, List[int]] = {}
+        seen: Set[FullQualifiedId] = set()
+        level: Dict[Collection, List[int]] = {}
+        for id in ids:
+            self.add(FullQualifiedId(collection, id), seen, level, result)
+        while level:
+            next_level: Dict[Collection, List[int]] = {}
+            for level_collection, level_ids in level.items():
+                cascade_fields = [
+                    field
+                    for field in ReverseRelations.get(level_collection, [])
+                    if field.on_delete == "cascade"
+                ]
+                if not cascade_fields:
+                    continue
+                instances, position = self.database.getMany(
+                    level_collection,
+                    level_ids,
+                    mapped_fields=sorted(
+                        set(field.related_name for field in cascade_fields)
+                    ),
+                )
+                self.set_min_position(position)
+                for id in level_ids:
+                    instance = instances.get(id, {})
+                    for field in cascade_fields:
+                        for fqid in self.get_dependents(
+                            field, instance.get(field.related_name)
+                        ):
+                            self.add(fqid, seen, next_level, result)
+            level = next_level
+        return result
+
+    def add(
+        self,
+        fqid: FullQualifiedId,
+        seen: Set[FullQualifiedId],
+        level: Dict[Collection, List[int]],
+        result: Dict[Collection, List[int]],
+    ) -> None:
+        if fqid in seen:
+            return
+        seen.add(fqid)
+        level.setdefault(fqid.collection, []).append(fqid.id)
+        result.setdefault(fqid.collection, []).append(fqid.id)
+
+    def get_dependents(
+        self, field: RelationMixin, value: Any
+    ) -> Iterable[FullQualifiedId]:
+        """
+        Yields the objects of the given cascade field that refer to an object
+        with the given value of the reverse field.
+        """
+        if value is None:
+            return
+        for rel_id in value if isinstance(value, list) else [value]:
+            if field.generic_relation:
+                fqid = (
+                    rel_id
+                    if isinstance(rel_id, FullQualifiedId)
+                    else FullQualifiedId.parse(rel_id)
+                )
+                if fqid.collection == field.own_collection:
+                    yield fqid
+            else:
+                yield FullQualifiedId(field.own_collection, rel_id)
@@ -1,13 +1,11 @@
-import fastjsonschema  # type: ignore
-
 from ...models.committee import Committee
 from ...shared.permissions.committee import COMMITTEE_CAN_MANAGE
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..generics import CreateAction
 
-create_committee_schema = fastjsonschema.compile(
-    {
+create_committee_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "New committees schema",
         "description": "An array of new committees.",
@@ -1,9 +1,11 @@
-from typing import Any, List
+from typing import Any, Iterable, List
 
+from ..models.base import models_map
 from ..shared.exceptions import ActionException, PermissionDenied
 from ..shared.interfaces import Event, WriteRequestElement
 from ..shared.patterns import FullQualifiedField, FullQualifiedId
-from .base import Action, ActionPayload, BaseAction, DataSet
+from .base import Action, ActionPayload, BaseAction, DataSet, RelationFields
+from .cascade import CascadeHandler
 
 
 class PermissionMixin(BaseAction):
@@ -16,16 +18,47 @@ class PermissionMixin(BaseAction):
     permissions: List[str]
 
     def check_permission(self, permission_reference_id: int) -> None:
-        for manage_permission in self.permissions:
-            if self.permission.has_perm(
-                self.user_id, f"{permission_reference_id}/{manage_permission}"
+        self.check_permissions([permission_reference_id])
+
+    def check_permissions(self, permission_reference_ids: Iterable[int]) -> None:
+        """
+        Checks the permissions for all given reference ids using one bulk
+        request. Raises PermissionDenied for the first reference id the user
+        has none of the permissions for.
+        """
+        reference_ids = list(dict.fromkeys(permission_reference_ids))
+        decisions = self.permission.has_perms(
+            self.user_id,
+            [
+                f"{reference_id}/{manage_permission}"
+                for reference_id in reference_ids
+                for manage_permission in self.permissions
+            ],
+        )
+        for reference_id in reference_ids:
+            if not any(
+                decisions[f"{reference_id}/{manage_permission}"]
+                for manage_permission in self.permissions
             ):
-                break
-        else:
-            raise PermissionDenied(
-                f"User must have {' or '.join(self.permissions)} permission for "
-                f"{self.permission_reference} {permission_reference_id}."
+                raise PermissionDenied(
+                    f"User must have {' or '.join(self.permissions)} permission for "
+                    f"{self.permission_reference} {reference_id}."
+                )
+
+    def get_permission_reference_ids(self, payload: List[Any]) -> List[int]:
+        """
+        Fetches the permission_reference field of the current db instances of
+        the given payload.
+        """
+        reference_ids = []
+        for instance in payload:
+            db_instance, position = self.database.get(
+                fqid=FullQualifiedId(self.model.collection, id=instance["id"]),
+                mapped_fields=[self.permission_reference],
             )
+            self.set_min_position(position)
+            reference_ids.append(db_instance[self.permission_reference])
+        return reference_ids
 
 
 class CreateAction(PermissionMixin, Action):
@@ -37,23 +70,25 @@ class CreateAction(PermissionMixin, Action):
         """
         Prepares dataset from payload.
 
-        Just fetches new id, uses given instance and calculates (reverse)
+        Just fetches new ids, uses given instance and calculates (reverse)
         relations.
         """
         if not isinstance(payload, list):
             raise TypeError("ActionPayload for this action must be a list.")
 
-        data = []
-        for instance in payload:
-            # Check permission using permission_reference field.
-            self.check_permission(instance[self.permission_reference])
+        # Check permission using permission_reference field of all instances.
+        self.check_permissions(
+            instance[self.permission_reference] for instance in payload
+        )
 
+        instances = []
+        for instance in payload:
             # Update instance (by default this does nothing)
             instance = self.update_instance(instance)
 
             # Collect relation fields and also check structured_relation. Collect
             # also reverse relation fields.
-            relation_fields = []
+            relation_fields: RelationFields = []
             for field_name, field in self.model.get_relation_fields():
                 if field_name in instance.keys():
                     if field.structured_relation:
@@ -68,10 +103,23 @@ class CreateAction(PermissionMixin, Action):
                 if field_name in instance.keys():
                     relation_fields.append((field_name, field, True))
 
-            # Get new id.
-            id, position = self.database.getId(collection=self.model.collection)
-            self.set_min_position(position)
+            instances.append((instance, relation_fields))
+
+        # Get new ids for all instances at once.
+        ids, position = self.database.reserveIds(
+            collection=self.model.collection, amount=len(instances)
+        )
+        self.set_min_position(position)
+        prepared_instances = [
+            (id, instance, relation_fields)
+            for id, (instance, relation_fields) in zip(ids, instances)
+        ]
+
+        # Fetch all related objects of all instances at once.
+        self.prefetch_relations(prepared_instances, shortcut=True)
 
+        data = []
+        for id, instance, relation_fields in prepared_instances:
             # Get relations.
             relations = self.get_relations(
                 model=self.model,
@@ -120,24 +168,17 @@ class UpdateAction(PermissionMixin, Action):
         if not isinstance(payload, list):
             raise TypeError("ActionPayload for this action must be a list.")
 
-        data = []
-        for instance in payload:
-            # Fetch current db instance with permission_reference field.
-            db_instance, position = self.database.get(
-                fqid=FullQualifiedId(self.model.collection, id=instance["id"]),
-                mapped_fields=[self.permission_reference],
-            )
-            self.set_min_position(position)
-
-            # Check permission using permission_reference field.
-            self.check_permission(db_instance[self.permission_reference])
+        # Check permission using permission_reference field of all instances.
+        self.check_permissions(self.get_permission_reference_ids(payload))
 
+        prepared_instances = []
+        for instance in payload:
             # Update instance (by default this does nothing)
             instance = self.update_instance(instance)
 
             # Collect relation fields and also check structured_relation. Collect
             # also reverse relation fields.
-            relation_fields = []
+            relation_fields: RelationFields = []
             for field_name, field in self.model.get_relation_fields():
                 if field_name in instance.keys():
                     if field.structured_relation:
@@ -152,12 +193,16 @@ class UpdateAction(PermissionMixin, Action):
                 if field_name in instance.keys():
                     relation_fields.append((field_name, field, True))
 
+            prepared_instances.append((instance["id"], instance, relation_fields))
+
+        # Fetch all related objects of all instances at once.
+        self.prefetch_relations(prepared_instances)
+
+        data = []
+        for id, instance, relation_fields in prepared_instances:
             # Get relations.
             relations = self.get_relations(
-                model=self.model,
-                id=instance["id"],
-                obj=instance,
-                relation_fields=relation_fields,
+                model=self.model, id=id, obj=instance, relation_fields=relation_fields,
             )
 
             data.append({"instance": instance, "relations": relations})
@@ -199,49 +244,77 @@ class DeleteAction(PermissionMixin, Action):
         Prepares dataset from payload.
 
         Fetches current db instance to get the correct permission and also all
-        reverse relations. If protected reverse relations are not empty, raises
-        ActionException. Else uses the input and calculates (reverse) relations
-        and that should be removed because on_delete is "cascade".
+        reverse relations. All objects that refer to the given instances with
+        relation fields with on_delete "cascade" are deleted, too (see
+        CascadeHandler). If protected reverse relations of any deleted object
+        are not empty, raises ActionException. Else uses the input and
+        calculates (reverse) relations of all deleted objects that have to be
+        reset.
         """
         if not isinstance(payload, list):
             raise TypeError("ActionPayload for this action must be a list.")
 
-        data = []
-        for instance in payload:
-            # Fetch current db instance with permission_reference field
-            db_instance, position = self.database.get(
-                fqid=FullQualifiedId(self.model.collection, id=instance["id"]),
-                mapped_fields=[self.permission_reference],
-            )
-            self.set_min_position(position)
+        # Check permission using permission_reference field of all instances.
+        self.check_permissions(self.get_permission_reference_ids(payload))
 
-            # Check permission using permission_reference field.
-            self.check_permission(db_instance[self.permission_reference])
+        # Update instances (by default this does nothing)
+        instances = [self.update_instance(instance) for instance in payload]
 
-            # Update instance (by default this does nothing)
-            instance = self.update_instance(instance)
+        # Find all objects to be deleted.
+        cascade = CascadeHandler(self.database, self.set_min_position).get_cascade(
+            self.model.collection, [instance["id"] for instance in instances]
+        )
+        deleted = set(
+            FullQualifiedId(collection, id)
+            for collection, ids in cascade.items()
+            for id in ids
+        )
 
-            # Collect relation fields and reverse relation fields and also
-            # update instance and set all relation fields and reverse relation
-            # fields to None.
-            relation_fields = []
-            for field_name, field in self.model.get_relation_fields():
-                instance[field_name] = None
-                relation_fields.append((field_name, field, False))
+        # Prepare all deleted objects per model. The given instances come
+        # first.
+        groups = [(self.model, instances)]
+        root_ids = set(instance["id"] for instance in instances)
+        for collection, ids in cascade.items():
+            if collection == self.model.collection:
+                ids = [id for id in ids if id not in root_ids]
+            if ids:
+                groups.append((models_map[collection](), [{"id": id} for id in ids]))
 
-            for field_name, field in self.model.get_reverse_relations():
-                instance[field_name] = None
-                relation_fields.append((field_name, field, True))
+        data = []
+        for model, group_instances in groups:
+            prepared_instances = []
+            for instance in group_instances:
+                # Collect relation fields and reverse relation fields and also
+                # update instance and set all relation fields and reverse
+                # relation fields to None.
+                relation_fields: RelationFields = []
+                for field_name, field in model.get_relation_fields():
+                    instance[field_name] = None
+                    relation_fields.append((field_name, field, False))
 
-            # Get relations.
-            relations = self.get_relations(
-                model=self.model,
-                id=instance["id"],
-                obj=instance,
-                relation_fields=relation_fields,
-            )
+                for field_name, field in model.get_reverse_relations():
+                    instance[field_name] = None
+                    relation_fields.append((field_name, field, True))
 
-            data.append({"instance": instance, "relations": relations})
+                prepared_instances.append((instance["id"], instance, relation_fields))
+
+            # Fetch all related objects of all instances at once.
+            self.prefetch_relations(prepared_instances, model=model, deleted=deleted)
+
+            for id, instance, relation_fields in prepared_instances:
+                # Get relations.
+                relations = self.get_relations(
+                    model=model,
+                    id=id,
+                    obj=instance,
+                    relation_fields=relation_fields,
+                    deleted=deleted,
+                )
+
+                element = {"instance": instance, "relations": relations}
+                if model is not self.model:
+                    element["model"] = model
+                data.append(element)
 
         return {"position": self.position, "data": data}
 
@@ -252,10 +325,10 @@ class DeleteAction(PermissionMixin, Action):
         Creates a write request element for one instance of the current model.
 
         Just prepares a write request element with delete event for the given
-        instance.
+        instance. Cascaded objects of other models carry their model.
         """
-        # TODO: Find solution to delete relations with on_delete == "cascade"
-        fqid = FullQualifiedId(self.model.collection, element["instance"]["id"])
+        collection = element.get("model", self.model).collection
+        fqid = FullQualifiedId(collection, element["instance"]["id"])
         information = {fqid: ["Object deleted"]}
         event = Event(type="delete", fqid=fqid)
         return WriteRequestElement(
@@ -263,6 +336,6 @@ class DeleteAction(PermissionMixin, Action):
             information=information,
             user_id=self.user_id,
             locked_fields={
-                FullQualifiedField(self.model.collection, fqid.id, "deleted"): position
+                FullQualifiedField(collection, fqid.id, "deleted"): position
             },
         )
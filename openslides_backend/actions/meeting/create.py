@@ -1,13 +1,11 @@
-import fastjsonschema  # type: ignore
-
 from ...models.meeting import Meeting
 from ...shared.permissions.meeting import MEETING_CAN_MANAGE
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..generics import CreateAction
 
-create_meeting_schema = fastjsonschema.compile(
-    {
+create_meeting_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "New meetings schema",
         "description": "An array of new meetings.",
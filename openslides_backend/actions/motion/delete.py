@@ -1,13 +1,11 @@
-import fastjsonschema  # type: ignore
-
 from ...models.motion import Motion
 from ...shared.permissions.motion import MOTION_CAN_MANAGE
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..generics import DeleteAction
 
-delete_motion_schema = fastjsonschema.compile(
-    {
+delete_motion_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Delete motions schema",
         "description": "An array of motions to be deleted.",
@@ -1,16 +1,14 @@
 import time
 
-import fastjsonschema  # type: ignore
-
 from ...models.motion import Motion
 from ...shared.permissions.motion import MOTION_CAN_MANAGE, MOTION_CAN_MANAGE_METADATA
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..base import ActionPayload, DataSet
 from ..generics import UpdateAction
 
-update_motion_schema = fastjsonschema.compile(
-    {
+update_motion_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Update motions schema",
         "description": "An array of motions to be updated.",
@@ -47,8 +45,8 @@ class MotionUpdate(UpdateAction):
         return super().prepare_dataset(payload)
 
 
-update_motion_metadata_schema = fastjsonschema.compile(
-    {
+update_motion_metadata_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Update motions metadata schema",
         "description": "An array of motions to be updated.",
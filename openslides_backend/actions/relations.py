@@ -45,6 +45,8 @@ class RelationsHandler:
         is_reverse: bool = False,
         only_add: bool = False,
         only_remove: bool = False,
+        accumulated_relations: Relations = None,
+        deleted: Set[FullQualifiedId] = None,
     ) -> None:
         self.database = database
         self.set_min_position = set_min_position
@@ -60,6 +62,10 @@ class RelationsHandler:
             )
         self.only_add = only_add
         self.only_remove = only_remove
+        self.accumulated_relations = (
+            accumulated_relations if accumulated_relations is not None else {}
+        )
+        self.deleted = deleted if deleted is not None else set()
         self.type = self.field.type
         if self.type == "1:m" and self.is_reverse:
             # Switch 1:m to m:1 in reverse case.
@@ -69,27 +75,27 @@ class RelationsHandler:
         if self.field.generic_relation and self.is_reverse and self.type == "m:n":
             raise NotImplementedError
 
+    @property
+    def target(self) -> Collection:
+        return self.field.own_collection if self.is_reverse else self.field.to
+
     def perform(self) -> Relations:
-        rel_ids = self.prepare_new_relation_ids()
         related_name = self.get_related_name()
-        target = self.field.own_collection if self.is_reverse else self.field.to
-
-        add: Union[Set[int], Set[FullQualifiedId]]
-        remove: Union[Set[int], Set[FullQualifiedId]]
+        target = self.target
+        add, remove = self.get_diffs()
 
+        rels: Union[Dict[int, Any], Dict[FullQualifiedId, Any]]
         if self.field.generic_relation and self.is_reverse:
-            rel_ids = cast(List[FullQualifiedId], rel_ids)
-            add, remove = self.relation_diffs_fqid(rel_ids)
-            rels = {}
+            fqid_rels = {}
             for related_model_fqid in list(add | remove):
+                assert isinstance(related_model_fqid, FullQualifiedId)
                 related_model, position = self.database.get(
                     related_model_fqid, mapped_fields=[related_name]
                 )
                 self.set_min_position(position)
-                rels[related_model_fqid] = related_model
+                fqid_rels[related_model_fqid] = related_model
+            rels = fqid_rels
         else:
-            rel_ids = cast(List[int], rel_ids)
-            add, remove = self.relation_diffs(rel_ids)
             rels, position = self.database.getMany(
                 target, list(add | remove), mapped_fields=[related_name],
             )
@@ -99,6 +105,57 @@ class RelationsHandler:
             return self.prepare_result_to_fqid(add, remove, rels, target, related_name)
         return self.prepare_result_to_id(add, remove, rels, target, related_name)
 
+    def get_related_fqfields(self) -> List[FullQualifiedField]:
+        """
+        Returns all fqfields of related objects that perform() is going to
+        read. Use this to fetch them in advance.
+        """
+        related_name = self.get_related_name()
+        add, remove = self.get_diffs()
+        fqfields = []
+        for rel_id in add | remove:
+            if isinstance(rel_id, FullQualifiedId):
+                fqfields.append(
+                    FullQualifiedField(rel_id.collection, rel_id.id, related_name)
+                )
+            else:
+                assert isinstance(rel_id, int)
+                fqfields.append(FullQualifiedField(self.target, rel_id, related_name))
+        return fqfields
+
+    def get_diffs(
+        self,
+    ) -> Tuple[
+        Union[Set[int], Set[FullQualifiedId]], Union[Set[int], Set[FullQualifiedId]]
+    ]:
+        """
+        Returns the add set and the remove set for this relation field.
+        Related objects that are deleted in the same request are never
+        changed so they are not part of the remove set.
+        """
+        rel_ids = self.prepare_new_relation_ids()
+        add: Union[Set[int], Set[FullQualifiedId]]
+        remove: Union[Set[int], Set[FullQualifiedId]]
+        if self.field.generic_relation and self.is_reverse:
+            add, remove = self.relation_diffs_fqid(cast(List[FullQualifiedId], rel_ids))
+        else:
+            add, remove = self.relation_diffs(cast(List[int], rel_ids))
+        if self.deleted:
+            remove = cast(
+                Union[Set[int], Set[FullQualifiedId]],
+                {
+                    rel_id
+                    for rel_id in remove
+                    if (
+                        rel_id
+                        if isinstance(rel_id, FullQualifiedId)
+                        else FullQualifiedId(self.target, rel_id)
+                    )
+                    not in self.deleted
+                },
+            )
+        return add, remove
+
     def prepare_new_relation_ids(self) -> Union[List[int], List[FullQualifiedId]]:
         value = self.obj.get(self.field_name)
         if value is None:
@@ -223,12 +280,9 @@ class RelationsHandler:
                 current_ids = set(current_obj.get(self.field_name, []))
 
             # Transform str to FullQualifiedId
-            transformed_current_ids = set()
-            for current_id in current_ids:
-                collection, id = current_id.split("/")
-                transformed_current_ids.add(
-                    FullQualifiedId(Collection(collection), int(id))
-                )
+            transformed_current_ids = set(
+                FullQualifiedId.parse(current_id) for current_id in current_ids
+            )
 
             # Calculate add set and remove set
             new_ids = set(rel_ids)
@@ -237,6 +291,18 @@ class RelationsHandler:
 
         return add, remove
 
+    def get_current_value(
+        self, fqfield: FullQualifiedField, rel: Dict[str, Any], related_name: str
+    ) -> Any:
+        """
+        Returns the current value of the related field. If the field was already
+        changed by another instance of the same action, the accumulated value is
+        used instead of the database value.
+        """
+        if fqfield in self.accumulated_relations:
+            return self.accumulated_relations[fqfield]["value"]
+        return rel.get(related_name)
+
     def prepare_result_to_id(
         self,
         add: Union[Set[int], Set[FullQualifiedId]],
@@ -247,10 +313,16 @@ class RelationsHandler:
     ) -> Relations:
         relations: Relations = {}
         for rel_id, rel in sorted(rels.items(), key=lambda item: str(item[0])):
+            if isinstance(rel_id, int):
+                fqfield = FullQualifiedField(target, rel_id, related_name)
+            else:
+                assert isinstance(rel_id, FullQualifiedId)
+                fqfield = FullQualifiedField(target, rel_id.id, related_name)
+            current_value = self.get_current_value(fqfield, rel, related_name)
             new_value: Optional[Union[int, List[int]]]
             if rel_id in add:
                 if self.field.type in ("1:1", "m:1"):
-                    if rel.get(related_name) is None:
+                    if current_value is None:
                         new_value = self.id
                     else:
                         raise ActionException(
@@ -260,7 +332,7 @@ class RelationsHandler:
                 else:
                     assert self.field.type in ("1:m", "m:n")
                     value_to_be_added = self.id
-                    new_value = rel.get(related_name, []) + [value_to_be_added]
+                    new_value = (current_value or []) + [value_to_be_added]
                 rel_element = RelationsElement(type="add", value=new_value)
             else:
                 assert rel_id in remove
@@ -277,15 +349,10 @@ class RelationsHandler:
                 else:
                     assert self.field.type in ("1:m", "m:n")
                     value_to_be_removed = self.id
-                    new_value = rel[related_name]
-                    assert isinstance(new_value, list)
+                    assert isinstance(current_value, list)
+                    new_value = list(current_value)
                     new_value.remove(value_to_be_removed)
                 rel_element = RelationsElement(type="remove", value=new_value)
-            if isinstance(rel_id, int):
-                fqfield = FullQualifiedField(target, rel_id, related_name)
-            else:
-                assert isinstance(rel_id, FullQualifiedId)
-                fqfield = FullQualifiedField(target, rel_id.id, related_name)
             relations[fqfield] = rel_element
         return relations
 
@@ -299,10 +366,16 @@ class RelationsHandler:
     ) -> Relations:
         relations: Relations = {}
         for rel_id, rel in sorted(rels.items(), key=lambda item: item[0]):
+            if isinstance(rel_id, int):
+                fqfield = FullQualifiedField(target, rel_id, related_name)
+            else:
+                assert isinstance(rel_id, FullQualifiedId)
+                fqfield = FullQualifiedField(target, rel_id.id, related_name)
+            current_value = self.get_current_value(fqfield, rel, related_name)
             new_value: Optional[Union[FullQualifiedId, List[FullQualifiedId]]]
             if rel_id in add:
                 if self.field.type in ("1:1", "m:1"):
-                    if rel.get(related_name) is None:
+                    if current_value is None:
                         new_value = FullQualifiedId(
                             collection=self.field.own_collection, id=self.id
                         )
@@ -316,7 +389,7 @@ class RelationsHandler:
                     value_to_be_added = FullQualifiedId(
                         collection=self.field.own_collection, id=self.id
                     )
-                    new_value = rel.get(related_name, []) + [value_to_be_added]
+                    new_value = (current_value or []) + [value_to_be_added]
                 rel_element = RelationsElement(type="add", value=new_value)
             else:
                 assert rel_id in remove
@@ -335,14 +408,9 @@ class RelationsHandler:
                     value_to_be_removed = FullQualifiedId(
                         collection=self.field.own_collection, id=self.id
                     )
-                    new_value = rel[related_name]
-                    assert isinstance(new_value, list)
+                    assert isinstance(current_value, list)
+                    new_value = list(current_value)
                     new_value.remove(value_to_be_removed)
                 rel_element = RelationsElement(type="remove", value=new_value)
-            if isinstance(rel_id, int):
-                fqfield = FullQualifiedField(target, rel_id, related_name)
-            else:
-                assert isinstance(rel_id, FullQualifiedId)
-                fqfield = FullQualifiedField(target, rel_id.id, related_name)
             relations[fqfield] = rel_element
         return relations
@@ -0,0 +1,239 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastjsonschema import JsonSchemaException  # type: ignore
+
+from ..models.base import Model
+from ..shared.exceptions import ActionException
+from ..shared.filters import FilterOperator
+from ..shared.interfaces import Event, WriteRequestElement
+from ..shared.patterns import FullQualifiedField, FullQualifiedId
+from ..shared.schema import LazySchema, compile_schema, schema_version
+from .base import BaseAction, DataSet
+
+validate_sort_node = compile_schema(
+    {
+        "$schema": schema_version,
+        "title": "Sort node schema",
+        "description": (
+            "A node inside a sort tree. The children are validated one by one "
+            "by TreeSortHandler."
+        ),
+        "type": "object",
+        "properties": {
+            "id": {
+                "description": "The id of the instance.",
+                "type": "integer",
+                "minimum": 1,
+            },
+            "children": {"type": "array", "items": {"type": "object"}, "minItems": 1},
+        },
+        "required": ["id"],
+        "additionalProperties": False,
+    }
+)
+
+
+def create_sort_schema(model: Model, title: str, description: str) -> LazySchema:
+    """
+    Returns the schema for sort actions of the given model. The payload
+    contains the meeting id and the root nodes of the sort tree. The nodes
+    themselves are validated by TreeSortHandler while walking the tree, so
+    that deep trees do not hit the recursion limit.
+    """
+    return compile_schema(
+        lambda: {
+            "$schema": schema_version,
+            "title": title,
+            "description": "Meeting id and an array of nodes to be sorted.",
+            "type": "object",
+            "properties": {
+                "meeting_id": model.get_schema("meeting_id"),
+                "nodes": {
+                    "description": description,
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "minItems": 1,
+                },
+            },
+            "required": ["meeting_id", "nodes"],
+            "additionalProperties": False,
+        }
+    )
+
+
+class TreeSortHandler:
+    """
+    Assigns weights, parent ids and children ids to all nodes of a sort tree.
+
+    The tree is walked once in preorder using an explicit stack so that deep
+    trees do not hit the recursion limit. Every node is validated when it is
+    visited. The given nodes are never changed.
+    The weight values are 2, 4, 6, 8,... to "make space" between entries. This
+    is some work around for the agenda: If one creates a content object with an
+    item and gives the item's parent, than the weight can be set to the
+    parent's one +1.
+    """
+
+    # Number of missing ids shown in the error message.
+    max_reported_ids = 10
+
+    def __init__(
+        self, weight_key: str, parent_id_key: str, children_ids_key: str
+    ) -> None:
+        self.weight_key = weight_key
+        self.parent_id_key = parent_id_key
+        self.children_ids_key = children_ids_key
+
+    def sort(
+        self, nodes: List[Dict[str, Any]], all_ids: Set[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Returns the sort fields of all nodes in preorder. Every id of all_ids
+        has to appear exactly once in the tree.
+        """
+        result: Dict[int, Dict[str, Any]] = {}
+        stack: List[Tuple[Dict[str, Any], Optional[int]]] = [
+            (node, None) for node in reversed(nodes)
+        ]
+        weight = 0
+        while stack:
+            node, parent_id = stack.pop()
+            try:
+                validate_sort_node(node)
+            except JsonSchemaException as exception:
+                raise ActionException(
+                    f"Invalid node in sort tree below {parent_id}: "
+                    f"{exception.message}"
+                )
+            id = node["id"]
+            if id in result:
+                raise ActionException(f"Duplicate id in sort tree: {id}")
+            if id not in all_ids:
+                raise ActionException(f"Id in sort tree does not exist: {id}")
+            weight += 2
+            result[id] = {
+                self.weight_key: weight,
+                self.parent_id_key: parent_id,
+                self.children_ids_key: [],
+            }
+            if parent_id is not None:
+                result[parent_id][self.children_ids_key].append(id)
+            children = node.get("children")
+            if children:
+                stack.extend((child, id) for child in reversed(children))
+
+        if len(result) != len(all_ids):
+            missing_ids = sorted(all_ids - result.keys())
+            reported_ids = ", ".join(
+                str(id) for id in missing_ids[: self.max_reported_ids]
+            )
+            if len(missing_ids) > self.max_reported_ids:
+                reported_ids += ", ..."
+            raise ActionException(
+                f"Did not receive {len(all_ids)} ids, got {len(result)}. "
+                f"Missing ids: {reported_ids}"
+            )
+        return result
+
+    def get_changes(
+        self,
+        sort_fields: Dict[int, Dict[str, Any]],
+        db_instances: Dict[int, Dict[str, Any]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Returns only the nodes whose sort fields differ from the given database
+        instances and only the changed fields. Unset children are empty.
+        """
+        changes: Dict[int, Dict[str, Any]] = {}
+        for id, fields in sort_fields.items():
+            db_instance = db_instances.get(id, {})
+            changed_fields = {}
+            for key, value in fields.items():
+                current_value = db_instance.get(key)
+                if current_value is None and key == self.children_ids_key:
+                    current_value = []
+                if current_value != value:
+                    changed_fields[key] = value
+            if changed_fields:
+                changes[id] = changed_fields
+        return changes
+
+
+class TreeSortMixin(BaseAction):
+    """
+    Provides an action mixin for sorting a model tree. Set the keys of the
+    sort fields of the model as class attributes.
+    """
+
+    model: Model
+    weight_key = "weight"
+    parent_id_key = "parent_id"
+    children_ids_key = "child_ids"
+
+    def sort_tree(self, nodes: List[Dict[str, Any]], meeting_id: int) -> DataSet:
+        """
+        Sorts all model objects represented in a tree of ids. The request
+        data should be a list (the root) of all main models. Each node is a dict
+        with an id and optional children. Every id has to be given.
+
+        All nodes are returned in preorder. Nodes whose sort fields do not
+        change have no fields. The other nodes only contain the changed fields.
+        """
+        # Get all ids to verify that the user sends all ids. Get also the
+        # current sort fields to find the changed ones.
+        filter = FilterOperator(field="meeting_id", value=meeting_id, operator="==")
+        db_instances, position = self.database.filter(
+            collection=self.model.collection,
+            filter=filter,
+            meeting_id=meeting_id,
+            mapped_fields=[self.weight_key, self.parent_id_key, self.children_ids_key],
+        )
+        self.set_min_position(position)
+
+        handler = TreeSortHandler(
+            self.weight_key, self.parent_id_key, self.children_ids_key
+        )
+        sort_fields = handler.sort(nodes, set(db_instances.keys()))
+        changes = handler.get_changes(sort_fields, db_instances)
+        return {
+            "position": self.position,
+            "data": {id: changes.get(id, {}) for id in sort_fields},
+        }
+
+    def create_write_request_elements(
+        self, dataset: DataSet
+    ) -> Iterable[WriteRequestElement]:
+        """
+        Creates one write request element with update events for all changed
+        nodes. The sort fields of all nodes are locked because the changes
+        were computed from them. Nothing is written if no node changes.
+        """
+        events = []
+        information = {}
+        locked_fields = {}
+        # TODO: Instances created in the meeting after the filter request are
+        # not part of the tree and locking the fields of the sorted instances
+        # does not detect them. Lock the reverse relation of meeting_id on the
+        # meeting (e. g. meeting/<id>/motion_ids) too. The dataset does not
+        # contain the meeting id yet.
+        for id, instance in dataset["data"].items():
+            for field in (
+                "deleted",
+                self.weight_key,
+                self.parent_id_key,
+                self.children_ids_key,
+            ):
+                locked_fields[
+                    FullQualifiedField(self.model.collection, id, field)
+                ] = dataset["position"]
+            if instance:
+                fqid = FullQualifiedId(self.model.collection, id)
+                events.append(Event(type="update", fqid=fqid, fields=instance))
+                information[fqid] = ["Object sorted"]
+        if events:
+            yield WriteRequestElement(
+                events=events,
+                information=information,
+                user_id=self.user_id,
+                locked_fields=locked_fields,
+            )
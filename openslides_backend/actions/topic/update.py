@@ -1,13 +1,11 @@
-import fastjsonschema  # type: ignore
-
 from ...models.topic import Topic
 from ...shared.permissions.topic import TOPIC_CAN_MANAGE
-from ...shared.schema import schema_version
+from ...shared.schema import compile_schema, schema_version
 from ..actions import register_action
 from ..generics import UpdateAction
 
-update_topic_schema = fastjsonschema.compile(
-    {
+update_topic_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Update topics schema",
         "description": "An array of topics to be updated.",
@@ -9,6 +9,18 @@ Environment = TypedDict(
         "permission_url": str,
         "database_url": str,
         "event_store_url": str,
+        "http_pool_size": int,
+        "http_timeout": float,
+        "http_retries": int,
+        "auth_cache_size": int,
+        "auth_cache_ttl": float,
+        "worker_class": str,
+        "workers": int,
+        "threads": int,
+        "keepalive": int,
+        "worker_timeout": int,
+        "presenter_workers": int,
+        "presenter_timeout": float,
     },
 )
 
@@ -18,6 +30,18 @@ DEFAULT_AUTHENTICATION_PORT = 9000
 DEFAULT_PERMISSION_PORT = 9001
 DEFAULT_DATABASE_PORT = 9002
 DEFAULT_EVENT_STORE_PORT = 9003
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_TIMEOUT = 10.0
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_AUTH_CACHE_SIZE = 1000
+DEFAULT_AUTH_CACHE_TTL = 30.0
+DEFAULT_WORKER_CLASS = "sync"
+DEFAULT_WORKERS = 1
+DEFAULT_THREADS = 1
+DEFAULT_KEEPALIVE = 2
+DEFAULT_WORKER_TIMEOUT = 30
+DEFAULT_PRESENTER_WORKERS = 4
+DEFAULT_PRESENTER_TIMEOUT = 10.0
 
 
 def get_environment() -> Environment:
@@ -41,12 +65,58 @@ def get_environment() -> Environment:
         "OPENSLIDES_BACKEND_EVENT_STORE_URL",
         get_fallback_url(DEFAULT_HOST, DEFAULT_EVENT_STORE_PORT),
     )
+    http_pool_size = int(
+        os.environ.get("OPENSLIDES_BACKEND_HTTP_POOL_SIZE", DEFAULT_HTTP_POOL_SIZE)
+    )
+    http_timeout = float(
+        os.environ.get("OPENSLIDES_BACKEND_HTTP_TIMEOUT", DEFAULT_HTTP_TIMEOUT)
+    )
+    http_retries = int(
+        os.environ.get("OPENSLIDES_BACKEND_HTTP_RETRIES", DEFAULT_HTTP_RETRIES)
+    )
+    auth_cache_size = int(
+        os.environ.get("OPENSLIDES_BACKEND_AUTH_CACHE_SIZE", DEFAULT_AUTH_CACHE_SIZE)
+    )
+    auth_cache_ttl = float(
+        os.environ.get("OPENSLIDES_BACKEND_AUTH_CACHE_TTL", DEFAULT_AUTH_CACHE_TTL)
+    )
+    worker_class = os.environ.get(
+        "OPENSLIDES_BACKEND_WORKER_CLASS", DEFAULT_WORKER_CLASS
+    )
+    workers = int(os.environ.get("OPENSLIDES_BACKEND_WORKERS", DEFAULT_WORKERS))
+    threads = int(os.environ.get("OPENSLIDES_BACKEND_THREADS", DEFAULT_THREADS))
+    keepalive = int(os.environ.get("OPENSLIDES_BACKEND_KEEPALIVE", DEFAULT_KEEPALIVE))
+    worker_timeout = int(
+        os.environ.get("OPENSLIDES_BACKEND_WORKER_TIMEOUT", DEFAULT_WORKER_TIMEOUT)
+    )
+    presenter_workers = int(
+        os.environ.get(
+            "OPENSLIDES_BACKEND_PRESENTER_WORKERS", DEFAULT_PRESENTER_WORKERS
+        )
+    )
+    presenter_timeout = float(
+        os.environ.get(
+            "OPENSLIDES_BACKEND_PRESENTER_TIMEOUT", DEFAULT_PRESENTER_TIMEOUT
+        )
+    )
 
     return Environment(
         authentication_url=authentication_url,
         permission_url=permission_url,
         database_url=database_url,
         event_store_url=event_store_url,
+        http_pool_size=http_pool_size,
+        http_timeout=http_timeout,
+        http_retries=http_retries,
+        auth_cache_size=auth_cache_size,
+        auth_cache_ttl=auth_cache_ttl,
+        worker_class=worker_class,
+        workers=workers,
+        threads=threads,
+        keepalive=keepalive,
+        worker_timeout=worker_timeout,
+        presenter_workers=presenter_workers,
+        presenter_timeout=presenter_timeout,
     )
 
 
@@ -1,24 +1,29 @@
 import re
-from typing import Any, Iterable, Union
+from typing import Any, Iterable, Iterator, Optional, Union
 
-import simplejson as json
 from werkzeug.exceptions import BadRequest, Forbidden, HTTPException, MethodNotAllowed
 from werkzeug.wrappers import Request as WerkzeugRequest
 from werkzeug.wrappers import Response
 from werkzeug.wrappers.json import JSONMixin  # type: ignore
 
+from ..shared import codec
+from ..shared.cache import TTLCache
 from ..shared.exceptions import ViewException
 from ..shared.interfaces import StartResponse, WSGIEnvironment
 
 health_route = re.compile("^/health$")
 
+RESPONSE_CACHE_SIZE = 100
+RESPONSE_CACHE_TTL = 60.0  # Seconds
+
 
 class Request(JSONMixin, WerkzeugRequest):
     """
-    Customized request object. We use the JSONMixin here.
+    Customized request object. We use the JSONMixin here with our own JSON
+    codec.
     """
 
-    pass
+    json_module = codec.JSONModule
 
 
 class OpenSlidesBackendWSGIApplication:
@@ -34,6 +39,10 @@ class OpenSlidesBackendWSGIApplication:
         self.logger.debug("Initialize OpenSlides Backend WSGI application.")
         self.view = view
         self.services = services
+        # Serialized response bodies of this worker keyed by their ETag.
+        self.response_cache = TTLCache(
+            max_size=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL
+        )
 
     def dispatch_request(self, request: Request) -> Union[Response, HTTPException]:
         """
@@ -65,10 +74,18 @@ class OpenSlidesBackendWSGIApplication:
             return exception
         self.logger.debug(f"Request contains JSON: {request_body}.")
 
-        # Dispatch view and return response.
+        # Dispatch view and return response. If the view provides a cache key
+        # use it as ETag and answer with 304 or with a cached body if possible.
         view_instance = self.view(self.logging, self.services)
         try:
-            response_body = view_instance.dispatch(request_body, request.headers)
+            etag = view_instance.get_cache_key(request_body, request.headers)
+            if etag is not None:
+                cached_response = self.get_cached_response(request, etag)
+                if cached_response is not None:
+                    return cached_response
+            response_body = view_instance.dispatch(
+                request_body, request.headers, request.path
+            )
         except ViewException as exception:
             if exception.status_code == 400:
                 return BadRequest(exception.message)
@@ -84,14 +101,45 @@ class OpenSlidesBackendWSGIApplication:
         self.logger.debug(
             f"All done. Application sends HTTP 200 with body {response_body}."
         )
-        return Response(json.dumps(response_body), content_type="application/json")
+        if etag is None and view_instance.stream_response:
+            # Send the body in chunks (chunked transfer encoding) so that the
+            # whole serialized body is never held in memory.
+            return Response(
+                iter_json(response_body),
+                content_type="application/json",
+                direct_passthrough=True,
+            )
+        serialized_body = codec.dumpb(response_body)
+        response = Response(serialized_body, content_type="application/json")
+        if etag is not None:
+            self.response_cache.set(etag, serialized_body)
+            response.set_etag(etag)
+        return response
+
+    def get_cached_response(self, request: Request, etag: str) -> Optional[Response]:
+        """
+        Returns a response with status 304 if the client already has the
+        current body or a response with the cached body. Returns None if the
+        body has to be built.
+        """
+        if request.if_none_match.contains(etag):
+            self.logger.debug("Client has current body. Send HTTP 304.")
+            response = Response(status=304)
+        else:
+            serialized_body = self.response_cache.get(etag)
+            if serialized_body is None:
+                return None
+            self.logger.debug("Send cached body.")
+            response = Response(serialized_body, content_type="application/json")
+        response.set_etag(etag)
+        return response
 
     def health_info(self, request: Request) -> Union[Response, HTTPException]:
         """
         Route to provide health data of this service.
         """
         return Response(
-            json.dumps({"healthinfo": {"status": "dummy status"}}),
+            codec.dumpb({"healthinfo": {"status": "dummy status"}}),
             content_type="application/json",
         )
 
@@ -114,3 +162,19 @@ class OpenSlidesBackendWSGIApplication:
         custom middlewares to the application.
         """
         return self.wsgi_application(environ, start_response)
+
+
+def iter_json(body: Any) -> Iterator[bytes]:
+    """
+    Encodes the body as JSON chunk by chunk. Lists are encoded element by
+    element, e. g. one chunk per presenter result.
+    """
+    if not isinstance(body, list):
+        yield codec.dumpb(body)
+        return
+    yield b"["
+    for index, element in enumerate(body):
+        if index:
+            yield b","
+        yield codec.dumpb(element)
+    yield b"]"
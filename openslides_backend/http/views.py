@@ -1,3 +1,5 @@
+from typing import Optional
+
 from ..actions import Actions
 from ..actions.actions import ActionsHandler
 from ..actions.actions import Payload as ActionsPayload
@@ -27,20 +29,36 @@ class BaseView:
     During initialization we bind the dependencies to the instance.
     """
 
+    # Use True to send the response body in chunks.
+    stream_response = False
+
     def __init__(self, logging: LoggingModule, services: Services) -> None:
         self.services = services
         self.logging = logging
         self.logger = logging.getLogger(__name__)
+        self.user_id: Optional[int] = None
+
+    def get_cache_key(self, body: RequestBody, headers: Headers) -> Optional[str]:
+        """
+        Returns a key that changes whenever the response for this request
+        changes. It is used as ETag. None means that the response must not be
+        cached.
+        """
+        return None
 
     def get_user_id_from_headers(self, headers: Headers) -> int:
         """
-        Returns user id from authentication service using HTTP headers.
+        Returns user id from authentication service using HTTP headers. The
+        view asks the service only once per request.
         """
+        if self.user_id is not None:
+            return self.user_id
         try:
             user_id = self.services.authentication().get_user(headers)
         except AuthenticationException as exception:
             raise ViewException(exception.message, status_code=400)
         self.logger.debug(f"User id is {user_id}.")
+        self.user_id = user_id
         return user_id
 
 
@@ -52,9 +70,15 @@ class ActionsView(BaseView):
 
     method = "POST"
 
-    def dispatch(self, body: RequestBody, headers: Headers) -> ResponseBody:
+    # Path of the endpoint that handles all actions of the payload separately.
+    handle_separately_path = "/handle_separately"
+
+    def dispatch(
+        self, body: RequestBody, headers: Headers, path: str = "/"
+    ) -> ResponseBody:
         """
-        Dispatches request to the viewpoint.
+        Dispatches request to the viewpoint. Requests to the handle_separately
+        path are not atomic, see ActionsHandler.handle_request.
         """
         self.logger.debug("Start dispatching actions request.")
 
@@ -67,7 +91,9 @@ class ActionsView(BaseView):
         # Handle request.
         handler: Actions = ActionsHandler(logging=self.logging, services=self.services)
         try:
-            result = handler.handle_request(payload, user_id)
+            result = handler.handle_request(
+                payload, user_id, atomic=path != self.handle_separately_path
+            )
         except ActionException as exception:
             raise ViewException(exception.message, status_code=400)
         except PermissionDenied as exception:
@@ -84,8 +110,16 @@ class PresenterView(BaseView):
     """
 
     method = "GET"
+    stream_response = True
+
+    def get_cache_key(self, body: RequestBody, headers: Headers) -> Optional[str]:
+        user_id = self.get_user_id_from_headers(headers)
+        handler = PresenterHandler(logging=self.logging, services=self.services)
+        return handler.get_cache_key(body, user_id)
 
-    def dispatch(self, body: RequestBody, headers: Headers) -> ResponseBody:
+    def dispatch(
+        self, body: RequestBody, headers: Headers, path: str = "/"
+    ) -> ResponseBody:
         """
         Dispatches request to the viewpoint.
         """
@@ -1,23 +1,30 @@
+import gc
 import logging
 import multiprocessing
 import os
 import signal
 import sys
 import time
-from typing import Any, Type
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Type
 
 from dependency_injector import containers, providers  # type: ignore
 from gunicorn.app.base import BaseApplication  # type: ignore
 
 import openslides_backend.services.database as database
 
+from . import STARTUP_TIME
+from .actions.actions import actions_map
 from .environment import get_environment
 from .http.application import OpenSlidesBackendWSGIApplication
 from .http.views import ActionsView, PresenterView
+from .presenter.presenter import PresenterHandler, presenters_map
 from .services.authentication import AuthenticationHTTPAdapter
 from .services.event_store import EventStoreHTTPAdapter
 from .services.permission import PermissionHTTPAdapter
+from .services.session import HTTPSessionPool
 from .shared.interfaces import View, WSGIApplication
+from .shared.schema import prewarm_schemas
 
 # ATTENTION: We use the Python builtin logging module. To change this use
 # something like "import custom_logging as logging".
@@ -30,13 +37,25 @@ class OpenSlidesBackendServices(containers.DeclarativeContainer):
 
     config = providers.Configuration("config")
     logging = providers.Object(0)
+    session = providers.Singleton(
+        HTTPSessionPool, config.http_pool_size, config.http_timeout, config.http_retries
+    )
     authentication = providers.Singleton(
-        AuthenticationHTTPAdapter, config.authentication_url, logging
+        AuthenticationHTTPAdapter,
+        config.authentication_url,
+        logging,
+        session,
+        config.auth_cache_size,
+        config.auth_cache_ttl,
     )
     permission = providers.Singleton(PermissionHTTPAdapter, config.permission_url)
-    engine = providers.Singleton(database.HTTPEngine, config.database_url, logging)
+    engine = providers.Singleton(
+        database.HTTPEngine, config.database_url, logging, session
+    )
     database = providers.Singleton(database.Adapter, engine, logging)
-    event_store = providers.Singleton(EventStoreHTTPAdapter, config.event_store_url)
+    event_store = providers.Singleton(
+        EventStoreHTTPAdapter, config.event_store_url, logging, session
+    )
 
 
 class OpenSlidesBackendWSGI(containers.DeclarativeContainer):
@@ -73,6 +92,9 @@ def create_wsgi_application(view_name: str) -> WSGIApplication:
         view = ActionsView
     elif view_name == "PresenterView":
         view = PresenterView
+        # The presenter thread pool is created with this size on first use.
+        PresenterHandler.max_workers = environment["presenter_workers"]
+        PresenterHandler.timeout = environment["presenter_timeout"]
     else:
         raise ValueError(f"The value of view_name must not be {view_name}.")
 
@@ -83,6 +105,11 @@ def create_wsgi_application(view_name: str) -> WSGIApplication:
             "permission_url": environment["permission_url"],
             "database_url": environment["database_url"],
             "event_store_url": environment["event_store_url"],
+            "http_pool_size": environment["http_pool_size"],
+            "http_timeout": environment["http_timeout"],
+            "http_retries": environment["http_retries"],
+            "auth_cache_size": environment["auth_cache_size"],
+            "auth_cache_ttl": environment["auth_cache_ttl"],
         },
         logging=logging,
     )
@@ -119,24 +146,84 @@ class OpenSlidesBackendGunicornApplication(BaseApplication):  # pragma: no cover
                 f"View name has to be ActionsView or PresenterView, not {self.view_name}."
             )
         logger.debug(f"Create gunicorn application for {self.view_name}.")
+        # In production mode the master process imports and prepares
+        # everything and builds the application before forking workers.
+        self.preload = not os.environ.get("OPENSLIDES_BACKEND_DEBUG")
+        self.startup_timings: Dict[str, float] = {
+            "imports": time.perf_counter() - STARTUP_TIME
+        }
         super().__init__(*args, **kwargs)
 
     def load_config(self) -> None:
         loglevel = "debug" if os.environ.get("OPENSLIDES_BACKEND_DEBUG") else "info"
+        environment = get_environment()
+        if environment["worker_class"] == "gevent":
+            # Gevent workers patch the standard library after the fork. Modules
+            # imported in the master would keep unpatched references.
+            self.preload = False
         options = {
             "bind": f"0.0.0.0:{self.ports[self.view_name]}",
             "worker_tmp_dir": "/dev/shm",  # See https://pythonspeed.com/articles/gunicorn-in-docker/
-            "timeout": int(os.environ.get("OPENSLIDES_BACKEND_WORKER_TIMEOUT", "30")),
+            "worker_class": environment["worker_class"],
+            "workers": environment["workers"],
+            "threads": environment["threads"],
+            "keepalive": environment["keepalive"],
+            "timeout": environment["worker_timeout"],
             "loglevel": loglevel,
             # TODO: This does not work. Changes will reload the application, but code changed do not reflect.
             "reload": loglevel == "debug",
             "reload_engine": "auto",  # This is the default however.
+            "preload_app": self.preload,
+            "on_starting": self.on_starting,
+            "when_ready": self.when_ready,
         }
         for key, value in options.items():
             self.cfg.set(key, value)
 
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """
+        Measures the duration of the given startup phase.
+        """
+        start = time.perf_counter()
+        yield
+        self.startup_timings[phase] = time.perf_counter() - start
+
+    def on_starting(self, server: Any) -> None:
+        """
+        Gunicorn hook that runs in the master process before forking workers.
+        Prepares everything that can be shared by all workers.
+        """
+        with self.measure("schemas"):
+            prewarm_schemas()
+        with self.measure("models"):
+            for action in actions_map.values():
+                action.model.get_fields()
+        with self.measure("presenters"):
+            for presenter in presenters_map.values():
+                presenter().cache_key
+
+    def when_ready(self, server: Any) -> None:
+        """
+        Gunicorn hook that runs in the master process right before forking
+        workers. Moves all objects into the permanent generation of the
+        garbage collector so that it does not touch (and copy) their memory
+        pages in the workers.
+        """
+        with self.measure("gc_freeze"):
+            gc.collect()
+            gc.freeze()
+        server.log.info(
+            "Startup phases: "
+            + ", ".join(
+                f"{phase} {duration:.3f}s"
+                for phase, duration in self.startup_timings.items()
+            )
+        )
+
     def load(self) -> WSGIApplication:
-        return create_wsgi_application(self.view_name)
+        with self.measure("application"):
+            return create_wsgi_application(self.view_name)
 
 
 def start_actions_server() -> None:  # pragma: no cover
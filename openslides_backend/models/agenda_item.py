@@ -20,6 +20,7 @@ class AgendaItem(Model):
         description="The id of the meeting of this agenda item.",
         to=Collection("meeting"),
         related_name="agenda_item_ids",
+        on_delete="cascade",
     )
     item_number = fields.CharField(
         description="The number or human readable identifier of this agenda item."
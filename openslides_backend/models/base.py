@@ -1,8 +1,12 @@
-from typing import Dict, Iterable, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Tuple, Type
 
 from ..shared.patterns import Collection
 from .fields import Field, RelationMixin, ReverseRelations, Schema
 
+# All model classes by collection, see ModelMetaClass.
+models_map: Dict[Collection, "Type[Model]"] = {}
+
 
 class ModelMetaClass(type):
     """
@@ -10,6 +14,10 @@ class ModelMetaClass(type):
 
     This metaclass ensures that relation fields get attributes set so that they
     know its own collection and its own field name.
+
+    It also builds frozen indexes of all fields of the new model class so that
+    no reflection is necessary at request time and registers the class in
+    models_map.
     """
 
     def __new__(metaclass, class_name, class_parents, class_attributes):  # type: ignore
@@ -22,6 +30,26 @@ class ModelMetaClass(type):
                 if isinstance(attr, RelationMixin):
                     attr.own_collection = new_class.collection
                     attr.own_field_name = attr_name
+            fields = {}
+            for attr_name in dir(new_class):
+                attr = getattr(new_class, attr_name)
+                if isinstance(attr, Field):
+                    fields[attr_name] = attr
+            new_class._fields = MappingProxyType(fields)
+            new_class._field_items = tuple(fields.items())
+            new_class._relation_fields = tuple(
+                (field_name, field)
+                for field_name, field in fields.items()
+                if isinstance(field, RelationMixin)
+            )
+            new_class.has_structured_relation = any(
+                field.structured_relation is not None
+                for _, field in new_class._relation_fields
+            )
+            new_class.has_generic_relation = any(
+                field.generic_relation for _, field in new_class._relation_fields
+            )
+            models_map[new_class.collection] = new_class
         return new_class
 
 
@@ -33,6 +61,19 @@ class Model(metaclass=ModelMetaClass):
     collection: Collection
     verbose_name: str
 
+    # Indexes built by the metaclass.
+    _fields: Mapping[str, Field]
+    _field_items: Tuple[Tuple[str, Field], ...]
+    _relation_fields: Tuple[Tuple[str, RelationMixin], ...]
+    has_structured_relation: bool
+    has_generic_relation: bool
+
+    # Cache for reverse relations. They are built lazily because other models
+    # may add reverse relations after this model class was created.
+    _reverse_relations_cache: Dict[
+        Collection, Tuple[int, Tuple[Tuple[str, RelationMixin], ...]]
+    ] = {}
+
     def __str__(self) -> str:
         return self.verbose_name
 
@@ -40,40 +81,46 @@ class Model(metaclass=ModelMetaClass):
         """
         Returns the requested model field. Reverse relations are included.
         """
-        for model_field_name, model_field in self.get_fields():
-            if model_field_name == field_name:
-                return model_field
-        else:
-            raise ValueError(f"Model {self} has no field {field_name}.")
+        field = self._fields.get(field_name)
+        if field is not None:
+            return field
+        for reverse_field_name, reverse_field in self.get_reverse_relations():
+            if reverse_field_name == field_name:
+                return reverse_field
+        raise ValueError(f"Model {self} has no field {field_name}.")
 
     def get_fields(self, only_common: bool = False) -> Iterable[Tuple[str, Field]]:
         """
-        Yields all fields in form of a tuple containing field name and field.
+        Returns all fields in form of tuples containing field name and field.
         Reverse relations are included.
         """
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, Field):
-                yield attr_name, attr
-        if not only_common:
-            yield from self.get_reverse_relations()
+        if only_common:
+            return self._field_items
+        return self._field_items + self.get_reverse_relations()
 
     def get_relation_fields(self) -> Iterable[Tuple[str, RelationMixin]]:
         """
-        Yields all relation fields (using RelationMixin) in form of a tuple
+        Returns all relation fields (using RelationMixin) in form of tuples
         containing field name and field. Reverse relations are not included.
         """
-        for model_field_name, model_field in self.get_fields(only_common=True):
-            if isinstance(model_field, RelationMixin):
-                yield model_field_name, model_field
+        return self._relation_fields
 
-    def get_reverse_relations(self) -> Iterable[Tuple[str, RelationMixin]]:
+    def get_reverse_relations(self) -> Tuple[Tuple[str, RelationMixin], ...]:
         """
-        Yields all reverse relation fields that are set by other models (using
+        Returns all reverse relation fields that are set by other models (using
         the related_name argument).
         """
-        for field in ReverseRelations.get(self.collection, []):
-            yield field.related_name, field
+        fields = ReverseRelations.get(self.collection, [])
+        count, reverse_relations = self._reverse_relations_cache.get(
+            self.collection, (-1, ())
+        )
+        if count != len(fields):
+            reverse_relations = tuple((field.related_name, field) for field in fields)
+            self._reverse_relations_cache[self.collection] = (
+                len(fields),
+                reverse_relations,
+            )
+        return reverse_relations
 
     def get_schema(self, field: str) -> Schema:
         """
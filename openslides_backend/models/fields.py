@@ -79,6 +79,10 @@ class RelationMixin(Field):
             writable field at all.
         generic_relation: If this flag is true the reverse field contains
             FQFields of different collections i. e. it is a generic field.
+        on_delete: What happens to an object of this model if the related
+            object is deleted: "protect" forbids the deletion, "set_null"
+            resets this field and "cascade" deletes the object, too. Defaults
+            to the value of the field class.
     """
 
     on_delete: str
@@ -94,7 +98,8 @@ class RelationMixin(Field):
         related_name: str,
         structured_relation: str = None,
         generic_relation: bool = False,
-        **kwargs: Any
+        on_delete: str = None,
+        **kwargs: Any,
     ) -> None:
         if structured_relation is not None:
             if "$" not in related_name:
@@ -106,6 +111,14 @@ class RelationMixin(Field):
                 raise ValueError(
                     "A $ in related name requires setting structured_relation."
                 )
+        if on_delete is not None:
+            if on_delete not in ("protect", "set_null", "cascade"):
+                raise ValueError(f"The value of on_delete must not be {on_delete}.")
+            if on_delete == "cascade" and structured_relation is not None:
+                raise ValueError(
+                    "Setting on_delete to cascade is not possible with structured_relation."
+                )
+            self.on_delete = on_delete
         self.to = to
         self.related_name = related_name
         self.structured_relation = structured_relation
@@ -121,13 +134,13 @@ ReverseRelations: Dict[Collection, List[RelationMixin]] = defaultdict(list)
 
 class RequiredOneToOneField(RelationMixin, IdField):
 
-    on_delete = "protect"  # TODO: Enable cascade
+    on_delete = "protect"
     type = "1:1"
 
 
 class OneToOneField(RelationMixin, IdField):
 
-    on_delete = "set_null"  # TODO: Enable cascade
+    on_delete = "set_null"
     type = "1:1"
 
     def get_schema(self) -> Schema:
@@ -138,13 +151,13 @@ class OneToOneField(RelationMixin, IdField):
 
 class RequiredForeignKeyField(RelationMixin, IdField):
 
-    on_delete = "protect"  # TODO: Enable cascade
+    on_delete = "protect"
     type = "1:m"
 
 
 class ForeignKeyField(RequiredForeignKeyField):
 
-    on_delete = "set_null"  # TODO: Enable cascade
+    on_delete = "set_null"
 
     def get_schema(self) -> Schema:
         schema = super().get_schema()
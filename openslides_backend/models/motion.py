@@ -26,6 +26,7 @@ class Motion(Model):
         description="The id of the meeting of this motion.",
         to=Collection("meeting"),
         related_name="motion_ids",
+        on_delete="cascade",
     )
     number = fields.CharField(
         description="The customizable human readable number or identifier of this motion."
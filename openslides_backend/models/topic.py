@@ -18,6 +18,7 @@ class Topic(Model):
         description="The id of the meeting of this topic.",
         to=Collection("meeting"),
         related_name="topic_ids",
+        on_delete="cascade",
     )
     title = fields.RequiredCharField(description="The title or headline of this topic.")
     text = fields.TextField(description="The HTML formatted text of this topic.")
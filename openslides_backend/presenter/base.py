@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class PresenterBase:  # pragma: no cover
@@ -10,10 +10,20 @@ class PresenterBase:  # pragma: no cover
     def data(self) -> Dict[Any, Any]:
         ...
 
+    @property
+    def cache_key(self) -> Optional[str]:
+        ...
+
 
 class Presenter(PresenterBase):
     """
     Base clase for presenters.
     """
 
-    pass
+    @property
+    def cache_key(self) -> Optional[str]:
+        """
+        Key that changes whenever the data changes, e. g. a content hash or
+        the datastore position. None means that the data must not be cached.
+        """
+        return None
@@ -1,5 +1,7 @@
-from typing import Any, Dict
+import hashlib
+from typing import Any, Dict, Optional
 
+from ..shared import codec
 from .base import Presenter
 from .presenter import register_presenter
 
@@ -10,6 +12,9 @@ class InitialData(Presenter):
     Initial data for setup
     """
 
+    # The data is static so the content hash is computed only once.
+    _cache_key: Optional[str] = None
+
     @property
     def data(self) -> Dict[Any, Any]:
         return {
@@ -20,3 +25,11 @@ class InitialData(Presenter):
             "login_info_text": None,
             "saml_settings": None,
         }
+
+    @property
+    def cache_key(self) -> Optional[str]:
+        if InitialData._cache_key is None:
+            InitialData._cache_key = hashlib.sha256(
+                codec.dumpb(self.data, sort_keys=True)
+            ).hexdigest()
+        return InitialData._cache_key
@@ -1,11 +1,16 @@
-from typing import Callable, Dict, Type
+import hashlib
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Type
 
-import fastjsonschema  # type: ignore
 from fastjsonschema import JsonSchemaException  # type: ignore
 
+from ..shared import codec
 from ..shared.exceptions import PresenterException
+from ..shared.executor import get_executor
 from ..shared.handlers import Base as HandlerBase
-from ..shared.schema import schema_version
+from ..shared.schema import compile_schema, schema_version
 from .base import Presenter
 from .presenter_interface import Payload, PresenterResponse
 
@@ -25,8 +30,8 @@ def register_presenter(name: str) -> Callable[[Type[Presenter]], Type[Presenter]
     return wrapper
 
 
-payload_schema = fastjsonschema.compile(
-    {
+payload_schema = compile_schema(
+    lambda: {
         "$schema": schema_version,
         "title": "Schema for presenter API",
         "description": "An array of presenter blobs, i. e. bundles of user_id and presentation.",
@@ -55,6 +60,12 @@ class PresenterHandler(HandlerBase):
     Presenter handler. It is the concret implementation of Presenter interface.
     """
 
+    # Use 0 to run all presenters of one request sequentially. Else they run
+    # concurrently on a thread pool with this number of threads. Both values
+    # are set from the environment when the application is created.
+    max_workers = 4
+    timeout = 10.0  # Seconds for all presenters of one request
+
     def handle_request(self, payload: Payload, user_id: int) -> PresenterResponse:
         """
         Takes payload and user id and handles this request by validating and
@@ -72,6 +83,29 @@ class PresenterHandler(HandlerBase):
         self.logger.debug("Request was successful. Send response now.")
         return response
 
+    def get_cache_key(self, payload: Payload, user_id: int) -> Optional[str]:
+        """
+        Returns a key for the response of this request without running the
+        presenters. Returns None if the payload is invalid or if some presenter
+        does not provide a cache key.
+        """
+        try:
+            self.validate(payload)
+        except JsonSchemaException:
+            return None
+        cache_keys = []
+        for presenter_blob in payload:
+            presenter_class = presenters_map.get(presenter_blob["presenter"])
+            if presenter_class is None:
+                return None
+            cache_key = presenter_class().cache_key
+            if cache_key is None:
+                return None
+            cache_keys.append(cache_key)
+        return hashlib.sha256(
+            codec.dumpb([user_id, payload, cache_keys], sort_keys=True)
+        ).hexdigest()
+
     def validate(self, payload: Payload) -> None:
         """
         Validates presenter requests sent by client. Raises JsonSchemaException if
@@ -89,15 +123,62 @@ class PresenterHandler(HandlerBase):
         self.logger.debug(
             f"Presenter map contains the following presenters: {presenters_map}."
         )
-        response = []
+        presenters: List[Type[Presenter]] = []
         for presenter_blob in payload:
-            Presenter = presenters_map.get(presenter_blob["presenter"])
-            if Presenter is not None:
-                presenter_instance = Presenter()
-                response.append(presenter_instance.data)
-            else:
+            presenter_class = presenters_map.get(presenter_blob["presenter"])
+            if presenter_class is None:
                 raise PresenterException(
                     f"Presenter {presenter_blob['presenter']} does not exist."
                 )
+            presenters.append(presenter_class)
+        if self.max_workers > 0 and len(presenters) > 1:
+            response = self.run_concurrently(presenters)
+        else:
+            response = [
+                self.run_presenter(presenter_class) for presenter_class in presenters
+            ]
         self.logger.debug("Presenter data ready.")
         return response
+
+    def run_presenter(self, presenter_class: Type[Presenter]) -> Dict[Any, Any]:
+        presenter_instance = presenter_class()
+        return presenter_instance.data
+
+    def run_concurrently(self, presenters: List[Type[Presenter]]) -> PresenterResponse:
+        """
+        Runs all presenters on the thread pool and returns their data in the
+        original order. Raises PresenterException if they do not finish in
+        time.
+
+        On timeout presenters that have not started yet are cancelled. Running
+        presenters can not be interrupted. They finish in the background, so
+        at most max_workers of them occupy the pool at the same time.
+        """
+        deadline = time.monotonic() + self.timeout
+        futures: List[Future] = [
+            get_executor("presenter", self.max_workers).submit(
+                self.run_presenter, presenter_class
+            )
+            for presenter_class in presenters
+        ]
+        response = []
+        try:
+            for future in futures:
+                response.append(
+                    future.result(timeout=max(deadline - time.monotonic(), 0))
+                )
+        except FutureTimeoutError:
+            for future in futures:
+                future.cancel()
+            running = sum(not future.done() for future in futures)
+            self.logger.warning(
+                f"Presenters did not finish within {self.timeout} seconds. "
+                f"{running} of them are still running."
+            )
+            raise PresenterException(
+                f"Presenters did not finish within {self.timeout} seconds."
+            )
+        finally:
+            for future in futures:
+                future.cancel()
+        return response
@@ -1,47 +1,123 @@
+import hashlib
+from typing import Dict, Optional, Tuple
+
 import requests
-import simplejson as json
-from simplejson.errors import JSONDecodeError  # type: ignore
 
+from ..shared import codec
+from ..shared.cache import TTLCache
 from ..shared.exceptions import AuthenticationException
 from ..shared.interfaces import Headers, LoggingModule
+from .session import HTTPSessionPool
 
 # TODO: Something should tell this service what the correct user id of the guest is.
 GUEST_USER_ID = 0
 
+# Only these headers identify the session of a request.
+AUTHENTICATION_HEADERS = ("authorization", "cookie")
+
+DEFAULT_CACHE_SIZE = 1000
+DEFAULT_CACHE_TTL = 30.0  # Seconds
+DEFAULT_NEGATIVE_CACHE_TTL = 5.0  # Seconds
+
 
 class AuthenticationHTTPAdapter:
     """
     Adapter to connect to authentication service.
+
+    Results are cached per session (i. e. per authorization and cookie
+    headers) for cache_ttl seconds. Guest results are cached only for
+    negative_cache_ttl seconds. Use cache_size 0 to disable the cache.
     """
 
-    def __init__(self, authentication_url: str, logging: LoggingModule) -> None:
+    def __init__(
+        self,
+        authentication_url: str,
+        logging: LoggingModule,
+        session: HTTPSessionPool = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL,
+    ) -> None:
         self.url = authentication_url
         self.logger = logging.getLogger(__name__)
         self.headers = {"Content-Type": "application/json"}
+        self.session = session if session is not None else HTTPSessionPool()
+        self.cache = TTLCache(max_size=cache_size, ttl=cache_ttl)
+        self.negative_cache_ttl = negative_cache_ttl
 
     def get_user(self, headers: Headers) -> int:
+        """
+        Returns user id for the given request headers. Uses the cache or asks
+        the authentication service.
+        """
+        cache_key = self.get_cache_key(headers)
+        user_id: Optional[int] = self.cache.get(cache_key)
+        if user_id is not None:
+            return user_id
+        user_id, reliable = self.fetch_user(headers)
+        if reliable:
+            ttl = self.negative_cache_ttl if user_id == GUEST_USER_ID else None
+            self.cache.set(cache_key, user_id, ttl=ttl)
+        return user_id
+
+    def invalidate(self, headers: Headers) -> None:
+        """
+        Removes the cached result for the given request headers, e. g. after
+        logout.
+        """
+        self.cache.delete(self.get_cache_key(headers))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Removes all cached results for the given user, e. g. after the user
+        was deleted or deactivated.
+        """
+        self.cache.delete_if(lambda cached_user_id: cached_user_id == user_id)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        return self.cache.get_stats()
+
+    def get_cache_key(self, headers: Headers) -> str:
+        """
+        Returns a hash of all headers that identify the session.
+        """
+        hash = hashlib.sha256()
+        for name, value in sorted(headers.to_wsgi_list()):
+            if name.lower() in AUTHENTICATION_HEADERS:
+                hash.update(f"{name.lower()}:{value}\n".encode())
+        return hash.hexdigest()
+
+    def fetch_user(self, headers: Headers) -> Tuple[int, bool]:
         """
         Fetches user id from authentication service using request headers.
+        Returns also False if the result is the guest fallback because the
+        service is down so that it is not cached.
         """
         self.logger.debug(
             f"Start request to authentication service with the following data: {headers}"
         )
-        request_data = json.dumps(headers.to_wsgi_list())
+        request_data = codec.dumpb(headers.to_wsgi_list())
         try:
-            response = requests.post(self.url, data=request_data, headers=self.headers)
+            response = self.session.post(
+                self.url, data=request_data, headers=self.headers
+            )
         except requests.exceptions.ConnectionError as e:
             self.logger.debug(
                 f"Cannot reach the authentication service on {self.url}. Error: {e}"
             )
-            user_id = self.auth_is_down()
+            return self.auth_is_down(), False
+        except requests.exceptions.RequestException as e:
+            raise AuthenticationException(
+                f"Request to authentication service failed. Error: {e}"
+            )
         else:
             if not response.ok:
                 raise AuthenticationException(
                     f"Authentication service sends HTTP {response.status_code}."
                 )
             try:
-                body = response.json()
-            except JSONDecodeError:
+                body = codec.loads(response.content)
+            except codec.JSONDecodeError:
                 raise AuthenticationException(
                     "Bad response from authentication service. Body does not contain JSON."
                 )
@@ -52,7 +128,7 @@ class AuthenticationHTTPAdapter:
                 raise AuthenticationException(
                     "Empty or bad response from authentication service."
                 )
-        return user_id
+        return user_id, True
 
     def auth_is_down(self) -> int:
         """
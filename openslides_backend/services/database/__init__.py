@@ -1,2 +1,3 @@
 from .adapter import Adapter  # noqa
+from .cache import DatabaseCache  # noqa
 from .engine import HTTPEngine  # noqa
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import openslides_backend.services.database.commands as commands
 from openslides_backend.services.database.adapter.interface import GetManyRequest
@@ -88,6 +88,14 @@ class Adapter:
         response = self.adapter.filter(command)
         return response
 
+    def reserveIds(self, collection: Collection, amount: int) -> Tuple[List[int], int]:
+        command = commands.ReserveIds(collection=collection, amount=amount)
+        self.logger.debug(
+            f"Start request to database with the following data: {command.data}"
+        )
+        response = self.adapter.reserveIds(command)
+        return response["ids"], response["position"]
+
     def exists(self, collection: Collection, filter: Filter) -> Found:
         command = commands.Exists(collection=collection, filter=filter)
         self.logger.debug(
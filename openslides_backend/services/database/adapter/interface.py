@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from mypy_extensions import TypedDict
 from typing_extensions import Protocol
@@ -84,6 +84,9 @@ class Datastore(Protocol):
     ) -> List[PartialModel]:
         ...
 
+    def reserveIds(self, collection: Collection, amount: int) -> Tuple[List[int], int]:
+        ...
+
     def exists(self, collection: Collection, filter: Filter) -> Found:
         ...
 
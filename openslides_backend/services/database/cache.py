@@ -0,0 +1,154 @@
+from copy import deepcopy
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from openslides_backend.shared.filters import Filter
+from openslides_backend.shared.interfaces import Database
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+
+class DatabaseCache:
+    """
+    Request-scoped read-through cache in front of the database adapter.
+
+    All get and getMany requests are served from memory if the requested fields
+    were fetched before. Else only the missing fields are fetched and merged
+    into the cached partial model. The lowest position seen is saved in the
+    position attribute.
+
+    Use one instance per request only. The cache is never invalidated.
+    """
+
+    def __init__(self, database: Database) -> None:
+        self.database = database
+        self.models: Dict[FullQualifiedId, Dict[str, Any]] = {}
+        self.loaded_fields: Dict[FullQualifiedId, Set[str]] = {}
+        self.complete: Set[FullQualifiedId] = set()
+        self.positions: Dict[FullQualifiedId, int] = {}
+        self.position = 0
+
+    def get(
+        self, fqid: FullQualifiedId, mapped_fields: List[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        result, position = self.getMany(fqid.collection, [fqid.id], mapped_fields)
+        return result[fqid.id], position
+
+    def getMany(
+        self, collection: Collection, ids: List[int], mapped_fields: List[str] = None
+    ) -> Tuple[Dict[int, Dict[str, Any]], int]:
+        missing_ids = []
+        missing_fields: Optional[Set[str]] = set()
+        for id in ids:
+            fields = self.get_missing_fields(
+                FullQualifiedId(collection, id), mapped_fields
+            )
+            if fields is None:
+                missing_ids.append(id)
+                missing_fields = None
+            elif fields:
+                missing_ids.append(id)
+                if missing_fields is not None:
+                    missing_fields.update(fields)
+        if missing_ids:
+            fetched_fields = None if missing_fields is None else sorted(missing_fields)
+            db_instances, position = self.database.getMany(
+                collection, missing_ids, mapped_fields=fetched_fields
+            )
+            self.set_min_position(position)
+            for id in missing_ids:
+                self.update(
+                    FullQualifiedId(collection, id),
+                    db_instances.get(id, {}),
+                    fetched_fields,
+                    position,
+                )
+
+        result = {}
+        positions = []
+        for id in ids:
+            fqid = FullQualifiedId(collection, id)
+            result[id] = self.get_cached_fields(fqid, mapped_fields)
+            positions.append(self.positions[fqid])
+        return result, min(positions, default=self.position)
+
+    def getId(self, collection: Collection) -> Tuple[int, int]:
+        return self.database.getId(collection)
+
+    def reserveIds(self, collection: Collection, amount: int) -> Tuple[List[int], int]:
+        return self.database.reserveIds(collection, amount)
+
+    def exists(self, collection: Collection, ids: List[int]) -> Tuple[bool, int]:
+        return self.database.exists(collection, ids)
+
+    def filter(
+        self,
+        collection: Collection,
+        filter: Filter,
+        meeting_id: int = None,
+        mapped_fields: List[str] = None,
+    ) -> Tuple[Dict[int, Dict[str, Any]], int]:
+        return self.database.filter(
+            collection, filter, meeting_id=meeting_id, mapped_fields=mapped_fields
+        )
+
+    def get_missing_fields(
+        self, fqid: FullQualifiedId, mapped_fields: Optional[List[str]]
+    ) -> Optional[List[str]]:
+        """
+        Returns the fields that have to be fetched from the database for the
+        given fqid. None means that the whole model has to be fetched. An empty
+        list means that everything is cached.
+        """
+        if fqid in self.complete:
+            return []
+        if mapped_fields is None:
+            return None
+        loaded_fields = self.loaded_fields.get(fqid)
+        if loaded_fields is None:
+            return list(mapped_fields)
+        return [field for field in mapped_fields if field not in loaded_fields]
+
+    def update(
+        self,
+        fqid: FullQualifiedId,
+        instance: Dict[str, Any],
+        mapped_fields: Optional[Iterable[str]],
+        position: int,
+    ) -> None:
+        """
+        Merges the given (partial) instance into the cache.
+        """
+        self.models.setdefault(fqid, {}).update(instance)
+        if mapped_fields is None:
+            self.complete.add(fqid)
+        else:
+            self.loaded_fields.setdefault(fqid, set()).update(mapped_fields)
+        if self.positions.get(fqid) is None:
+            self.positions[fqid] = position
+        else:
+            self.positions[fqid] = min(position, self.positions[fqid])
+
+    def get_cached_fields(
+        self, fqid: FullQualifiedId, mapped_fields: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """
+        Returns a copy of the cached instance reduced to the given fields so
+        that callers may mutate the result.
+        """
+        instance = self.models[fqid]
+        if mapped_fields is None:
+            return deepcopy(instance)
+        return {
+            field: deepcopy(instance[field])
+            for field in mapped_fields
+            if field in instance
+        }
+
+    def set_min_position(self, position: int) -> None:
+        """
+        Sets self.position to the new value position if this value is smaller
+        than the old one. Sets it if it is the first call.
+        """
+        if self.position == 0:
+            self.position = position
+        else:
+            self.position = min(position, self.position)
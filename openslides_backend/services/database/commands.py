@@ -114,6 +114,19 @@ class GetAll(Command):
         return result
 
 
+class ReserveIds(Command):
+    """ReserveIds command
+    """
+
+    def __init__(self, collection: Collection, amount: int):
+        self.collection = collection
+        self.amount = amount
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return {"collection": str(self.collection), "amount": self.amount}
+
+
 class Exists(Command):
     """Exists command
     """
@@ -1,6 +1,7 @@
 import requests
-import simplejson as json
 
+from openslides_backend.services.session import HTTPSessionPool
+from openslides_backend.shared import codec
 from openslides_backend.shared.exceptions import DatabaseException
 from openslides_backend.shared.interfaces import LoggingModule
 
@@ -11,25 +12,36 @@ class HTTPEngine:
     """HTTP implementation of the Engine interface
     """
 
-    def __init__(self, database_url: str, logging: LoggingModule):
+    def __init__(
+        self, database_url: str, logging: LoggingModule, session: HTTPSessionPool = None
+    ):
         self.logger = logging.getLogger(__name__)
         self.url = database_url
         self.headers = {"Content-Type": "application/json"}
+        self.session = session if session is not None else HTTPSessionPool()
 
     def _retrieve(self, command_url: str, command: Command) -> EngineResponse:
-        payload = json.dumps(command.data)
-        response = requests.post(command_url, data=payload, headers=self.headers)
+        payload = codec.dumpb(command.data)
+        try:
+            response = self.session.post(
+                command_url, data=payload, headers=self.headers
+            )
+        except requests.exceptions.RequestException as exception:
+            raise DatabaseException(
+                f"Connection to database failed. Error: {exception}"
+            )
         if not response.ok:
             if response.status_code >= 500:
                 raise DatabaseException("Connection to database failed.")
-        error = None
         try:
-            error = response.json().get("error")
-        except:  # noqa: E722
-            pass
-        if error is not None:
-            raise DatabaseException(error)
-        return response.json()
+            body = codec.loads(response.content)
+        except codec.JSONDecodeError:
+            raise DatabaseException(
+                "Bad response from database. Body does not contain JSON."
+            )
+        if isinstance(body, dict) and body.get("error") is not None:
+            raise DatabaseException(body["error"])
+        return body
 
     def get(self, command: Command) -> EngineResponse:
         command_url = f" {self.url}/get"  # noqa
@@ -66,3 +78,7 @@ class HTTPEngine:
     def max(self, command: Command) -> EngineResponse:
         command_url = f" {self.url}/max"
         return self._retrieve(command_url, command)
+
+    def reserveIds(self, command: Command) -> EngineResponse:
+        command_url = f" {self.url}/reserve_ids"
+        return self._retrieve(command_url, command)
@@ -41,3 +41,6 @@ class Engine(Protocol):
 
     def getId(self, data: Command) -> EngineResponse:
         ...
+
+    def reserveIds(self, data: Command) -> EngineResponse:
+        ...
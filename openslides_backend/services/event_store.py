@@ -1,6 +1,12 @@
-from typing import Iterable
+from logging import DEBUG
+from typing import Any, Dict, Iterable, List
 
-from ..shared.interfaces import WriteRequestElement
+import requests
+
+from ..shared import codec
+from ..shared.exceptions import EventStoreException, ModelLocked
+from ..shared.interfaces import LoggingModule, WriteRequestElement
+from .session import HTTPSessionPool
 
 
 class EventStoreHTTPAdapter:
@@ -8,9 +14,67 @@ class EventStoreHTTPAdapter:
     Adapter to connect to event store.
     """
 
-    def __init__(self, event_store_url: str) -> None:
+    def __init__(
+        self,
+        event_store_url: str,
+        logging: LoggingModule,
+        session: HTTPSessionPool = None,
+    ) -> None:
         self.url = event_store_url
-        # self.headers = {"Content-Type": "application/json"}
+        self.logger = logging.getLogger(__name__)
+        self.headers = {"Content-Type": "application/json"}
+        self.session = session if session is not None else HTTPSessionPool()
 
     def send(self, events: Iterable[WriteRequestElement]) -> None:
-        raise
+        """
+        Sends all write request elements to the event store using one request.
+        Raises ModelLocked if the event store reports that some locked fields
+        were modified in the meantime and EventStoreException on all other
+        errors.
+        """
+        payload = self.serialize(events)
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(
+                f"Start request to event store with the following data: {payload.decode()}"
+            )
+        try:
+            response = self.session.post(self.url, data=payload, headers=self.headers)
+        except requests.exceptions.RequestException as exception:
+            raise EventStoreException(
+                f"Connection to event store failed. Error: {exception}"
+            )
+        if response.ok:
+            return
+        try:
+            error = codec.loads(response.content).get("error")
+        except (codec.JSONDecodeError, AttributeError):
+            error = None
+        if isinstance(error, dict) and error.get("type") == "ModelLocked":
+            raise ModelLocked(error.get("message", "Some fields are locked."))
+        raise EventStoreException(
+            f"Event store sends HTTP {response.status_code}. Error: {error}"
+        )
+
+    def serialize(self, write_request_elements: Iterable[WriteRequestElement]) -> bytes:
+        """
+        Returns one compact JSON body for all write request elements. The
+        codec encodes all full qualified ids and fields in events. Only the
+        keys of information and locked fields are converted to strings.
+        """
+        body: List[Dict[str, Any]] = []
+        for element in write_request_elements:
+            body.append(
+                {
+                    "events": element["events"],
+                    "information": {
+                        str(fqid): information
+                        for fqid, information in element["information"].items()
+                    },
+                    "user_id": element["user_id"],
+                    "locked_fields": {
+                        str(key): position
+                        for key, position in element["locked_fields"].items()
+                    },
+                }
+            )
+        return codec.dumpb(body)
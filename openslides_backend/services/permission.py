@@ -1,4 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..shared.interfaces import Permission
 
 
 class PermissionHTTPAdapter:
@@ -13,5 +15,72 @@ class PermissionHTTPAdapter:
     def has_perm(self, user_id: int, permission: str) -> bool:
         raise
 
+    def has_perms(self, user_id: int, permissions: List[str]) -> Dict[str, bool]:
+        raise
+
     def get_all(self, user_id: int) -> List[str]:
         raise
+
+
+class PermissionCache:
+    """
+    Request-scoped cache in front of the permission adapter.
+
+    Every decision is memoized per user and permission (the permission string
+    contains the reference id, e. g. 42/topic.can_manage). Questions that are
+    not answered yet are asked in one bulk request. If preload is set, all
+    permissions of a user are fetched with one get_all request instead.
+
+    Use one instance per request only. The cache is never invalidated.
+    """
+
+    def __init__(self, permission: Permission, preload: bool = False) -> None:
+        self.permission = permission
+        self.preload = preload
+        self.decisions: Dict[Tuple[int, str], bool] = {}
+        self.all_permissions: Dict[int, Set[str]] = {}
+        self.stats = {"hits": 0, "misses": 0, "requests": 0}
+
+    def has_perm(self, user_id: int, permission: str) -> bool:
+        return self.has_perms(user_id, [permission])[permission]
+
+    def has_perms(self, user_id: int, permissions: List[str]) -> Dict[str, bool]:
+        result = {}
+        missing = []
+        for permission in permissions:
+            decision = self.get_decision(user_id, permission)
+            if decision is None:
+                if permission not in missing:
+                    missing.append(permission)
+            else:
+                self.stats["hits"] += 1
+                result[permission] = decision
+        if missing:
+            self.stats["misses"] += len(missing)
+            self.stats["requests"] += 1
+            decisions = self.permission.has_perms(user_id, missing)
+            for permission in missing:
+                decision = bool(decisions.get(permission, False))
+                self.decisions[(user_id, permission)] = decision
+                result[permission] = decision
+        return result
+
+    def get_all(self, user_id: int) -> List[str]:
+        all_permissions = self.all_permissions.get(user_id)
+        if all_permissions is None:
+            self.stats["requests"] += 1
+            all_permissions = set(self.permission.get_all(user_id))
+            self.all_permissions[user_id] = all_permissions
+        return sorted(all_permissions)
+
+    def get_decision(self, user_id: int, permission: str) -> Optional[bool]:
+        """
+        Returns the cached decision or None if the permission service has to
+        be asked.
+        """
+        decision = self.decisions.get((user_id, permission))
+        if decision is None and (self.preload or user_id in self.all_permissions):
+            self.get_all(user_id)
+            decision = permission in self.all_permissions[user_id]
+            self.decisions[(user_id, permission)] = decision
+        return decision
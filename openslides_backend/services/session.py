@@ -0,0 +1,96 @@
+import os
+import threading
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry  # type: ignore
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.1
+
+
+class HTTPSessionPool:
+    """
+    Keep-alive HTTP session shared by all service adapters of one worker.
+
+    The underlying connection pool keeps up to pool_size connections per host
+    open. Every request uses the given timeout (in seconds). Failed attempts to
+    connect are retried with exponential backoff.
+
+    The session is created lazily and again after a fork so that worker
+    processes never share sockets with their parent. All threads (and
+    greenlets) of one worker share the session. Its connection pool is thread
+    safe.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.pid = 0
+        self._session: requests.Session
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self.pid != os.getpid():
+            with self.lock:
+                if self.pid != os.getpid():
+                    self._session = self.create_session()
+                    self.pid = os.getpid()
+                    self.requests = 0
+        return self._session
+
+    def create_session(self) -> requests.Session:
+        """
+        Creates a new session with pooled connections and retry policy.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=Retry(
+                total=self.retries, read=False, backoff_factor=DEFAULT_BACKOFF_FACTOR
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Sends a POST request using a pooled connection.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session
+        with self.lock:
+            self.requests += 1
+        return session.post(url, **kwargs)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns counters for requests and connections of this worker. Reused
+        connections are requests that did not have to open a new connection.
+        """
+        connections = 0
+        if self.pid == os.getpid():
+            for adapter in set(self._session.adapters.values()):
+                pools = adapter.poolmanager.pools  # type: ignore
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        connections += pool.num_connections
+        return {
+            "requests": self.requests,
+            "connections": connections,
+            "reused_connections": max(self.requests - connections, 0),
+        }
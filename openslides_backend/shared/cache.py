@@ -0,0 +1,82 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_SIZE = 1000
+DEFAULT_TTL = 30.0  # Seconds
+
+
+class TTLCache:
+    """
+    Bounded least recently used cache whose entries expire after a time to
+    live. Every entry may have its own time to live. The cache is thread safe.
+
+    Use max_size 0 to disable the cache.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value or None if there is no valid entry.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > self.clock():
+                    self.entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return value
+                del self.entries[key]
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """
+        Saves the value. The least recently used entry is evicted if the cache
+        is full.
+        """
+        if self.max_size <= 0:
+            return
+        if ttl is None:
+            ttl = self.ttl
+        with self.lock:
+            self.entries[key] = (self.clock() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def delete_if(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Deletes all entries whose value matches the given predicate.
+        """
+        with self.lock:
+            for key, (_, value) in list(self.entries.items()):
+                if predicate(value):
+                    del self.entries[key]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats, size=len(self.entries))
@@ -0,0 +1,97 @@
+import os
+from typing import Any, Callable, Union
+
+import simplejson
+
+from .patterns import FullQualifiedField, FullQualifiedId
+
+
+def default(value: Any) -> str:
+    """
+    Helper for JSON encoder to convert full qualified ids and full qualified
+    fields (e. g. in generic relation fields) to strings.
+    """
+    if isinstance(value, (FullQualifiedId, FullQualifiedField)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def simplejson_dumpb(obj: Any, sort_keys: bool = False) -> bytes:
+    return simplejson.dumps(
+        obj,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+        ignore_nan=True,
+    ).encode()
+
+
+def simplejson_loads(data: Union[str, bytes]) -> Any:
+    return simplejson.loads(data)
+
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def orjson_dumpb(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Encodes like simplejson_dumpb. Non string dict keys are converted to
+    strings. Objects orjson can not encode, e. g. integers wider than 64 bit,
+    are encoded with simplejson.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        return simplejson_dumpb(obj, sort_keys=sort_keys)
+
+
+# JSON codec used for all requests, responses and requests to other services.
+# It uses orjson if it is installed (see requirements_orjson.txt) and
+# simplejson else. Set the environment variable OPENSLIDES_BACKEND_JSON_CODEC
+# to simplejson or orjson to force one of them. Both backends produce the same
+# compact JSON. NaN and infinity are encoded as null.
+dumpb: Callable[..., bytes] = simplejson_dumpb
+loads: Callable[[Union[str, bytes]], Any] = simplejson_loads
+JSONDecodeError: Any = simplejson.JSONDecodeError
+BACKEND = "simplejson"
+
+backend_setting = os.environ.get("OPENSLIDES_BACKEND_JSON_CODEC")
+if backend_setting not in (None, "simplejson", "orjson"):
+    raise ValueError(
+        f"Invalid value for OPENSLIDES_BACKEND_JSON_CODEC: {backend_setting}"
+    )
+if backend_setting == "orjson" and orjson is None:
+    raise ImportError("OPENSLIDES_BACKEND_JSON_CODEC is orjson but it is missing.")
+if orjson is not None and backend_setting in (None, "orjson"):
+    dumpb = orjson_dumpb
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+    BACKEND = "orjson"
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Encodes the given object to a compact JSON string.
+    """
+    return dumpb(obj, sort_keys=sort_keys).decode()
+
+
+class JSONModule:
+    """
+    Adapter so that Werkzeug's JSONMixin uses this codec to parse request
+    bodies.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return dumps(obj, sort_keys=kwargs.get("sort_keys", False))
+
+    @staticmethod
+    def loads(data: Union[str, bytes], **kwargs: Any) -> Any:
+        return loads(data)
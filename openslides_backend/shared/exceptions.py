@@ -35,3 +35,12 @@ class DatabaseException(BackendBaseException):
 
 class EventStoreException(BackendBaseException):
     pass
+
+
+class ModelLocked(EventStoreException):
+    """
+    Raised by the event store if some locked fields were modified in the
+    meantime.
+    """
+
+    pass
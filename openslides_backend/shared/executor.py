@@ -0,0 +1,27 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+# Thread pools of this worker process by name, see get_executor.
+executors: Dict[str, Tuple[int, int, ThreadPoolExecutor]] = {}
+executors_lock = threading.Lock()
+
+
+def get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """
+    Returns the thread pool with the given name of this worker process. It is
+    created lazily and again after a fork because threads do not survive a
+    fork. If another pool size is requested, a new pool with this size
+    replaces the old one. The old pool finishes its submitted work.
+    """
+    with executors_lock:
+        pid, size, executor = executors.get(name, (0, 0, None))
+        if executor is None or pid != os.getpid() or size != max_workers:
+            if executor is not None and pid == os.getpid():
+                executor.shutdown(wait=False)
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=name
+            )
+            executors[name] = (os.getpid(), max_workers, executor)
+        return executor
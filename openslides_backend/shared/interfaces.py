@@ -31,6 +31,9 @@ class Logger(Protocol):  # pragma: no cover
     def critical(self, message: str) -> None:
         ...
 
+    def isEnabledFor(self, level: int) -> bool:
+        ...
+
 
 class LoggingModule(Protocol):  # pragma: no cover
     """
@@ -74,11 +77,17 @@ class View(Protocol):  # pragma: no cover
     """
 
     method: str
+    stream_response: bool
 
     def __init__(self, logging: LoggingModule, services: Services) -> None:
         ...
 
-    def dispatch(self, body: RequestBody, headers: Headers) -> ResponseBody:
+    def dispatch(
+        self, body: RequestBody, headers: Headers, path: str = "/"
+    ) -> ResponseBody:
+        ...
+
+    def get_cache_key(self, body: RequestBody, headers: Headers) -> Optional[str]:
         ...
 
 
@@ -116,6 +125,9 @@ class Permission(Protocol):  # pragma: no cover
     def has_perm(self, user_id: int, permission: str) -> bool:
         ...
 
+    def has_perms(self, user_id: int, permissions: List[str]) -> Dict[str, bool]:
+        ...
+
     def get_all(self, user_id: int) -> List[str]:
         ...
 
@@ -138,6 +150,9 @@ class Database(Protocol):  # pragma: no cover
     def getId(self, collection: Collection) -> Tuple[int, int]:
         ...
 
+    def reserveIds(self, collection: Collection, amount: int) -> Tuple[List[int], int]:
+        ...
+
     def exists(self, collection: Collection, ids: List[int]) -> Tuple[bool, int]:
         ...
 
@@ -1,3 +1,6 @@
+from typing import Any, Tuple
+from weakref import WeakValueDictionary
+
 KEYSEPARATOR = "/"
 
 
@@ -7,8 +10,18 @@ class Collection:
     motion_change_recommendation.
     """
 
+    __slots__ = ("collection",)
+
+    collection: str
+
     def __init__(self, collection: str) -> None:
-        self.collection = collection
+        object.__setattr__(self, "collection", collection)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.collection,))
 
     def __str__(self) -> str:
         return self.collection
@@ -22,63 +35,157 @@ class Collection:
         return self.collection == other.collection
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return hash(self.collection)
 
 
 class FullQualifiedId:
     """
     Part of a full qualified field (also known as "key"),
     e. g. motion_change_recommendation/42
+
+    Instances are immutable and interned, i. e. creating the same full
+    qualified id twice returns the same object as long as it is alive. The
+    string form and the hash are computed only once.
     """
 
-    def __init__(self, collection: Collection, id: int) -> None:
-        self.collection = collection
-        self.id = id
+    __slots__ = ("collection", "id", "_str", "_hash", "__weakref__")
+
+    collection: Collection
+    id: int
+    _str: str
+    _hash: int
+
+    _instances: "WeakValueDictionary[Tuple[str, int], FullQualifiedId]" = (
+        WeakValueDictionary()
+    )
+
+    def __new__(cls, collection: Collection, id: int) -> "FullQualifiedId":
+        key = (collection.collection, id)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            string = f"{collection.collection}{KEYSEPARATOR}{id}"
+            object.__setattr__(instance, "collection", collection)
+            object.__setattr__(instance, "id", id)
+            object.__setattr__(instance, "_str", string)
+            object.__setattr__(instance, "_hash", hash(string))
+            cls._instances[key] = instance
+        return instance
+
+    @classmethod
+    def parse(cls, value: str) -> "FullQualifiedId":
+        """
+        Constructs a full qualified id from its string form, e. g. motion/42.
+        """
+        collection, separator, id = value.partition(KEYSEPARATOR)
+        if not separator or not collection or KEYSEPARATOR in id:
+            raise ValueError(f"{value} is not a valid full qualified id.")
+        return cls(Collection(collection), int(id))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.collection, self.id))
+
+    def __copy__(self) -> "FullQualifiedId":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "FullQualifiedId":
+        return self
 
     def __str__(self) -> str:
-        return KEYSEPARATOR.join((str(self.collection), str(self.id)))
+        return self._str
 
     def __repr__(self) -> str:
-        return f"FQId {str(self)}"
+        return f"FQId {self._str}"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FullQualifiedId):
             return NotImplemented
-        return self.collection == other.collection and self.id == other.id
+        return self._str == other._str
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
 
 
 class FullQualifiedField:
     """
     The key used in the key-value store i. e. the event store, e. g.
     motion_change_recommendation/42/text
+
+    Instances are immutable and interned like full qualified ids.
     """
 
-    def __init__(self, collection: Collection, id: int, field: str) -> None:
-        self.collection = collection
-        self.id = id
-        self.field = field
+    __slots__ = ("collection", "id", "field", "_str", "_hash", "__weakref__")
+
+    collection: Collection
+    id: int
+    field: str
+    _str: str
+    _hash: int
+
+    _instances: "WeakValueDictionary[Tuple[str, int, str], FullQualifiedField]" = (
+        WeakValueDictionary()
+    )
+
+    def __new__(
+        cls, collection: Collection, id: int, field: str
+    ) -> "FullQualifiedField":
+        key = (collection.collection, id, field)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            string = f"{collection.collection}{KEYSEPARATOR}{id}{KEYSEPARATOR}{field}"
+            object.__setattr__(instance, "collection", collection)
+            object.__setattr__(instance, "id", id)
+            object.__setattr__(instance, "field", field)
+            object.__setattr__(instance, "_str", string)
+            object.__setattr__(instance, "_hash", hash(string))
+            cls._instances[key] = instance
+        return instance
+
+    @classmethod
+    def parse(cls, value: str) -> "FullQualifiedField":
+        """
+        Constructs a full qualified field from its string form, e. g.
+        motion/42/title.
+        """
+        parts = value.split(KEYSEPARATOR)
+        if len(parts) != 3 or not parts[0] or not parts[2]:
+            raise ValueError(f"{value} is not a valid full qualified field.")
+        return cls(Collection(parts[0]), int(parts[1]), parts[2])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.collection, self.id, self.field))
+
+    def __copy__(self) -> "FullQualifiedField":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "FullQualifiedField":
+        return self
 
     def __str__(self) -> str:
-        return KEYSEPARATOR.join((str(self.collection), str(self.id), self.field))
+        return self._str
 
     def __repr__(self) -> str:
-        return f"FQField {str(self)}"
+        return f"FQField {self._str}"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FullQualifiedField):
             return NotImplemented
-        return (
-            self.collection == other.collection
-            and self.id == other.id
-            and self.field == other.field
-        )
+        return self._str == other._str
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
 
     @property
     def fqid(self) -> FullQualifiedId:
-        return FullQualifiedId(collection=self.collection, id=self.id)
+        return FullQualifiedId(self.collection, self.id)
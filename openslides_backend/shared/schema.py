@@ -1 +1,107 @@
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import fastjsonschema  # type: ignore
+
+from . import codec
+
 schema_version = "http://json-schema.org/draft-07/schema#"
+
+Schema = Dict[str, Any]
+Validator = Callable[[Any], Any]
+
+
+class LazySchema:
+    """
+    JSON schema validator that is compiled on first use.
+
+    The definition may be given as callable so that it is also built on first
+    use. If a cache directory is set, the generated code is saved there keyed
+    by the hash of the definition and loaded from there by other processes.
+    """
+
+    def __init__(self, definition: Union[Schema, Callable[[], Schema]]) -> None:
+        self._definition = definition
+        self._validator: Optional[Validator] = None
+        self.lock = threading.Lock()
+
+    def __call__(self, data: Any) -> Any:
+        """
+        Validates the data. Raises JsonSchemaException if data is invalid.
+        """
+        validator = self._validator
+        if validator is None:
+            validator = self.compile()
+        return validator(data)
+
+    @property
+    def definition(self) -> Schema:
+        if callable(self._definition):
+            self._definition = self._definition()
+        return self._definition
+
+    def compile(self) -> Validator:
+        with self.lock:
+            if self._validator is None:
+                cache_dir = os.environ.get("OPENSLIDES_BACKEND_SCHEMA_CACHE_DIR")
+                if cache_dir:
+                    self._validator = self.compile_with_cache(cache_dir)
+                else:
+                    self._validator = fastjsonschema.compile(self.definition)
+            return self._validator
+
+    def compile_with_cache(self, cache_dir: str) -> Validator:
+        """
+        Loads the generated code from the cache directory or generates and
+        saves it.
+        """
+        path = os.path.join(cache_dir, f"{self.get_hash()}.py")
+        try:
+            with open(path) as file:
+                code = file.read()
+        except OSError:
+            code = fastjsonschema.compile_to_code(self.definition)
+            os.makedirs(cache_dir, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w") as file:
+                file.write(code)
+            os.replace(temporary_path, path)
+        namespace: Dict[str, Any] = {}
+        exec(compile(code, path, "exec"), namespace)
+        validator = namespace.get("validate")
+        if validator is None:
+            # The definition uses an id so the function has another name.
+            return fastjsonschema.compile(self.definition)
+        return validator
+
+    def get_hash(self) -> str:
+        """
+        Returns the hash of the definition and the fastjsonschema version.
+        """
+        return hashlib.sha256(
+            codec.dumpb([fastjsonschema.VERSION, self.definition], sort_keys=True)
+        ).hexdigest()
+
+
+schema_registry: List[LazySchema] = []
+
+
+def compile_schema(definition: Union[Schema, Callable[[], Schema]]) -> LazySchema:
+    """
+    Returns a validator for the given JSON schema definition that is compiled
+    on first use and registers it so that it can be prewarmed.
+    """
+    schema = LazySchema(definition)
+    schema_registry.append(schema)
+    return schema
+
+
+def prewarm_schemas() -> None:
+    """
+    Compiles all registered schemas. Call this in the master process before
+    forking workers so that they share the compiled validators.
+    """
+    for schema in schema_registry:
+        schema.compile()
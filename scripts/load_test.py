@@ -0,0 +1,126 @@
+"""
+Load test for the presenter view with different worker models.
+
+Starts a fake authentication service that answers after a fixed latency and
+the presenter component with each worker model. Then sends requests from
+concurrent clients for some seconds and prints the throughput.
+
+Usage: python scripts/load_test.py [--duration SECONDS] [--clients NUMBER]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Tuple
+
+import requests
+
+PRESENTER_URL = "http://127.0.0.1:8001/"
+AUTH_LATENCY = 0.02  # Seconds
+
+# Worker class, number of workers and number of threads per worker.
+WORKER_MODELS: List[Tuple[str, int, int]] = [
+    ("sync", 2, 1),
+    ("gthread", 2, 8),
+    ("gevent", 2, 1),
+]
+
+
+class SlowAuthenticationHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(AUTH_LATENCY)
+        body = b'{"user_id": 0}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def wait_for_server(timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(PRESENTER_URL, json=[{"presenter": "whoami"}], timeout=1)
+            return True
+        except requests.exceptions.ConnectionError:
+            time.sleep(0.1)
+    return False
+
+
+def run_clients(duration: float, clients: int) -> float:
+    """
+    Sends requests from concurrent clients and returns requests per second.
+    """
+    counts = [0] * clients
+    deadline = time.monotonic() + duration
+
+    def client(index: int) -> None:
+        session = requests.Session()
+        while time.monotonic() < deadline:
+            response = session.get(PRESENTER_URL, json=[{"presenter": "whoami"}])
+            if response.status_code == 200:
+                counts[index] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test for worker models.")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=32)
+    args = parser.parse_args()
+
+    auth_server = ThreadingHTTPServer(("127.0.0.1", 0), SlowAuthenticationHandler)
+    threading.Thread(target=auth_server.serve_forever, daemon=True).start()
+
+    for worker_class, workers, threads in WORKER_MODELS:
+        environment = dict(
+            os.environ,
+            OPENSLIDES_BACKEND_COMPONENT="presenter",
+            OPENSLIDES_BACKEND_AUTHENTICATION_URL=(
+                f"http://127.0.0.1:{auth_server.server_port}/"
+            ),
+            # Disable the cache so that every request waits for the service.
+            OPENSLIDES_BACKEND_AUTH_CACHE_SIZE="0",
+            OPENSLIDES_BACKEND_WORKER_CLASS=worker_class,
+            OPENSLIDES_BACKEND_WORKERS=str(workers),
+            OPENSLIDES_BACKEND_THREADS=str(threads),
+        )
+        name = f"{worker_class} ({workers} workers, {threads} threads)"
+        process = subprocess.Popen(
+            [sys.executable, "-m", "openslides_backend"],
+            env=environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            if not wait_for_server():
+                print(f"{name}: server did not start (worker class installed?)")
+                continue
+            throughput = run_clients(args.duration, args.clients)
+            print(f"{name}: {throughput:.0f} requests/s")
+        finally:
+            process.terminate()
+            process.wait()
+
+    auth_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
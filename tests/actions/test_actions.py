@@ -0,0 +1,315 @@
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.actions import Payload
+from openslides_backend.actions.actions import (
+    ActionsHandler,
+    count_retry_stat,
+    retry_stats,
+)
+from openslides_backend.shared.exceptions import (
+    ActionException,
+    EventStoreException,
+    ModelLocked,
+)
+
+from ..fake_services.database import DatabaseTestAdapter
+from ..fake_services.permission import PermissionTestAdapter
+
+
+class ActionsHandlerRetryTester(TestCase):
+    """
+    Tests the retry loop of the actions handler.
+    """
+
+    def setUp(self) -> None:
+        self.event_store = MagicMock()
+        services = MagicMock()
+        services.database = DatabaseTestAdapter
+        services.permission = PermissionTestAdapter
+        services.event_store.return_value = self.event_store
+        self.handler = ActionsHandler(services=services, logging=MagicMock())
+        self.handler.retry_backoff = 0
+        self.payload: Payload = [
+            {
+                "action": "agenda_item.update",
+                "data": [{"id": 3393211712, "content_object_id": "topic/5756367535"}],
+            }
+        ]
+        self.user_id = 5968705978
+
+    def test_retry_on_model_locked(self) -> None:
+        self.event_store.send.side_effect = [ModelLocked("Locked."), None]
+        retries = retry_stats["retries"]
+        result = self.handler.handle_request(self.payload, self.user_id)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(self.event_store.send.call_count, 2)
+        self.assertEqual(retry_stats["retries"], retries + 1)
+        # The payload itself must not be changed.
+        self.assertEqual(
+            self.payload[0]["data"],
+            [{"id": 3393211712, "content_object_id": "topic/5756367535"}],
+        )
+
+    def test_retry_limit(self) -> None:
+        self.event_store.send.side_effect = ModelLocked("Locked.")
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.handle_request(self.payload, self.user_id)
+        self.assertEqual(context_manager.exception.message, "Locked.")
+        self.assertEqual(self.event_store.send.call_count, self.handler.max_retries + 1)
+
+    def test_retry_stats_threads(self) -> None:
+        requests = retry_stats["requests"]
+
+        def count() -> None:
+            for _ in range(1000):
+                count_retry_stat("requests")
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(retry_stats["requests"], requests + 8000)
+
+
+class ActionsHandlerCompactionTester(TestCase):
+    """
+    Tests the compaction of write request elements in the actions handler.
+    """
+
+    def setUp(self) -> None:
+        services = MagicMock()
+        services.database = DatabaseTestAdapter
+        services.permission = PermissionTestAdapter
+        self.handler = ActionsHandler(services=services, logging=MagicMock())
+        self.handler.user_id = 5968705978
+        self.payload: Payload = [
+            {
+                "action": "topic.create",
+                "data": [
+                    {"meeting_id": 2393342057, "title": "title_ohHee9thie"},
+                    {"meeting_id": 2393342057, "title": "title_Ooch4eeph8"},
+                ],
+            },
+            {
+                "action": "topic.update",
+                "data": [{"id": 1312354708, "title": "title_Oeph9ahjai"}],
+            },
+        ]
+
+    def test_no_compaction(self) -> None:
+        self.handler.write_request_compaction = None
+        result = list(self.handler.parse_actions(self.payload))
+        self.assertEqual(len(result), 3)
+
+    def test_action_compaction(self) -> None:
+        result = list(self.handler.parse_actions(self.payload))
+        self.assertEqual(len(result), 2)
+        self.assertEqual(
+            [event["type"] for event in result[0]["events"]],
+            ["create", "create", "update"],
+        )
+        self.assertEqual(
+            result[0]["events"][2]["fields"], {"topic_ids": [42, 43]},
+        )
+
+    def test_payload_compaction(self) -> None:
+        self.handler.write_request_compaction = "payload"
+        result = list(self.handler.parse_actions(self.payload))
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            [event["type"] for event in result[0]["events"]],
+            ["create", "create", "update", "update"],
+        )
+
+
+class ActionsHandlerSeparatelyTester(TestCase):
+    """
+    Tests the actions handler in non atomic mode.
+    """
+
+    def setUp(self) -> None:
+        self.event_store = MagicMock()
+        services = MagicMock()
+        services.database = DatabaseTestAdapter
+        services.permission = PermissionTestAdapter
+        services.event_store.return_value = self.event_store
+        self.handler = ActionsHandler(services=services, logging=MagicMock())
+        self.handler.retry_backoff = 0
+        self.user_id = 5968705978
+        self.payload: Payload = [
+            {
+                "action": "topic.update",
+                "data": [{"id": 1312354708, "title": "title_eiThu4ooqu"}],
+            },
+            {"action": "action_Eixie4ahvo", "data": [{"id": 1312354708}]},
+            {"action": "topic.create", "data": [{"meeting_id": 2393342057}]},
+            {
+                "action": "topic.create",
+                "data": [{"meeting_id": 2393342057, "title": "title_yoh6Eehi5u"}],
+            },
+        ]
+
+    def test_results(self) -> None:
+        result = self.handler.handle_request(self.payload, self.user_id, atomic=False)
+        self.assertEqual(
+            [element["success"] for element in result], [True, False, False, True]
+        )
+        self.assertEqual(
+            result[1]["message"], "Action action_Eixie4ahvo does not exist."
+        )
+        self.assertIn("must contain ['meeting_id', 'title']", result[2]["message"])
+        self.event_store.send.assert_called_once()
+        write_request_elements = self.event_store.send.call_args[0][0]
+        self.assertEqual(len(write_request_elements), 2)
+
+    def test_conflicting_actions(self) -> None:
+        # Both actions update meeting/2393342057/topic_ids so the second one
+        # has to read the result of the first one.
+        payload: Payload = [
+            self.payload[3],
+            {
+                "action": "topic.create",
+                "data": [{"meeting_id": 2393342057, "title": "title_ahB5quaeNg"}],
+            },
+        ]
+        result = self.handler.handle_request(payload, self.user_id, atomic=False)
+        self.assertEqual([element["success"] for element in result], [True, True])
+        self.assertEqual(self.event_store.send.call_count, 2)
+
+    def test_nonexistent_object(self) -> None:
+        payload: Payload = [
+            self.payload[0],
+            {
+                "action": "topic.update",
+                "data": [{"id": 4389952307, "title": "title_Ohm6ohgh9i"}],
+            },
+            self.payload[3],
+        ]
+        result = self.handler.handle_request(payload, self.user_id, atomic=False)
+        self.assertEqual(
+            [element["success"] for element in result], [True, False, True]
+        )
+        self.assertIn("4389952307", result[1]["message"])
+        self.event_store.send.assert_called_once()
+        write_request_elements = self.event_store.send.call_args[0][0]
+        self.assertEqual(len(write_request_elements), 2)
+
+    def test_retry_on_model_locked(self) -> None:
+        self.event_store.send.side_effect = [ModelLocked("Locked."), None]
+        result = self.handler.handle_request(self.payload, self.user_id, atomic=False)
+        self.assertEqual(
+            [element["success"] for element in result], [True, False, False, True]
+        )
+        self.assertEqual(self.event_store.send.call_count, 2)
+
+    def test_event_store_error(self) -> None:
+        self.event_store.send.side_effect = EventStoreException("Error.")
+        result = self.handler.handle_request(self.payload, self.user_id, atomic=False)
+        self.assertEqual(
+            [element["message"] for element in result],
+            [
+                "Error.",
+                "Action action_Eixie4ahvo does not exist.",
+                result[2]["message"],
+                "Error.",
+            ],
+        )
+
+
+class ActionsHandlerPlanTester(TestCase):
+    """
+    Tests the merging of actions in the actions handler.
+    """
+
+    def setUp(self) -> None:
+        services = MagicMock()
+        services.database = DatabaseTestAdapter
+        services.permission = PermissionTestAdapter
+        self.handler = ActionsHandler(services=services, logging=MagicMock())
+        self.handler.user_id = 5968705978
+
+    def test_plan_actions(self) -> None:
+        payload: Payload = [
+            {"action": "topic.update", "data": [{"id": 1, "title": "title_1"}]},
+            {"action": "topic.update", "data": [{"id": 2, "title": "title_2"}]},
+            {"action": "topic.delete", "data": [{"id": 3}]},
+            {"action": "topic.update", "data": [{"id": 4, "title": "title_4"}]},
+            {"action": "topic.update", "data": [{"id": 4, "text": "text_4"}]},
+            {"action": "motion.sort", "data": {"meeting_id": 5}},
+            {"action": "motion.sort", "data": {"meeting_id": 6}},
+        ]
+        planned_payload = self.handler.plan_actions(payload)
+        self.assertEqual(
+            planned_payload,
+            [
+                {
+                    "action": "topic.update",
+                    "data": [
+                        {"id": 1, "title": "title_1"},
+                        {"id": 2, "title": "title_2"},
+                    ],
+                },
+                payload[2],
+                payload[3],
+                payload[4],
+                payload[5],
+                payload[6],
+            ],
+        )
+        # The payload itself must not be changed.
+        self.assertEqual(payload[0]["data"], [{"id": 1, "title": "title_1"}])
+
+    def test_plan_actions_equal_instances(self) -> None:
+        payload: Payload = [
+            {"action": "topic.create", "data": [{"meeting_id": 1, "title": "a"}]},
+            {"action": "topic.create", "data": [{"meeting_id": 1, "title": "b"}]},
+            {"action": "topic.create", "data": [{"title": "a", "meeting_id": 1}]},
+        ]
+        planned_payload = self.handler.plan_actions(payload)
+        self.assertEqual(
+            planned_payload,
+            [
+                {
+                    "action": "topic.create",
+                    "data": [
+                        {"meeting_id": 1, "title": "a"},
+                        {"meeting_id": 1, "title": "b"},
+                    ],
+                },
+                {"action": "topic.create", "data": [{"title": "a", "meeting_id": 1}]},
+            ],
+        )
+
+    def test_merged_relations(self) -> None:
+        payload: Payload = [
+            {
+                "action": "topic.create",
+                "data": [{"meeting_id": 2393342057, "title": "title_Xoo1oocooJ"}],
+            },
+            {
+                "action": "topic.create",
+                "data": [{"meeting_id": 2393342057, "title": "title_ieJ3oex0ph"}],
+            },
+        ]
+        result = list(self.handler.parse_actions(payload))
+        self.assertEqual(len(result), 1)
+        # Both new topics are added to the meeting.
+        self.assertEqual(result[0]["events"][2]["fields"], {"topic_ids": [42, 43]})
+
+    def test_no_merge(self) -> None:
+        self.handler.merge_actions = False
+        payload: Payload = [
+            {
+                "action": "topic.create",
+                "data": [{"meeting_id": 2393342057, "title": "title_iez6Eemoo4"}],
+            },
+            {
+                "action": "topic.create",
+                "data": [{"meeting_id": 2393342057, "title": "title_Ahdah6iesh"}],
+            },
+        ]
+        result = list(self.handler.parse_actions(payload))
+        self.assertEqual(len(result), 2)
@@ -1,6 +1,9 @@
 from unittest import TestCase
 
-from openslides_backend.actions.base import merge_write_request_elements
+from openslides_backend.actions.base import (
+    compact_write_request_elements,
+    merge_write_request_elements,
+)
 from openslides_backend.shared.interfaces import WriteRequestElement
 
 from ..utils import get_fqfield, get_fqid
@@ -79,3 +82,78 @@ class ActionsBaseTester(TestCase):
             context_manager.exception.args,
             ("You can not merge two write request elements of different users.",),
         )
+
+    def test_merge_does_not_change_input(self) -> None:
+        merge_write_request_elements(
+            (self.write_request_element_1, self.write_request_element_2)
+        )
+        self.assertEqual(
+            self.write_request_element_1["information"],
+            {get_fqid("collection_Chebie1jie/42"): ["Information text laPu7iepei"]},
+        )
+
+    def test_compact_write_request_elements(self) -> None:
+        write_request_element_3 = WriteRequestElement(
+            events=[
+                {
+                    "type": "update",
+                    "fqid": get_fqid("collection_Chebie1jie/42"),
+                    "fields": {
+                        "field_ade8neipaiG": "test_value_Ohth1ohgh5",
+                        "field_Ve0ahqu0ah": "test_value_Goo8oongae",
+                    },
+                },
+                {"type": "delete", "fqid": get_fqid("collection_Chebie1jie/43")},
+                {
+                    "type": "update",
+                    "fqid": get_fqid("collection_Chebie1jie/43"),
+                    "fields": {"field_ade8neipaiG": "test_value_eiZ6chohj2"},
+                },
+            ],
+            information={},
+            user_id=1,
+            locked_fields={get_fqfield("collection_Chebie1jie/43/deleted"): 3},
+        )
+        result = compact_write_request_elements(
+            (
+                self.write_request_element_1,
+                self.write_request_element_2,
+                write_request_element_3,
+            )
+        )
+        self.assertEqual(
+            result["events"],
+            [
+                {
+                    "type": "create",
+                    "fqid": get_fqid("collection_Chebie1jie/42"),
+                    "fields": {"field_aeXahloPh1": "test_value_lah8chiiLi"},
+                },
+                {
+                    "type": "update",
+                    "fqid": get_fqid("collection_Chebie1jie/42"),
+                    "fields": {
+                        "field_ade8neipaiG": "test_value_Ohth1ohgh5",
+                        "field_Ve0ahqu0ah": "test_value_Goo8oongae",
+                    },
+                },
+                {"type": "delete", "fqid": get_fqid("collection_Chebie1jie/43")},
+                {
+                    "type": "update",
+                    "fqid": get_fqid("collection_Chebie1jie/43"),
+                    "fields": {"field_ade8neipaiG": "test_value_eiZ6chohj2"},
+                },
+            ],
+        )
+        self.assertEqual(
+            result["locked_fields"],
+            {
+                get_fqfield("collection_Chebie1jie/42/field_aeXahloPh1"): 1,
+                get_fqfield("collection_Chebie1jie/43/deleted"): 3,
+            },
+        )
+        # The input must not be changed.
+        self.assertEqual(
+            self.write_request_element_2["events"][0]["fields"],
+            {"field_ade8neipaiG": "test_value_zeeto6Aine"},
+        )
@@ -0,0 +1,108 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.actions.cascade import CascadeHandler
+from openslides_backend.actions.generics import DeleteAction
+from openslides_backend.models import fields
+from openslides_backend.models.base import Model
+from openslides_backend.shared.patterns import Collection
+
+
+class FakeModelCascade(Model):
+    """
+    Fake model for testing purposes. Children are deleted with their parent.
+    """
+
+    collection = Collection("fake_model_cascade")
+    verbose_name = "fake_model_cascade"
+
+    id = fields.IdField(description="The id of this fake model.")
+    meeting_id = fields.IntegerField(description="The meeting of this fake model.")
+    parent_id = fields.ForeignKeyField(
+        description="The parent of this fake model.",
+        to=Collection("fake_model_cascade"),
+        related_name="child_ids",
+        on_delete="cascade",
+    )
+
+
+class FakeModelCascadeDelete(DeleteAction):
+    model = FakeModelCascade()
+    permissions = ["permission_ohz8Aeyei4"]
+
+
+class CascadeHandlerTester(TestCase):
+    def setUp(self) -> None:
+        # Tree 1 -> 2, 3 and 2 -> 4 and a cycle 4 -> 1.
+        data = {1: [2, 3], 2: [4], 3: [], 4: [1]}
+        self.database = MagicMock()
+        self.database.getMany.side_effect = lambda collection, ids, mapped_fields: (
+            {id: {"child_ids": data[id]} for id in ids},
+            1,
+        )
+        self.handler = CascadeHandler(self.database, MagicMock())
+
+    def test_get_cascade(self) -> None:
+        result = self.handler.get_cascade(Collection("fake_model_cascade"), [1])
+        self.assertEqual(result, {Collection("fake_model_cascade"): [1, 2, 3, 4]})
+        # One request per level.
+        self.assertEqual(
+            [call[0][1] for call in self.database.getMany.call_args_list],
+            [[1], [2, 3], [4]],
+        )
+
+    def test_no_cascade_fields(self) -> None:
+        result = self.handler.get_cascade(Collection("fake_model_Eeh8ohNgoo"), [1])
+        self.assertEqual(result, {Collection("fake_model_Eeh8ohNgoo"): [1]})
+        self.database.getMany.assert_not_called()
+
+    def test_invalid_on_delete(self) -> None:
+        with self.assertRaises(ValueError):
+            fields.ForeignKeyField(
+                description="Invalid field.",
+                to=Collection("fake_model_cascade"),
+                related_name="invalid_ids",
+                on_delete="invalid_value_Hoh6aeth3a",
+            )
+
+
+class DeleteActionCascadeTester(TestCase):
+    def setUp(self) -> None:
+        # Tree 1 -> 2, 3 and 2 -> 4.
+        children = {1: [2, 3], 2: [4], 3: [], 4: []}
+        parents = {1: None, 2: 1, 3: 1, 4: 2}
+
+        def get_many(collection, ids, mapped_fields=None):  # type: ignore
+            result = {}
+            for id in ids:
+                instance = {
+                    "meeting_id": 1,
+                    "parent_id": parents[id],
+                    "child_ids": children[id],
+                }
+                result[id] = {
+                    field: value
+                    for field, value in instance.items()
+                    if mapped_fields is None or field in mapped_fields
+                }
+            return result, 1
+
+        database = MagicMock()
+        database.getMany.side_effect = get_many
+        database.get.side_effect = lambda fqid, mapped_fields=None: (
+            get_many(fqid.collection, [fqid.id], mapped_fields)[0][fqid.id],
+            1,
+        )
+        permission = MagicMock()
+        permission.has_perms.side_effect = lambda user_id, permissions: {
+            permission: True for permission in permissions
+        }
+        self.action = FakeModelCascadeDelete(permission, database)
+        self.action.user_id = 1
+
+    def test_repeated_id(self) -> None:
+        dataset = self.action.prepare_dataset([{"id": 1}, {"id": 1}])
+        self.assertEqual(
+            sorted(element["instance"]["id"] for element in dataset["data"]),
+            [1, 1, 2, 3, 4],
+        )
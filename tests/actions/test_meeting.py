@@ -1,9 +1,12 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from openslides_backend.actions import ActionPayload
+from openslides_backend.actions.base import compact_write_request_elements
 from openslides_backend.actions.meeting.create import MeetingCreate
 from openslides_backend.actions.meeting.delete import MeetingDelete
 from openslides_backend.actions.meeting.update import MeetingUpdate
+from openslides_backend.services.database import DatabaseCache
 from openslides_backend.shared.exceptions import ActionException, PermissionDenied
 
 from ..fake_services.database import DatabaseTestAdapter
@@ -291,7 +294,7 @@ class BaseMeetingDeleteActionTester(TestCase):
 
     def setUp(self) -> None:
         self.valid_payload_1 = [{"id": 3908439961}]
-        self.invalid_payload_1 = [
+        self.valid_payload_2 = [
             {"id": 3908439961},
             {"id": 7816466305},
         ]
@@ -309,7 +312,7 @@ class MeetingDeleteActionUnitTester(BaseMeetingDeleteActionTester):
         self.action.validate(self.valid_payload_1)
 
     def test_validation_correct_2(self) -> None:
-        self.action.validate(self.invalid_payload_1)
+        self.action.validate(self.valid_payload_2)
 
     def test_prepare_dataset_1(self) -> None:
         dataset = self.action.prepare_dataset(self.valid_payload_1)
@@ -336,13 +339,23 @@ class MeetingDeleteActionUnitTester(BaseMeetingDeleteActionTester):
         )
 
     def test_prepare_dataset_2(self) -> None:
-        with self.assertRaises(ActionException) as context_manager:
-            self.action.prepare_dataset(self.invalid_payload_1)
+        # The topic of meeting 7816466305 is deleted, too.
+        dataset = self.action.prepare_dataset(self.valid_payload_2)
         self.assertEqual(
-            context_manager.exception.message,
-            "You are not allowed to delete meeting 7816466305 as long as there are "
-            "some required related objects (see topic_ids).",
+            [element["instance"]["id"] for element in dataset["data"]],
+            [3908439961, 7816466305, 1312354708],
         )
+        self.assertEqual(str(dataset["data"][2]["model"].collection), "topic")
+        self.assertEqual(
+            dataset["data"][1]["relations"],
+            {
+                get_fqfield("committee/5914213969/meeting_ids"): {
+                    "type": "remove",
+                    "value": [],
+                },
+            },
+        )
+        self.assertEqual(dataset["data"][2]["relations"], {})
 
 
 class MeetingDeleteActionPerformTester(BaseMeetingDeleteActionTester):
@@ -383,13 +396,27 @@ class MeetingDeleteActionPerformTester(BaseMeetingDeleteActionTester):
         result = list(write_request_elements)
         self.assertEqual(result, expected)
 
-    def test_perform_incorrect_1(self) -> None:
-        with self.assertRaises(ActionException) as context_manager:
-            self.action.perform(self.invalid_payload_1, user_id=self.user_id)
+    def test_perform_correct_2(self) -> None:
+        write_request_elements = self.action.perform(
+            self.valid_payload_2, user_id=self.user_id
+        )
+        events = [
+            event
+            for write_request_element in write_request_elements
+            for event in write_request_element["events"]
+        ]
         self.assertEqual(
-            context_manager.exception.message,
-            "You are not allowed to delete meeting 7816466305 as long as there are "
-            "some required related objects (see topic_ids).",
+            events,
+            [
+                {"type": "delete", "fqid": get_fqid("meeting/3908439961")},
+                {"type": "delete", "fqid": get_fqid("meeting/7816466305")},
+                {
+                    "type": "update",
+                    "fqid": get_fqid("committee/5914213969"),
+                    "fields": {"meeting_ids": []},
+                },
+                {"type": "delete", "fqid": get_fqid("topic/1312354708")},
+            ],
         )
 
     def test_perform_no_permission_1(self) -> None:
@@ -398,7 +425,7 @@ class MeetingDeleteActionPerformTester(BaseMeetingDeleteActionTester):
 
     def test_perform_no_permission_2(self) -> None:
         with self.assertRaises(PermissionDenied):
-            self.action.perform(self.invalid_payload_1, user_id=4796568680)
+            self.action.perform(self.valid_payload_2, user_id=4796568680)
 
 
 class MeetingDeleteActionWSGITester(BaseMeetingDeleteActionTester):
@@ -418,17 +445,12 @@ class MeetingDeleteActionWSGITester(BaseMeetingDeleteActionTester):
         )
         self.assertEqual(response.status_code, 200)
 
-    def test_wsgi_request_incorrect_2(self) -> None:
+    def test_wsgi_request_correct_2(self) -> None:
         client = Client(self.application, ResponseWrapper)
         response = client.post(
-            "/", json=[{"action": "meeting.delete", "data": self.invalid_payload_1}],
-        )
-        self.assertEqual(response.status_code, 400)
-        self.assertIn(
-            "You are not allowed to delete meeting 7816466305 as long as there are "
-            "some required related objects (see topic_ids).",
-            str(response.data),
+            "/", json=[{"action": "meeting.delete", "data": self.valid_payload_2}],
         )
+        self.assertEqual(response.status_code, 200)
 
 
 class MeetingDeleteActionWSGITesterNoPermission(BaseMeetingDeleteActionTester):
@@ -449,6 +471,75 @@ class MeetingDeleteActionWSGITesterNoPermission(BaseMeetingDeleteActionTester):
     def test_wsgi_request_no_permission_2(self) -> None:
         client = Client(self.application, ResponseWrapper)
         response = client.post(
-            "/", json=[{"action": "meeting.delete", "data": self.invalid_payload_1}],
+            "/", json=[{"action": "meeting.delete", "data": self.valid_payload_2}],
         )
         self.assertEqual(response.status_code, 403)
+
+
+class MeetingDeleteActionCascadeTester(TestCase):
+    """
+    Tests the meeting delete action with topics, agenda items and motions that
+    are deleted together with the meeting.
+    """
+
+    def setUp(self) -> None:
+        self.database = MagicMock(wraps=DatabaseTestAdapter())
+        self.action = MeetingDelete(
+            PermissionTestAdapter(), DatabaseCache(self.database)
+        )
+        self.user_id = (
+            7121641734  # This user has perm MEETING_CAN_MANAGE for some committees.
+        )
+
+    def test_perform_cascade(self) -> None:
+        write_request_element = compact_write_request_elements(
+            self.action.perform([{"id": 4120596520}], user_id=self.user_id)
+        )
+        self.assertEqual(
+            write_request_element["events"],
+            [
+                {"type": "delete", "fqid": get_fqid("meeting/4120596520")},
+                {
+                    "type": "update",
+                    "fqid": get_fqid("committee/6105873523"),
+                    "fields": {"meeting_ids": []},
+                },
+                {"type": "delete", "fqid": get_fqid("agenda_item/8826592230")},
+                {"type": "delete", "fqid": get_fqid("topic/2911473815")},
+                {
+                    "type": "update",
+                    "fqid": get_fqid("mediafile/3265393893"),
+                    "fields": {"attachment_ids": []},
+                },
+                {"type": "delete", "fqid": get_fqid("topic/6738457103")},
+                {"type": "delete", "fqid": get_fqid("motion/5083460329")},
+                {"type": "delete", "fqid": get_fqid("motion/7470372640")},
+                {
+                    "type": "update",
+                    "fqid": get_fqid("motion_state/2355286710"),
+                    "fields": {"motion_ids": []},
+                },
+            ],
+        )
+        self.assertEqual(
+            write_request_element["information"][get_fqid("mediafile/3265393893")],
+            ["Object attachment to topic reset"],
+        )
+
+    def test_round_trips(self) -> None:
+        list(self.action.perform([{"id": 4120596520}], user_id=self.user_id))
+        # One request per collection per level and one per collection for the
+        # related objects.
+        self.assertEqual(
+            [str(call[0][0]) for call in self.database.getMany.call_args_list],
+            [
+                "meeting",
+                "meeting",
+                "committee",
+                "agenda_item",
+                "topic",
+                "mediafile",
+                "motion",
+                "motion_state",
+            ],
+        )
@@ -2,6 +2,7 @@ import time
 from copy import deepcopy
 from typing import Any, Dict
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from openslides_backend.actions.motion.delete import MotionDelete
 from openslides_backend.actions.motion.sort import MotionSort
@@ -641,31 +642,11 @@ class MotionSortActionUnitTester(BaseMotionSortActionTester):
     def test_prepare_dataset_1(self) -> None:
         dataset = self.action.prepare_dataset(self.valid_payload_1)
         expected: Dict[int, Dict[str, Any]] = {
-            3265963568: {
-                "sort_parent_id": None,
-                "sort_weight": 2,
-                "sort_children_ids": [],
-            },
-            2279328478: {
-                "sort_parent_id": None,
-                "sort_weight": 4,
-                "sort_children_ids": [],
-            },
-            1082050467: {
-                "sort_parent_id": None,
-                "sort_weight": 6,
-                "sort_children_ids": [],
-            },
-            8000824551: {
-                "sort_parent_id": None,
-                "sort_weight": 8,
-                "sort_children_ids": [],
-            },
-            2995885358: {
-                "sort_parent_id": None,
-                "sort_weight": 10,
-                "sort_children_ids": [],
-            },
+            3265963568: {"sort_weight": 2},
+            2279328478: {"sort_weight": 4},
+            1082050467: {"sort_weight": 6, "sort_child_ids": []},
+            8000824551: {"sort_parent_id": None, "sort_weight": 8},
+            2995885358: {"sort_weight": 10},
         }
         self.assertEqual(dataset["position"], 1)
         self.assertEqual(dataset["data"], expected)
@@ -673,35 +654,94 @@ class MotionSortActionUnitTester(BaseMotionSortActionTester):
     def test_prepare_dataset_2(self) -> None:
         dataset = self.action.prepare_dataset(self.valid_payload_2)
         expected = {
-            3265963568: {
-                "sort_parent_id": None,
-                "sort_weight": 2,
-                "sort_children_ids": [2279328478],
-            },
+            3265963568: {"sort_weight": 2, "sort_child_ids": [2279328478]},
             2279328478: {
                 "sort_parent_id": 3265963568,
                 "sort_weight": 4,
-                "sort_children_ids": [8000824551, 1082050467],
+                "sort_child_ids": [8000824551, 1082050467],
             },
             1082050467: {
                 "sort_parent_id": 2279328478,
                 "sort_weight": 8,
-                "sort_children_ids": [],
-            },
-            8000824551: {
-                "sort_parent_id": 2279328478,
-                "sort_weight": 6,
-                "sort_children_ids": [],
-            },
-            2995885358: {
-                "sort_parent_id": None,
-                "sort_weight": 10,
-                "sort_children_ids": [],
+                "sort_child_ids": [],
             },
+            8000824551: {"sort_parent_id": 2279328478, "sort_weight": 6},
+            2995885358: {"sort_weight": 10},
         }
         self.assertEqual(dataset["position"], 1)
         self.assertEqual(dataset["data"], expected)
 
+    def test_prepare_dataset_unchanged_nodes(self) -> None:
+        database = MagicMock()
+        database.filter.return_value = (
+            {
+                3265963568: {"sort_weight": 2, "sort_child_ids": []},
+                2279328478: {"sort_weight": 4},
+                1082050467: {"sort_weight": 8, "sort_child_ids": [8000824551]},
+                8000824551: {"sort_weight": 6},
+                2995885358: {"sort_weight": 10, "sort_parent_id": None},
+            },
+            1,
+        )
+        self.action = MotionSort(PermissionTestAdapter(), database)
+        self.action.user_id = 7826715669
+        dataset = self.action.prepare_dataset(self.valid_payload_1)
+        self.assertEqual(
+            database.filter.call_args[1]["mapped_fields"],
+            ["sort_weight", "sort_parent_id", "sort_child_ids"],
+        )
+        self.assertEqual(
+            dataset["data"],
+            {
+                3265963568: {},
+                2279328478: {},
+                1082050467: {"sort_weight": 6, "sort_child_ids": []},
+                8000824551: {"sort_weight": 8},
+                2995885358: {},
+            },
+        )
+
+    def test_create_write_request_elements_unchanged(self) -> None:
+        write_request_elements = self.action.create_write_request_elements(
+            {"position": 1, "data": {3265963568: {}, 2279328478: {}}}
+        )
+        self.assertEqual(list(write_request_elements), [])
+
+    def test_create_write_request_elements_locks_unchanged_nodes(self) -> None:
+        self.action.user_id = 7826715669
+        write_request_elements = list(
+            self.action.create_write_request_elements(
+                {
+                    "position": 1,
+                    "data": {3265963568: {"sort_weight": 2}, 2279328478: {}},
+                }
+            )
+        )
+        self.assertEqual(len(write_request_elements), 1)
+        self.assertEqual(
+            write_request_elements[0]["events"],
+            [
+                {
+                    "type": "update",
+                    "fqid": get_fqid("motion/3265963568"),
+                    "fields": {"sort_weight": 2},
+                }
+            ],
+        )
+        self.assertEqual(
+            write_request_elements[0]["locked_fields"],
+            {
+                get_fqfield(f"motion/{id}/{field}"): 1
+                for id in (3265963568, 2279328478)
+                for field in (
+                    "deleted",
+                    "sort_weight",
+                    "sort_parent_id",
+                    "sort_child_ids",
+                )
+            },
+        )
+
     def test_circular_dataset(self) -> None:
         with self.assertRaises(ActionException) as context_manager:
             self.action.prepare_dataset(self.circular_payload)
@@ -728,80 +768,59 @@ class MotionSortActionPerformTester(BaseMotionSortActionTester):
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/3265963568"),
-                        "fields": {
-                            "sort_parent_id": None,
-                            "sort_children_ids": [],
-                            "sort_weight": 2,
-                        },
-                    }
-                ],
-                "information": {get_fqid("motion/3265963568"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/3265963568/deleted"): 1},
-            },
-            {
-                "events": [
+                        "fields": {"sort_weight": 2},
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/2279328478"),
-                        "fields": {
-                            "sort_parent_id": None,
-                            "sort_weight": 4,
-                            "sort_children_ids": [],
-                        },
-                    }
-                ],
-                "information": {get_fqid("motion/2279328478"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/2279328478/deleted"): 1},
-            },
-            {
-                "events": [
+                        "fields": {"sort_weight": 4},
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/1082050467"),
-                        "fields": {
-                            "sort_weight": 6,
-                            "sort_parent_id": None,
-                            "sort_children_ids": [],
-                        },
-                    }
-                ],
-                "information": {get_fqid("motion/1082050467"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/1082050467/deleted"): 1},
-            },
-            {
-                "events": [
+                        "fields": {"sort_weight": 6, "sort_child_ids": []},
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/8000824551"),
-                        "fields": {
-                            "sort_parent_id": None,
-                            "sort_weight": 8,
-                            "sort_children_ids": [],
-                        },
-                    }
-                ],
-                "information": {get_fqid("motion/8000824551"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/8000824551/deleted"): 1},
-            },
-            {
-                "events": [
+                        "fields": {"sort_parent_id": None, "sort_weight": 8},
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/2995885358"),
-                        "fields": {
-                            "sort_parent_id": None,
-                            "sort_weight": 10,
-                            "sort_children_ids": [],
-                        },
-                    }
+                        "fields": {"sort_weight": 10},
+                    },
                 ],
-                "information": {get_fqid("motion/2995885358"): ["Object sorted"]},
+                "information": {
+                    get_fqid("motion/3265963568"): ["Object sorted"],
+                    get_fqid("motion/2279328478"): ["Object sorted"],
+                    get_fqid("motion/1082050467"): ["Object sorted"],
+                    get_fqid("motion/8000824551"): ["Object sorted"],
+                    get_fqid("motion/2995885358"): ["Object sorted"],
+                },
                 "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/2995885358/deleted"): 1},
+                "locked_fields": {
+                    get_fqfield("motion/3265963568/deleted"): 1,
+                    get_fqfield("motion/3265963568/sort_weight"): 1,
+                    get_fqfield("motion/3265963568/sort_parent_id"): 1,
+                    get_fqfield("motion/3265963568/sort_child_ids"): 1,
+                    get_fqfield("motion/2279328478/deleted"): 1,
+                    get_fqfield("motion/2279328478/sort_weight"): 1,
+                    get_fqfield("motion/2279328478/sort_parent_id"): 1,
+                    get_fqfield("motion/2279328478/sort_child_ids"): 1,
+                    get_fqfield("motion/1082050467/deleted"): 1,
+                    get_fqfield("motion/1082050467/sort_weight"): 1,
+                    get_fqfield("motion/1082050467/sort_parent_id"): 1,
+                    get_fqfield("motion/1082050467/sort_child_ids"): 1,
+                    get_fqfield("motion/8000824551/deleted"): 1,
+                    get_fqfield("motion/8000824551/sort_weight"): 1,
+                    get_fqfield("motion/8000824551/sort_parent_id"): 1,
+                    get_fqfield("motion/8000824551/sort_child_ids"): 1,
+                    get_fqfield("motion/2995885358/deleted"): 1,
+                    get_fqfield("motion/2995885358/sort_weight"): 1,
+                    get_fqfield("motion/2995885358/sort_parent_id"): 1,
+                    get_fqfield("motion/2995885358/sort_child_ids"): 1,
+                },
             },
         ]
         self.assertEqual(
@@ -818,86 +837,116 @@ class MotionSortActionPerformTester(BaseMotionSortActionTester):
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/3265963568"),
-                        "fields": {
-                            "sort_parent_id": None,
-                            "sort_children_ids": [2279328478],
-                            "sort_weight": 2,
-                        },
-                    }
-                ],
-                "information": {get_fqid("motion/3265963568"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/3265963568/deleted"): 1},
-            },
-            {
-                "events": [
+                        "fields": {"sort_weight": 2, "sort_child_ids": [2279328478]},
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/2279328478"),
                         "fields": {
                             "sort_parent_id": 3265963568,
                             "sort_weight": 4,
-                            "sort_children_ids": [8000824551, 1082050467],
+                            "sort_child_ids": [8000824551, 1082050467],
                         },
-                    }
-                ],
-                "information": {get_fqid("motion/2279328478"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/2279328478/deleted"): 1},
-            },
-            {
-                "events": [
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/8000824551"),
-                        "fields": {
-                            "sort_parent_id": 2279328478,
-                            "sort_weight": 6,
-                            "sort_children_ids": [],
-                        },
-                    }
-                ],
-                "information": {get_fqid("motion/8000824551"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/8000824551/deleted"): 1},
-            },
-            {
-                "events": [
+                        "fields": {"sort_parent_id": 2279328478, "sort_weight": 6},
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/1082050467"),
                         "fields": {
-                            "sort_weight": 8,
                             "sort_parent_id": 2279328478,
-                            "sort_children_ids": [],
+                            "sort_weight": 8,
+                            "sort_child_ids": [],
                         },
-                    }
-                ],
-                "information": {get_fqid("motion/1082050467"): ["Object sorted"]},
-                "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/1082050467/deleted"): 1},
-            },
-            {
-                "events": [
+                    },
                     {
                         "type": "update",
                         "fqid": get_fqid("motion/2995885358"),
-                        "fields": {
-                            "sort_parent_id": None,
-                            "sort_weight": 10,
-                            "sort_children_ids": [],
-                        },
-                    }
+                        "fields": {"sort_weight": 10},
+                    },
                 ],
-                "information": {get_fqid("motion/2995885358"): ["Object sorted"]},
+                "information": {
+                    get_fqid("motion/3265963568"): ["Object sorted"],
+                    get_fqid("motion/2279328478"): ["Object sorted"],
+                    get_fqid("motion/8000824551"): ["Object sorted"],
+                    get_fqid("motion/1082050467"): ["Object sorted"],
+                    get_fqid("motion/2995885358"): ["Object sorted"],
+                },
                 "user_id": self.user_id,
-                "locked_fields": {get_fqfield("motion/2995885358/deleted"): 1},
+                "locked_fields": {
+                    get_fqfield("motion/3265963568/deleted"): 1,
+                    get_fqfield("motion/3265963568/sort_weight"): 1,
+                    get_fqfield("motion/3265963568/sort_parent_id"): 1,
+                    get_fqfield("motion/3265963568/sort_child_ids"): 1,
+                    get_fqfield("motion/2279328478/deleted"): 1,
+                    get_fqfield("motion/2279328478/sort_weight"): 1,
+                    get_fqfield("motion/2279328478/sort_parent_id"): 1,
+                    get_fqfield("motion/2279328478/sort_child_ids"): 1,
+                    get_fqfield("motion/8000824551/deleted"): 1,
+                    get_fqfield("motion/8000824551/sort_weight"): 1,
+                    get_fqfield("motion/8000824551/sort_parent_id"): 1,
+                    get_fqfield("motion/8000824551/sort_child_ids"): 1,
+                    get_fqfield("motion/1082050467/deleted"): 1,
+                    get_fqfield("motion/1082050467/sort_weight"): 1,
+                    get_fqfield("motion/1082050467/sort_parent_id"): 1,
+                    get_fqfield("motion/1082050467/sort_child_ids"): 1,
+                    get_fqfield("motion/2995885358/deleted"): 1,
+                    get_fqfield("motion/2995885358/sort_weight"): 1,
+                    get_fqfield("motion/2995885358/sort_parent_id"): 1,
+                    get_fqfield("motion/2995885358/sort_child_ids"): 1,
+                },
             },
         ]
         self.assertEqual(
             list(write_request_elements), expected,
         )
 
+    def test_perform_deep_tree(self) -> None:
+        database = MagicMock()
+        database.filter.return_value = ({id: {} for id in range(1, 5001)}, 1)
+        self.action = MotionSort(PermissionTestAdapter(), database)
+        root: Dict[str, Any] = {"id": 1}
+        node = root
+        for id in range(2, 5001):
+            node["children"] = [{"id": id}]
+            node = node["children"][0]
+        write_request_elements = list(
+            self.action.perform(
+                {"meeting_id": self.meeting_id, "nodes": [root]}, user_id=self.user_id
+            )
+        )
+        self.assertEqual(len(write_request_elements), 1)
+        events = write_request_elements[0]["events"]
+        self.assertEqual(len(events), 5000)
+        self.assertEqual(
+            events[-1]["fields"], {"sort_weight": 10000, "sort_parent_id": 4999},
+        )
+
+    def test_perform_deep_tree_invalid_node(self) -> None:
+        database = MagicMock()
+        database.filter.return_value = ({id: {} for id in range(1, 5001)}, 1)
+        self.action = MotionSort(PermissionTestAdapter(), database)
+        root: Dict[str, Any] = {"id": 1}
+        node = root
+        for id in range(2, 5001):
+            node["children"] = [{"id": id}]
+            node = node["children"][0]
+        node["id"] = "text_Oor9aiLei4"
+        with self.assertRaises(ActionException) as context_manager:
+            list(
+                self.action.perform(
+                    {"meeting_id": self.meeting_id, "nodes": [root]},
+                    user_id=self.user_id,
+                )
+            )
+        self.assertEqual(
+            context_manager.exception.message,
+            "Invalid node in sort tree below 4999: data.id must be integer",
+        )
+
 
 class MotionSortActionWSGITester(BaseMotionSortActionTester):
     def setUp(self) -> None:
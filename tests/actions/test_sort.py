@@ -0,0 +1,182 @@
+import os
+import timeit
+from copy import deepcopy
+from typing import Any, Dict, List
+from unittest import TestCase
+
+import pytest
+from fastjsonschema import JsonSchemaException  # type: ignore
+
+from openslides_backend.actions.sort import TreeSortHandler, create_sort_schema
+from openslides_backend.models.motion import Motion
+from openslides_backend.shared.exceptions import ActionException
+
+
+def create_tree(count: int, depth: int) -> List[Dict[str, Any]]:
+    """
+    Returns root nodes of chains with the given depth containing count nodes
+    with the ids 1 to count.
+    """
+    nodes: List[Dict[str, Any]] = []
+    parent: Dict[str, Any] = {}
+    for id in range(1, count + 1):
+        node: Dict[str, Any] = {"id": id}
+        if (id - 1) % depth == 0:
+            nodes.append(node)
+        else:
+            parent["children"] = [node]
+        parent = node
+    return nodes
+
+
+class TreeSortHandlerTester(TestCase):
+    """
+    Tests the generic tree sort handler.
+    """
+
+    def setUp(self) -> None:
+        self.handler = TreeSortHandler("weight", "parent_id", "child_ids")
+        self.nodes: List[Dict[str, Any]] = [
+            {"id": 1, "children": [{"id": 2, "children": [{"id": 4}, {"id": 3}]}]},
+            {"id": 5},
+        ]
+
+    def test_sort(self) -> None:
+        result = self.handler.sort(self.nodes, {1, 2, 3, 4, 5})
+        self.assertEqual(
+            result,
+            {
+                1: {"weight": 2, "parent_id": None, "child_ids": [2]},
+                2: {"weight": 4, "parent_id": 1, "child_ids": [4, 3]},
+                4: {"weight": 6, "parent_id": 2, "child_ids": []},
+                3: {"weight": 8, "parent_id": 2, "child_ids": []},
+                5: {"weight": 10, "parent_id": None, "child_ids": []},
+            },
+        )
+        self.assertEqual(list(result), [1, 2, 4, 3, 5])
+
+    def test_sort_does_not_change_nodes(self) -> None:
+        nodes = deepcopy(self.nodes)
+        self.handler.sort(nodes, {1, 2, 3, 4, 5})
+        self.assertEqual(nodes, self.nodes)
+
+    def test_sort_deep_tree(self) -> None:
+        nodes = create_tree(5000, 5000)
+        result = self.handler.sort(nodes, set(range(1, 5001)))
+        self.assertEqual(result[5000]["parent_id"], 4999)
+        self.assertEqual(result[5000]["weight"], 10000)
+
+    def test_sort_duplicate_id(self) -> None:
+        self.nodes.append({"id": 3})
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.sort(self.nodes, {1, 2, 3, 4, 5})
+        self.assertEqual(
+            context_manager.exception.message, "Duplicate id in sort tree: 3"
+        )
+
+    def test_sort_unknown_id(self) -> None:
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.sort(self.nodes, {1, 2, 3, 5})
+        self.assertEqual(
+            context_manager.exception.message, "Id in sort tree does not exist: 4"
+        )
+
+    def test_sort_missing_ids(self) -> None:
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.sort(self.nodes, set(range(1, 17)))
+        self.assertEqual(
+            context_manager.exception.message,
+            "Did not receive 16 ids, got 5. "
+            "Missing ids: 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, ...",
+        )
+
+    def test_get_changes(self) -> None:
+        sort_fields = self.handler.sort(self.nodes, {1, 2, 3, 4, 5})
+        db_instances: Dict[int, Dict[str, Any]] = {
+            1: {"weight": 2, "child_ids": [2]},
+            2: {"weight": 4, "parent_id": 1, "child_ids": [3, 4]},
+            3: {"weight": 6, "parent_id": 2},
+            4: {"weight": 8, "parent_id": 2, "child_ids": []},
+            5: {"weight": 10, "parent_id": None},
+        }
+        self.assertEqual(
+            self.handler.get_changes(sort_fields, db_instances),
+            {2: {"child_ids": [4, 3]}, 3: {"weight": 8}, 4: {"weight": 6}},
+        )
+
+
+class SortSchemaTester(TestCase):
+    """
+    Tests the validation of sort trees.
+    """
+
+    def setUp(self) -> None:
+        self.schema = create_sort_schema(
+            Motion(), title="Test sort schema", description="Test nodes."
+        )
+        self.handler = TreeSortHandler("weight", "parent_id", "child_ids")
+
+    def test_valid(self) -> None:
+        nodes = create_tree(100, 20)
+        self.schema({"meeting_id": 1, "nodes": nodes})
+        self.handler.sort(nodes, set(range(1, 101)))
+
+    def test_invalid_root(self) -> None:
+        with self.assertRaises(JsonSchemaException):
+            self.schema({"meeting_id": 1, "nodes": [1]})
+
+    def test_invalid_deep_node(self) -> None:
+        nodes = create_tree(20, 20)
+        node = nodes[0]
+        while node.get("children"):
+            node = node["children"][0]
+        node["wrong_field"] = "text_ahs7Eexah9"
+        self.schema({"meeting_id": 1, "nodes": nodes})
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.sort(nodes, set(range(1, 21)))
+        self.assertEqual(
+            context_manager.exception.message,
+            "Invalid node in sort tree below 19: "
+            "data must contain only specified properties",
+        )
+
+    def test_invalid_empty_children(self) -> None:
+        nodes: List[Dict[str, Any]] = [
+            {"id": 1, "children": [{"id": 2}]},
+            {"id": 3, "children": []},
+        ]
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.sort(nodes, {1, 2, 3})
+        self.assertEqual(
+            context_manager.exception.message,
+            "Invalid node in sort tree below None: "
+            "data.children must contain at least 1 items",
+        )
+
+
+@pytest.mark.skipif(
+    not os.environ.get("OPENSLIDES_BACKEND_RUN_ALL_TESTS"), reason="Test is very slow."
+)
+class TreeSortBenchmark(TestCase):
+    """
+    Validates and sorts trees with 50000 nodes and depth 20.
+    """
+
+    def run_benchmark(self, count: int) -> float:
+        schema = create_sort_schema(
+            Motion(), title="Benchmark sort schema", description="Benchmark nodes."
+        )
+        handler = TreeSortHandler("weight", "parent_id", "child_ids")
+        nodes = create_tree(count, 20)
+        all_ids = set(range(1, count + 1))
+
+        def statement() -> None:
+            schema({"meeting_id": 1, "nodes": nodes})
+            handler.sort(nodes, all_ids)
+
+        return min(timeit.repeat(statement, number=1, repeat=5))
+
+    def test_linear(self) -> None:
+        small = self.run_benchmark(5000)
+        large = self.run_benchmark(50000)
+        self.assertLess(large, small * 20)
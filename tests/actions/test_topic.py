@@ -1,9 +1,11 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from openslides_backend.actions import ActionPayload
 from openslides_backend.actions.topic.create import TopicCreate
 from openslides_backend.actions.topic.delete import TopicDelete
 from openslides_backend.actions.topic.update import TopicUpdate
+from openslides_backend.services.database import DatabaseCache
 from openslides_backend.shared.exceptions import ActionException, PermissionDenied
 
 from ..fake_services.database import TESTDATA, DatabaseTestAdapter
@@ -166,6 +168,61 @@ class TopicCreateActionUnitTester(BaseTopicCreateActionTester):
             f"User must have topic.can_manage permission for meeting_id {unknown_meeting}.",
         )
 
+    def test_prepare_dataset_prefetch(self) -> None:
+        database = MagicMock(wraps=DatabaseTestAdapter())
+        action = TopicCreate(PermissionTestAdapter(), DatabaseCache(database))
+        action.user_id = self.action.user_id
+        payload = self.valid_payload_1 + self.valid_payload_2
+        dataset = action.prepare_dataset(payload)
+        self.assertEqual([element["new_id"] for element in dataset["data"]], [42, 43])
+        database.reserveIds.assert_called_once()
+        # One call for all meetings and one call for all mediafiles.
+        self.assertEqual(database.getMany.call_count, 2)
+
+    def test_prepare_dataset_bulk_permission_check(self) -> None:
+        permission = MagicMock(wraps=PermissionTestAdapter())
+        action = TopicCreate(permission, DatabaseTestAdapter())
+        action.user_id = self.action.user_id
+        action.prepare_dataset(self.valid_payload_1 + self.valid_payload_2)
+        permission.has_perms.assert_called_once_with(
+            self.action.user_id,
+            ["2393342057/topic.can_manage", "4002059810/topic.can_manage"],
+        )
+
+    def test_prepare_dataset_same_attachment(self) -> None:
+        payload = [
+            {
+                "meeting_id": 3611987967,
+                "title": "title_Iesh4pheiz",
+                "attachment_ids": [self.attachments[1]],
+            },
+            {
+                "meeting_id": 3611987967,
+                "title": "title_ua3Bah6fah",
+                "attachment_ids": [self.attachments[1]],
+            },
+        ]
+        dataset = self.action.prepare_dataset(payload)
+        self.assertEqual(
+            dataset["data"][1]["relations"],
+            {
+                get_fqfield("meeting/3611987967/topic_ids"): {
+                    "type": "add",
+                    "value": [6375863023, 6259289755, 42, 43],
+                },
+                get_fqfield(f"mediafile/{self.attachments[1]}/attachment_ids"): {
+                    "type": "add",
+                    "value": [get_fqid("topic/42"), get_fqid("topic/43")],
+                },
+            },
+        )
+        write_request_elements = list(
+            self.action.create_write_request_elements(dataset)
+        )
+        self.assertEqual(
+            [len(element["events"]) for element in write_request_elements], [1, 3]
+        )
+
 
 class TopicCreateActionPerformTester(BaseTopicCreateActionTester):
     def setUp(self) -> None:
@@ -1,6 +1,7 @@
 from copy import deepcopy
 from typing import Any, Dict, List, Tuple
 
+from openslides_backend.shared.exceptions import DatabaseException
 from openslides_backend.shared.filters import Filter, FilterOperator
 from openslides_backend.shared.patterns import Collection, FullQualifiedId
 
@@ -175,6 +176,69 @@ TESTDATA = [
         "id": 3393211712,
         "fields": {"meeting_id": 9079236097, "content_object_id": "topic/5756367535"},
     },
+    # Cascade test:
+    {
+        "collection": "committee",
+        "id": 6105873523,
+        "fields": {"meeting_ids": [4120596520]},
+    },
+    {
+        "collection": "meeting",
+        "id": 4120596520,
+        "fields": {
+            "committee_id": 6105873523,
+            "topic_ids": [2911473815, 6738457103],
+            "agenda_item_ids": [8826592230],
+            "motion_ids": [5083460329, 7470372640],
+        },
+    },
+    {
+        "collection": "topic",
+        "id": 2911473815,
+        "fields": {
+            "meeting_id": 4120596520,
+            "agenda_item_id": 8826592230,
+            "attachment_ids": [3265393893],
+        },
+    },
+    {"collection": "topic", "id": 6738457103, "fields": {"meeting_id": 4120596520}},
+    {
+        "collection": "agenda_item",
+        "id": 8826592230,
+        "fields": {"meeting_id": 4120596520, "content_object_id": "topic/2911473815"},
+    },
+    {
+        "collection": "mediafile",
+        "id": 3265393893,
+        "fields": {
+            "attachment_ids": [
+                FullQualifiedId(collection=Collection("topic"), id=2911473815)
+            ]
+        },
+    },
+    {
+        "collection": "motion",
+        "id": 5083460329,
+        "fields": {
+            "meeting_id": 4120596520,
+            "state_id": 2355286710,
+            "amendment_ids": [7470372640],
+        },
+    },
+    {
+        "collection": "motion",
+        "id": 7470372640,
+        "fields": {
+            "meeting_id": 4120596520,
+            "state_id": 2355286710,
+            "lead_motion_id": 5083460329,
+        },
+    },
+    {
+        "collection": "motion_state",
+        "id": 2355286710,
+        "fields": {"motion_ids": [5083460329, 7470372640]},
+    },
 ]  # type: List[Dict[str, Any]]
 
 
@@ -211,13 +275,15 @@ class DatabaseTestAdapter:
                 result[data["id"]] = element
         if len(ids) != len(result):
             # Something was not found.
-            print(collection, ids, result)
-            raise RuntimeError
+            raise DatabaseException(f"Some of {collection} {ids} do not exist.")
         return (result, 1)
 
     def getId(self, collection: Collection) -> Tuple[int, int]:
         return (42, 1)
 
+    def reserveIds(self, collection: Collection, amount: int) -> Tuple[List[int], int]:
+        return (list(range(42, 42 + amount)), 1)
+
     def exists(self, collection: Collection, ids: List[int]) -> Tuple[bool, int]:
         for id in ids:
             for data in TESTDATA:
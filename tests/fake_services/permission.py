@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Dict, List
 
 from openslides_backend.shared.permissions.committee import COMMITTEE_CAN_MANAGE
 from openslides_backend.shared.permissions.meeting import MEETING_CAN_MANAGE
@@ -16,7 +16,10 @@ TESTDATA = {
         f"7816466305/{TOPIC_CAN_MANAGE}",
         f"9079236097/{TOPIC_CAN_MANAGE}",
     ],
-    7121641734: [f"5914213969/{MEETING_CAN_MANAGE}"],
+    7121641734: [
+        f"5914213969/{MEETING_CAN_MANAGE}",
+        f"6105873523/{MEETING_CAN_MANAGE}",
+    ],
     7668157706: [f"1/{COMMITTEE_CAN_MANAGE}"],
     7826715669: [f"5562405520/{MOTION_CAN_MANAGE}"],
     3265963568: [f"5562405520/{MOTION_CAN_MANAGE_METADATA}"],
@@ -37,5 +40,10 @@ class PermissionTestAdapter:
     def has_perm(self, user_id: int, permission: str) -> bool:
         return permission in TESTDATA.get(user_id, [])
 
+    def has_perms(self, user_id: int, permissions: List[str]) -> Dict[str, bool]:
+        return {
+            permission: self.has_perm(user_id, permission) for permission in permissions
+        }
+
     def get_all(self, user_id: int) -> List[str]:
         return TESTDATA.get(user_id, [])
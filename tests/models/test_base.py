@@ -91,6 +91,37 @@ class ActionsBaseTester(TestCase):
         self.assertEqual(field_name, "fake_model_2_generic_ids")
         self.assertEqual(str(field.own_collection), "fake_model_2")
 
+    def test_get_relation_fields(self) -> None:
+        self.assertEqual(
+            ["generic_relation_field", "relation_field"],
+            [field_name for field_name, _ in FakeModel2().get_relation_fields()],
+        )
+        self.assertFalse(FakeModel2.has_structured_relation)
+        self.assertTrue(FakeModel2.has_generic_relation)
+        self.assertFalse(FakeModel.has_generic_relation)
+
+    def test_reverse_relations_of_later_model(self) -> None:
+        class FakeModel3(Model):
+            collection = Collection("fake_model_3")
+            verbose_name = "fake_model_3"
+
+            id = fields.IdField(description="The id of this fake model.")
+
+        self.assertEqual(len(FakeModel3().get_reverse_relations()), 0)
+
+        class FakeModel4(Model):
+            collection = Collection("fake_model_4")
+            verbose_name = "fake_model_4"
+
+            relation_field = fields.ForeignKeyField(
+                description="The foreign key to fake_model_3.",
+                to=Collection("fake_model_3"),
+                related_name="fake_model_4_ids",
+            )
+
+        field = FakeModel3().get_field("fake_model_4_ids")
+        self.assertIs(field, FakeModel4.relation_field)
+
     def test_get_field_normal_field(self) -> None:
         field = FakeModel().get_field("text")
         self.assertEqual(field.description, "The text of this fake model.")
@@ -1,9 +1,13 @@
 import json
+import threading
+import time
+from typing import Any, Dict
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from openslides_backend.presenter import PresenterBlob
-from openslides_backend.presenter.presenter import PresenterHandler
+from openslides_backend.presenter.base import Presenter
+from openslides_backend.presenter.presenter import PresenterHandler, presenters_map
 from openslides_backend.shared.exceptions import PresenterException
 
 from ..utils import Client, ResponseWrapper, create_test_application
@@ -62,6 +66,93 @@ class PresenterBaseUnitTester(TestCase):
         self.assertEqual(response, expected)
 
 
+class SlowPresenter(Presenter):
+    """
+    Presenter that waits until all slow presenters of the request run.
+    """
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    @property
+    def data(self) -> Dict[Any, Any]:
+        self.barrier.wait()
+        return {"thread": threading.current_thread().name}
+
+
+class HangingPresenter(Presenter):
+    calls = 0
+
+    @property
+    def data(self) -> Dict[Any, Any]:
+        HangingPresenter.calls += 1
+        time.sleep(0.5)
+        return {}
+
+
+class PresenterConcurrencyTester(TestCase):
+    def setUp(self) -> None:
+        self.presenter_handler = PresenterHandler(
+            logging=MagicMock(), services=MagicMock(),
+        )
+        presenters_map["slow_Ooph4iu3ai"] = SlowPresenter
+        presenters_map["hanging_Ohsh7eiGhu"] = HangingPresenter
+        HangingPresenter.calls = 0
+
+    def tearDown(self) -> None:
+        del presenters_map["slow_Ooph4iu3ai"]
+        del presenters_map["hanging_Ohsh7eiGhu"]
+
+    def test_concurrent_order(self) -> None:
+        payload = [
+            PresenterBlob(presenter="slow_Ooph4iu3ai", data={"index": 1}),
+            PresenterBlob(presenter="initial-data", data={}),
+            PresenterBlob(presenter="slow_Ooph4iu3ai", data={"index": 2}),
+        ]
+        response = self.presenter_handler.handle_request(payload=payload, user_id=0)
+        self.assertEqual(len(response), 3)
+        self.assertEqual(response[1]["theme"], "openslides-default")
+        self.assertNotEqual(response[0]["thread"], response[2]["thread"])
+
+    def test_timeout(self) -> None:
+        self.presenter_handler.timeout = 0.1
+        payload = [
+            PresenterBlob(presenter="hanging_Ohsh7eiGhu", data={}),
+            PresenterBlob(presenter="whoami", data={}),
+        ]
+        with self.assertRaises(PresenterException) as context_manager:
+            self.presenter_handler.handle_request(payload=payload, user_id=0)
+        self.assertEqual(
+            context_manager.exception.message,
+            "Presenters did not finish within 0.1 seconds.",
+        )
+
+    def test_timeout_cancels_pending_presenters(self) -> None:
+        self.presenter_handler.timeout = 0.1
+        self.presenter_handler.max_workers = 1
+        payload = [
+            PresenterBlob(presenter="hanging_Ohsh7eiGhu", data={"index": 1}),
+            PresenterBlob(presenter="hanging_Ohsh7eiGhu", data={"index": 2}),
+        ]
+        with self.assertRaises(PresenterException):
+            self.presenter_handler.handle_request(payload=payload, user_id=0)
+        time.sleep(0.6)
+        self.assertEqual(HangingPresenter.calls, 1)
+        logger: Any = self.presenter_handler.logger
+        logger.warning.assert_called_once_with(
+            "Presenters did not finish within 0.1 seconds. 1 of them are still running."
+        )
+
+    def test_sequential(self) -> None:
+        self.presenter_handler.max_workers = 0
+        payload = [
+            PresenterBlob(presenter="whoami", data={}),
+            PresenterBlob(presenter="initial-data", data={}),
+        ]
+        response = self.presenter_handler.handle_request(payload=payload, user_id=0)
+        self.assertEqual(response[0]["auth_type"], "default")
+        self.assertEqual(response[1]["theme"], "openslides-default")
+
+
 class PresenterBaseWSGITester(TestCase):
     def setUp(self) -> None:
         self.user_id = 0
@@ -117,3 +208,56 @@ class PresenterBaseWSGITester(TestCase):
             }
         ]
         self.assertEqual(json.loads(response.data), expected)
+
+    def test_wsgi_etag(self) -> None:
+        client = Client(self.application, ResponseWrapper)
+        response = client.get("/", json=[{"presenter": "initial-data"}])
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+        response = client.get(
+            "/", json=[{"presenter": "initial-data"}], headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_wsgi_etag_other_payload(self) -> None:
+        client = Client(self.application, ResponseWrapper)
+        response = client.get("/", json=[{"presenter": "initial-data"}])
+        etag = response.headers["ETag"]
+        response = client.get(
+            "/",
+            json=[{"presenter": "initial-data", "data": {"key": "value_Kai3ohqu1u"}}],
+            headers={"If-None-Match": etag},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_wsgi_cached_body(self) -> None:
+        client = Client(self.application, ResponseWrapper)
+        first_response = client.get("/", json=[{"presenter": "initial-data"}])
+        with patch(
+            "openslides_backend.presenter.presenter.PresenterHandler.parse_presenters"
+        ) as parse_presenters:
+            response = client.get("/", json=[{"presenter": "initial-data"}])
+        parse_presenters.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, first_response.data)
+
+    def test_wsgi_no_etag(self) -> None:
+        client = Client(self.application, ResponseWrapper)
+        response = client.get(
+            "/", json=[{"presenter": "initial-data"}, {"presenter": "whoami"}]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+
+    def test_wsgi_streamed(self) -> None:
+        client = Client(self.application, ResponseWrapper)
+        payload = [{"presenter": "whoami"}, {"presenter": "initial-data"}]
+        response = client.get("/", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Length", response.headers)
+        self.assertEqual(
+            json.loads(response.data)[0]["auth_type"], "default",
+        )
@@ -6,6 +6,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock
 
 import pytest  # type: ignore
+import requests
 import simplejson as json
 
 from openslides_backend.main import create_wsgi_application
@@ -178,3 +179,90 @@ class AuthenticationHTTPAdapterTester(TestCase):
             response = client.post("/system/api/actions", json=[])
             self.assertEqual(response.status_code, 400)
             self.assertIn("Authentication service sends HTTP 500.", str(response.data))
+
+
+class AuthenticationCacheTester(TestCase):
+    """
+    Tests the cache of the authentication adapter without a real server.
+    """
+
+    def setUp(self) -> None:
+        self.session = MagicMock()
+        self.session.post.return_value.ok = True
+        self.session.post.return_value.content = b'{"user_id": 3847291034}'
+        self.auth = AuthenticationHTTPAdapter(
+            authentication_url="http://localhost:9000",
+            logging=MagicMock(),
+            session=self.session,
+        )
+        self.headers = MagicMock()
+        self.headers.to_wsgi_list.return_value = [
+            ("Cookie", "session=ieNg4oow1a"),
+            ("User-Agent", "agent_Xae7ohphai"),
+        ]
+
+    def test_cache_hit(self) -> None:
+        self.assertEqual(self.auth.get_user(self.headers), 3847291034)
+        self.assertEqual(self.auth.get_user(self.headers), 3847291034)
+        self.assertEqual(self.session.post.call_count, 1)
+        stats = self.auth.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_irrelevant_headers(self) -> None:
+        self.auth.get_user(self.headers)
+        other_headers = MagicMock()
+        other_headers.to_wsgi_list.return_value = [
+            ("Cookie", "session=ieNg4oow1a"),
+            ("User-Agent", "agent_ohkie3Aequ"),
+        ]
+        self.auth.get_user(other_headers)
+        self.assertEqual(self.session.post.call_count, 1)
+
+    def test_other_session(self) -> None:
+        self.auth.get_user(self.headers)
+        other_headers = MagicMock()
+        other_headers.to_wsgi_list.return_value = [("Cookie", "session=Ohl0Iec5ah")]
+        self.auth.get_user(other_headers)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_invalidate(self) -> None:
+        self.auth.get_user(self.headers)
+        self.auth.invalidate(self.headers)
+        self.auth.get_user(self.headers)
+        self.auth.invalidate_user(3847291034)
+        self.auth.get_user(self.headers)
+        self.assertEqual(self.session.post.call_count, 3)
+
+    def test_negative_cache_ttl(self) -> None:
+        self.session.post.return_value.content = b'{"user_id": 0}'
+        self.auth.negative_cache_ttl = 0
+        self.auth.get_user(self.headers)
+        self.auth.get_user(self.headers)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_errors_are_not_cached(self) -> None:
+        self.session.post.return_value.ok = False
+        self.session.post.return_value.status_code = 500
+        for _ in range(2):
+            with self.assertRaises(AuthenticationException):
+                self.auth.get_user(self.headers)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_connection_error(self) -> None:
+        self.session.post.side_effect = requests.exceptions.ConnectionError(
+            "Connection refused."
+        )
+        self.assertEqual(self.auth.get_user(self.headers), 0)
+
+    def test_timeout(self) -> None:
+        self.session.post.side_effect = requests.exceptions.ReadTimeout(
+            "Read timed out."
+        )
+        for _ in range(2):
+            with self.assertRaises(AuthenticationException) as context_manager:
+                self.auth.get_user(self.headers)
+            self.assertEqual(
+                context_manager.exception.message,
+                "Request to authentication service failed. Error: Read timed out.",
+            )
+        self.assertEqual(self.session.post.call_count, 2)
@@ -1,8 +1,12 @@
 from unittest.mock import Mock
 
+import pytest
+import requests
+
 import openslides_backend.services.database as database
 import openslides_backend.services.database.commands as commands
 from openslides_backend.services.database.adapter.interface import GetManyRequest
+from openslides_backend.shared.exceptions import DatabaseException
 from openslides_backend.shared.filters import FilterOperator, Or
 from openslides_backend.shared.patterns import Collection, FullQualifiedId
 
@@ -172,3 +176,27 @@ def test_max() -> None:
         "field": field,
     }
     engine.exists.called_with(command)
+
+
+def test_reserveIds() -> None:
+    collection = Collection("a")
+    command = commands.ReserveIds(collection=collection, amount=3)
+    engine.reserveIds.return_value = {"ids": [4, 5, 6], "position": 1}
+    ids, position = db.reserveIds(collection=collection, amount=3)
+    assert ids == [4, 5, 6]
+    assert position == 1
+    assert command.data == {"collection": str(collection), "amount": 3}
+    engine.reserveIds.assert_called_with(command)
+
+
+def test_http_engine_timeout() -> None:
+    session = Mock()
+    session.post.side_effect = requests.exceptions.ReadTimeout("Read timed out.")
+    http_engine = database.HTTPEngine("http://localhost:8001", log, session=session)
+    command = commands.Get(fqid=FullQualifiedId(Collection("a"), 1), mappedFields=["f"])
+    with pytest.raises(DatabaseException) as exception_info:
+        http_engine.get(command)
+    assert (
+        exception_info.value.message
+        == "Connection to database failed. Error: Read timed out."
+    )
@@ -0,0 +1,72 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.services.database import DatabaseCache
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+from ..fake_services.database import DatabaseTestAdapter
+
+
+class DatabaseCacheTester(TestCase):
+    """
+    Tests the request-scoped database cache.
+    """
+
+    def setUp(self) -> None:
+        self.database = MagicMock(wraps=DatabaseTestAdapter())
+        self.cache = DatabaseCache(self.database)
+        self.fqid = FullQualifiedId(Collection("topic"), 6259289755)
+
+    def test_get_twice(self) -> None:
+        first, position = self.cache.get(self.fqid, mapped_fields=["meeting_id"])
+        second, _ = self.cache.get(self.fqid, mapped_fields=["meeting_id"])
+        self.assertEqual(first, {"meeting_id": 3611987967})
+        self.assertEqual(first, second)
+        self.assertEqual(position, 1)
+        self.assertEqual(self.database.getMany.call_count, 1)
+
+    def test_get_merges_mapped_fields(self) -> None:
+        self.cache.get(self.fqid, mapped_fields=["meeting_id"])
+        self.cache.get(self.fqid, mapped_fields=["meeting_id", "attachment_ids"])
+        self.database.getMany.assert_called_with(
+            Collection("topic"), [6259289755], mapped_fields=["attachment_ids"]
+        )
+        result, _ = self.cache.get(self.fqid, mapped_fields=["attachment_ids"])
+        self.assertEqual(result, {"attachment_ids": [3549387598]})
+        self.assertEqual(self.database.getMany.call_count, 2)
+
+    def test_get_unknown_field(self) -> None:
+        self.cache.get(self.fqid, mapped_fields=["unknown_field_Ohr0eiqu3a"])
+        result, _ = self.cache.get(
+            self.fqid, mapped_fields=["unknown_field_Ohr0eiqu3a"]
+        )
+        self.assertEqual(result, {})
+        self.assertEqual(self.database.getMany.call_count, 1)
+
+    def test_get_whole_model(self) -> None:
+        self.cache.get(self.fqid)
+        result, _ = self.cache.get(self.fqid, mapped_fields=["title"])
+        self.assertEqual(result, {"title": "title_ub0eeYushu"})
+        self.assertEqual(self.database.getMany.call_count, 1)
+
+    def test_get_many_partially_cached(self) -> None:
+        self.cache.get(self.fqid, mapped_fields=["meeting_id"])
+        result, _ = self.cache.getMany(
+            Collection("topic"), [6259289755, 6375863023], mapped_fields=["meeting_id"]
+        )
+        self.assertEqual(
+            result,
+            {
+                6259289755: {"meeting_id": 3611987967},
+                6375863023: {"meeting_id": 3611987967},
+            },
+        )
+        self.database.getMany.assert_called_with(
+            Collection("topic"), [6375863023], mapped_fields=["meeting_id"]
+        )
+
+    def test_result_is_a_copy(self) -> None:
+        result, _ = self.cache.get(self.fqid, mapped_fields=["attachment_ids"])
+        result["attachment_ids"].append(7583920032)
+        result, _ = self.cache.get(self.fqid, mapped_fields=["attachment_ids"])
+        self.assertEqual(result, {"attachment_ids": [3549387598]})
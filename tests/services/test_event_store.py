@@ -0,0 +1,96 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import requests
+
+from openslides_backend.services.event_store import EventStoreHTTPAdapter
+from openslides_backend.shared import codec
+from openslides_backend.shared.exceptions import EventStoreException, ModelLocked
+from openslides_backend.shared.interfaces import WriteRequestElement
+
+from ..utils import get_fqfield, get_fqid
+
+
+class EventStoreHTTPAdapterTester(TestCase):
+    def setUp(self) -> None:
+        self.session = MagicMock()
+        self.event_store = EventStoreHTTPAdapter(
+            "http://localhost:9003/", logging=MagicMock(), session=self.session
+        )
+        self.write_request_element = WriteRequestElement(
+            events=[
+                {
+                    "type": "update",
+                    "fqid": get_fqid("agenda_item/3393211712"),
+                    "fields": {"content_object_id": get_fqid("topic/5756367535")},
+                },
+                {"type": "delete", "fqid": get_fqid("topic/1312354708")},
+            ],
+            information={get_fqid("agenda_item/3393211712"): ["Object updated"]},
+            user_id=5968705978,
+            locked_fields={get_fqfield("agenda_item/3393211712/deleted"): 1},
+        )
+
+    def test_send(self) -> None:
+        self.session.post.return_value = MagicMock(ok=True)
+        self.event_store.send([self.write_request_element])
+        payload = self.session.post.call_args[1]["data"]
+        self.assertNotIn(b'": ', payload)
+        self.assertEqual(
+            codec.loads(payload),
+            [
+                {
+                    "events": [
+                        {
+                            "type": "update",
+                            "fqid": "agenda_item/3393211712",
+                            "fields": {"content_object_id": "topic/5756367535"},
+                        },
+                        {"type": "delete", "fqid": "topic/1312354708"},
+                    ],
+                    "information": {"agenda_item/3393211712": ["Object updated"]},
+                    "user_id": 5968705978,
+                    "locked_fields": {"agenda_item/3393211712/deleted": 1},
+                }
+            ],
+        )
+
+    def test_send_model_locked(self) -> None:
+        response = MagicMock(ok=False, status_code=400)
+        response.content = codec.dumpb(
+            {"error": {"type": "ModelLocked", "message": "Model is locked."}}
+        )
+        self.session.post.return_value = response
+        with self.assertRaises(ModelLocked) as context_manager:
+            self.event_store.send([self.write_request_element])
+        self.assertEqual(context_manager.exception.message, "Model is locked.")
+
+    def test_send_error(self) -> None:
+        response = MagicMock(ok=False, status_code=500)
+        response.content = b"<html>Internal Server Error</html>"
+        self.session.post.return_value = response
+        with self.assertRaises(EventStoreException) as context_manager:
+            self.event_store.send([self.write_request_element])
+        self.assertEqual(
+            context_manager.exception.message,
+            "Event store sends HTTP 500. Error: None",
+        )
+
+    def test_send_connection_error(self) -> None:
+        self.session.post.side_effect = requests.exceptions.ConnectionError(
+            "Connection refused."
+        )
+        with self.assertRaises(EventStoreException) as context_manager:
+            self.event_store.send([self.write_request_element])
+        self.assertEqual(
+            context_manager.exception.message,
+            "Connection to event store failed. Error: Connection refused.",
+        )
+
+    def test_send_without_debug_logging(self) -> None:
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = False
+        self.event_store.logger = logger
+        self.session.post.return_value = MagicMock(ok=True)
+        self.event_store.send([self.write_request_element])
+        logger.debug.assert_not_called()
@@ -0,0 +1,66 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.services.permission import PermissionCache
+from openslides_backend.shared.permissions.topic import TOPIC_CAN_MANAGE
+
+from ..fake_services.permission import PermissionTestAdapter
+
+
+class PermissionCacheTester(TestCase):
+    """
+    Tests the request-scoped permission cache.
+    """
+
+    def setUp(self) -> None:
+        self.permission = MagicMock(wraps=PermissionTestAdapter())
+        self.cache = PermissionCache(self.permission)
+        self.user_id = 5968705978
+
+    def test_has_perm_twice(self) -> None:
+        self.assertTrue(
+            self.cache.has_perm(self.user_id, f"3611987967/{TOPIC_CAN_MANAGE}")
+        )
+        self.assertTrue(
+            self.cache.has_perm(self.user_id, f"3611987967/{TOPIC_CAN_MANAGE}")
+        )
+        self.assertEqual(self.permission.has_perms.call_count, 1)
+        self.assertEqual(self.cache.stats, {"hits": 1, "misses": 1, "requests": 1})
+
+    def test_negative_decision(self) -> None:
+        self.assertFalse(
+            self.cache.has_perm(self.user_id, f"1730810210/{TOPIC_CAN_MANAGE}")
+        )
+        self.assertFalse(
+            self.cache.has_perm(self.user_id, f"1730810210/{TOPIC_CAN_MANAGE}")
+        )
+        self.assertEqual(self.permission.has_perms.call_count, 1)
+
+    def test_has_perms_only_asks_missing(self) -> None:
+        self.cache.has_perm(self.user_id, f"3611987967/{TOPIC_CAN_MANAGE}")
+        result = self.cache.has_perms(
+            self.user_id,
+            [f"3611987967/{TOPIC_CAN_MANAGE}", f"1730810210/{TOPIC_CAN_MANAGE}"],
+        )
+        self.assertEqual(
+            result,
+            {
+                f"3611987967/{TOPIC_CAN_MANAGE}": True,
+                f"1730810210/{TOPIC_CAN_MANAGE}": False,
+            },
+        )
+        self.permission.has_perms.assert_called_with(
+            self.user_id, [f"1730810210/{TOPIC_CAN_MANAGE}"]
+        )
+
+    def test_decisions_per_user(self) -> None:
+        self.cache.has_perm(self.user_id, f"3611987967/{TOPIC_CAN_MANAGE}")
+        self.assertFalse(self.cache.has_perm(0, f"3611987967/{TOPIC_CAN_MANAGE}"))
+        self.assertEqual(self.permission.has_perms.call_count, 2)
+
+    def test_preload(self) -> None:
+        cache = PermissionCache(self.permission, preload=True)
+        self.assertTrue(cache.has_perm(self.user_id, f"3611987967/{TOPIC_CAN_MANAGE}"))
+        self.assertFalse(cache.has_perm(self.user_id, f"1730810210/{TOPIC_CAN_MANAGE}"))
+        self.permission.get_all.assert_called_once_with(self.user_id)
+        self.permission.has_perms.assert_not_called()
@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from unittest import TestCase
+
+from openslides_backend.services.session import HTTPSessionPool
+
+
+class KeepAliveRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler for fake server that keeps connections alive.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class HTTPSessionPoolTester(TestCase):
+    def setUp(self) -> None:
+        self.httpd = HTTPServer(("localhost", 0), KeepAliveRequestHandler)
+        self.url = f"http://localhost:{self.httpd.server_port}/"
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def test_connection_reuse(self) -> None:
+        session = HTTPSessionPool(pool_size=2, timeout=1, retries=0)
+        for _ in range(3):
+            response = session.post(self.url, data="{}")
+            self.assertEqual(response.json(), {})
+        self.assertEqual(
+            session.get_stats(),
+            {"requests": 3, "connections": 1, "reused_connections": 2},
+        )
+
+    def test_stats_without_requests(self) -> None:
+        session = HTTPSessionPool()
+        self.assertEqual(
+            session.get_stats(),
+            {"requests": 0, "connections": 0, "reused_connections": 0},
+        )
+
+    def test_concurrent_requests(self) -> None:
+        httpd = ThreadingHTTPServer(("localhost", 0), KeepAliveRequestHandler)
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.start()
+        try:
+            session = HTTPSessionPool(pool_size=4, timeout=1, retries=0)
+            url = f"http://localhost:{httpd.server_port}/"
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                responses = list(
+                    executor.map(lambda _: session.post(url, data="{}"), range(20))
+                )
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(session.get_stats()["requests"], 20)
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from openslides_backend.shared.cache import TTLCache
+
+
+class TTLCacheTester(TestCase):
+    """
+    Tests the bounded LRU cache with time to live.
+    """
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache = TTLCache(max_size=2, ttl=10, clock=lambda: self.now)
+
+    def test_get_and_set(self) -> None:
+        self.assertIsNone(self.cache.get("key_ooGh4uxaeC"))
+        self.cache.set("key_ooGh4uxaeC", 42)
+        self.assertEqual(self.cache.get("key_ooGh4uxaeC"), 42)
+        self.assertEqual(
+            self.cache.get_stats(), {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+        )
+
+    def test_expiry(self) -> None:
+        self.cache.set("key_Ahcoh3ieFo", 42)
+        self.cache.set("key_Ool4ohThei", 43, ttl=20)
+        self.now = 10.0
+        self.assertIsNone(self.cache.get("key_Ahcoh3ieFo"))
+        self.assertEqual(self.cache.get("key_Ool4ohThei"), 43)
+
+    def test_lru_eviction(self) -> None:
+        self.cache.set("key_Eiquei2aiy", 1)
+        self.cache.set("key_oe9Eec1Ahc", 2)
+        self.cache.get("key_Eiquei2aiy")
+        self.cache.set("key_Iexe5aiNg2", 3)
+        self.assertIsNone(self.cache.get("key_oe9Eec1Ahc"))
+        self.assertEqual(self.cache.get("key_Eiquei2aiy"), 1)
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+
+    def test_disabled(self) -> None:
+        cache = TTLCache(max_size=0)
+        cache.set("key_wah4Aeshei", 42)
+        self.assertIsNone(cache.get("key_wah4Aeshei"))
@@ -0,0 +1,83 @@
+from typing import Any, Callable
+from unittest import TestCase, skipIf
+
+from openslides_backend.shared import codec
+from openslides_backend.shared.patterns import (
+    Collection,
+    FullQualifiedField,
+    FullQualifiedId,
+)
+
+
+class CodecTester(TestCase):
+    def test_dumps_compact(self) -> None:
+        self.assertEqual(
+            codec.dumps({"key_Thae1ain2u": [1, None, "text"]}),
+            '{"key_Thae1ain2u":[1,null,"text"]}',
+        )
+
+    def test_dumps_sort_keys(self) -> None:
+        self.assertEqual(
+            codec.dumps({"key_b": 1, "key_a": 2}, sort_keys=True),
+            '{"key_a":2,"key_b":1}',
+        )
+
+    def test_dumps_full_qualified_ids(self) -> None:
+        fqid = FullQualifiedId(Collection("collection_Iej8eiph1u"), 2398472910)
+        fqfield = FullQualifiedField(
+            Collection("collection_Iej8eiph1u"), 2398472910, "field_aeZ7Aed5ah"
+        )
+        self.assertEqual(
+            codec.dumpb([fqid, {"key": fqfield}]),
+            b'["collection_Iej8eiph1u/2398472910",'
+            b'{"key":"collection_Iej8eiph1u/2398472910/field_aeZ7Aed5ah"}]',
+        )
+
+    def test_dumps_unknown_type(self) -> None:
+        with self.assertRaises(TypeError):
+            codec.dumps({"key": object()})
+
+    def test_loads(self) -> None:
+        self.assertEqual(codec.loads(b'{"key": [1, 2]}'), {"key": [1, 2]})
+        self.assertEqual(codec.loads('{"key": [1, 2]}'), {"key": [1, 2]})
+
+    def test_loads_invalid(self) -> None:
+        with self.assertRaises(codec.JSONDecodeError):
+            codec.loads(b"<html></html>")
+
+
+class BaseBackendTester:
+    """
+    Checks that a codec backend encodes exactly like all other backends.
+    """
+
+    dumpb: Callable[..., bytes]
+
+    def encode(self, obj: Any, **kwargs: Any) -> bytes:
+        return type(self).dumpb(obj, **kwargs)
+
+    def test_non_string_keys(self: Any) -> None:
+        self.assertEqual(self.encode({1: 2}), b'{"1":2}')
+
+    def test_big_integer(self: Any) -> None:
+        self.assertEqual(
+            self.encode({"key": 2 ** 70}), b'{"key":1180591620717411303424}'
+        )
+
+    def test_nan(self: Any) -> None:
+        self.assertEqual(
+            self.encode([float("nan"), float("inf")], sort_keys=True), b"[null,null]"
+        )
+
+    def test_unknown_type(self: Any) -> None:
+        with self.assertRaises(TypeError):
+            self.encode({"key": object()})
+
+
+class SimplejsonBackendTester(BaseBackendTester, TestCase):
+    dumpb = codec.simplejson_dumpb
+
+
+@skipIf(codec.orjson is None, "orjson is not installed.")
+class OrjsonBackendTester(BaseBackendTester, TestCase):
+    dumpb = codec.orjson_dumpb
@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from openslides_backend.shared.executor import executors, get_executor
+
+
+class ExecutorTester(TestCase):
+    def tearDown(self) -> None:
+        _, _, executor = executors.pop("test_Aeth3ieLoh")
+        executor.shutdown()
+
+    def test_same_executor(self) -> None:
+        executor = get_executor("test_Aeth3ieLoh", 2)
+        self.assertIs(get_executor("test_Aeth3ieLoh", 2), executor)
+
+    def test_other_size(self) -> None:
+        executor = get_executor("test_Aeth3ieLoh", 2)
+        future = executor.submit(lambda: 42)
+        other_executor = get_executor("test_Aeth3ieLoh", 3)
+        self.assertIsNot(other_executor, executor)
+        self.assertEqual(other_executor._max_workers, 3)  # type: ignore
+        self.assertEqual(future.result(timeout=5), 42)
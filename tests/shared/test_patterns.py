@@ -0,0 +1,81 @@
+import os
+import timeit
+from unittest import TestCase
+
+import pytest
+
+from openslides_backend.shared.patterns import (
+    KEYSEPARATOR,
+    Collection,
+    FullQualifiedField,
+    FullQualifiedId,
+)
+
+
+class PlainFullQualifiedField:
+    """
+    Full qualified field as it was before: The string form is built on every
+    hash.
+    """
+
+    def __init__(self, collection: Collection, id: int, field: str) -> None:
+        self.collection = collection
+        self.id = id
+        self.field = field
+
+    def __str__(self) -> str:
+        return KEYSEPARATOR.join((str(self.collection), str(self.id), self.field))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlainFullQualifiedField):
+            return NotImplemented
+        return (
+            self.collection == other.collection
+            and self.id == other.id
+            and self.field == other.field
+        )
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+@pytest.mark.skipif(
+    not os.environ.get("OPENSLIDES_BACKEND_RUN_ALL_TESTS"), reason="Test is very slow."
+)
+class FullQualifiedFieldBenchmark(TestCase):
+    """
+    Compares dict operations with full qualified fields as keys like they
+    happen for locked fields and relations.
+    """
+
+    def run_benchmark(self, cls: type) -> float:
+        collection = Collection("motion")
+        keys = [cls(collection, id, "title") for id in range(1000)]
+
+        def statement() -> None:
+            locked_fields = {}
+            for key in keys:
+                locked_fields[key] = 1
+            for key in keys:
+                locked_fields[key]
+
+        return min(timeit.repeat(statement, number=20, repeat=5))
+
+    def test_speedup(self) -> None:
+        plain = self.run_benchmark(PlainFullQualifiedField)
+        interned = self.run_benchmark(FullQualifiedField)
+        self.assertLess(interned * 2, plain)
+
+    def test_parse(self) -> None:
+        values = [f"motion/{id}" for id in range(1000)]
+        parsed = [FullQualifiedId.parse(value) for value in values]
+        duration = min(
+            timeit.repeat(
+                lambda: [FullQualifiedId.parse(value) for value in values],
+                number=20,
+                repeat=5,
+            )
+        )
+        self.assertEqual(len(set(parsed)), 1000)
+        # 20000 parse calls must not take longer than one second.
+        self.assertLess(duration, 1)
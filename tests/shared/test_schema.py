@@ -0,0 +1,55 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from fastjsonschema import JsonSchemaException  # type: ignore
+
+from openslides_backend.shared.schema import (
+    LazySchema,
+    compile_schema,
+    prewarm_schemas,
+    schema_registry,
+    schema_version,
+)
+
+definition = {
+    "$schema": schema_version,
+    "type": "object",
+    "properties": {"id": {"type": "integer"}},
+    "required": ["id"],
+}
+
+
+class LazySchemaTester(TestCase):
+    def test_lazy(self) -> None:
+        get_definition = MagicMock(return_value=definition)
+        schema = LazySchema(get_definition)
+        get_definition.assert_not_called()
+        schema({"id": 42})
+        with self.assertRaises(JsonSchemaException):
+            schema({"id": "text_Ieth5eez6o"})
+        get_definition.assert_called_once()
+
+    def test_cache_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(
+                os.environ, {"OPENSLIDES_BACKEND_SCHEMA_CACHE_DIR": cache_dir}
+            ):
+                LazySchema(definition)({"id": 42})
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                with patch("fastjsonschema.compile_to_code") as compile_to_code:
+                    schema = LazySchema(definition)
+                    schema({"id": 42})
+                    with self.assertRaises(JsonSchemaException):
+                        schema({})
+                compile_to_code.assert_not_called()
+
+    def test_prewarm(self) -> None:
+        schema = compile_schema(definition)
+        try:
+            self.assertIsNone(schema._validator)
+            prewarm_schemas()
+            self.assertIsNotNone(schema._validator)
+        finally:
+            schema_registry.remove(schema)
@@ -1,5 +1,11 @@
+import gc
+import os
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
+from openslides_backend.http.application import iter_json
+from openslides_backend.main import OpenSlidesBackendGunicornApplication
+from openslides_backend.shared import codec
 from openslides_backend.shared.patterns import (
     Collection,
     FullQualifiedField,
@@ -79,6 +85,23 @@ class WSGIApplicationTester(TestCase):
             "Action fuzzy_action_hamzaeNg4a does not exist.", str(response.data)
         )
 
+    def test_wsgi_request_handle_separately(self) -> None:
+        client = Client(self.application, ResponseWrapper)
+        response = client.post(
+            "/handle_separately",
+            json=[{"action": "fuzzy_action_Roh2ohb4ai", "data": [{}]}],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            codec.loads(response.data),
+            [
+                {
+                    "success": False,
+                    "message": "Action fuzzy_action_Roh2ohb4ai does not exist.",
+                }
+            ],
+        )
+
     def test_health_route(self) -> None:
         client = Client(self.application, ResponseWrapper)
         response = client.get("/health")
@@ -166,3 +189,91 @@ class TypesTester(TestCase):
             fqfield.fqid,
             FullQualifiedId(Collection("collection_quephah8Oo"), 3148072663),
         )
+
+    def test_full_qualified_id_parse(self) -> None:
+        fqid = FullQualifiedId.parse("collection_Ohngu5ooSh/3849204712")
+        self.assertEqual(
+            fqid, FullQualifiedId(Collection("collection_Ohngu5ooSh"), 3849204712)
+        )
+
+    def test_full_qualified_id_parse_invalid(self) -> None:
+        for value in ("collection_Eeth0Eiwai", "/42", "collection_Eeth0Eiwai/1/2"):
+            with self.assertRaises(ValueError):
+                FullQualifiedId.parse(value)
+
+    def test_full_qualified_id_interning(self) -> None:
+        fqid_1 = FullQualifiedId(Collection("collection_ooPh1eij1o"), 5830193742)
+        fqid_2 = FullQualifiedId.parse("collection_ooPh1eij1o/5830193742")
+        self.assertIs(fqid_1, fqid_2)
+
+    def test_full_qualified_id_immutable(self) -> None:
+        fqid = FullQualifiedId(Collection("collection_Ahng3ahcei"), 2938402918)
+        with self.assertRaises(AttributeError):
+            fqid.id = 42  # type: ignore
+
+    def test_full_qualified_field_parse(self) -> None:
+        fqfield = FullQualifiedField.parse(
+            "collection_quai5Eiqu0/7482910323/field_Ahv3ieGh4o"
+        )
+        self.assertEqual(
+            fqfield,
+            FullQualifiedField(
+                Collection("collection_quai5Eiqu0"), 7482910323, "field_Ahv3ieGh4o"
+            ),
+        )
+        self.assertEqual(
+            hash(fqfield), hash("collection_quai5Eiqu0/7482910323/field_Ahv3ieGh4o")
+        )
+
+
+class StreamingJSONTester(TestCase):
+    def test_iter_json_list(self) -> None:
+        body = [{"key_ioW5ahWoh4": 1}, {"key_ioW5ahWoh4": [2, None]}, "text"]
+        chunks = list(iter_json(body))
+        self.assertEqual(len(chunks), 7)
+        self.assertEqual(b"".join(chunks).decode(), codec.dumps(body))
+
+    def test_iter_json_empty_list(self) -> None:
+        self.assertEqual(b"".join(iter_json([])), b"[]")
+
+    def test_iter_json_object(self) -> None:
+        body = {"key_Oosh4aiPh9": [1, 2]}
+        self.assertEqual(b"".join(iter_json(body)).decode(), codec.dumps(body))
+
+
+class GunicornStartupTester(TestCase):
+    def setUp(self) -> None:
+        self.application = OpenSlidesBackendGunicornApplication(view_name="ActionsView")
+
+    def test_preload(self) -> None:
+        self.assertTrue(self.application.cfg.preload_app)
+
+    def test_startup_phases(self) -> None:
+        server = MagicMock()
+        self.application.on_starting(server)
+        try:
+            self.application.when_ready(server)
+        finally:
+            gc.unfreeze()
+        self.assertEqual(
+            list(self.application.startup_timings),
+            ["imports", "schemas", "models", "presenters", "gc_freeze"],
+        )
+        server.log.info.assert_called_once()
+
+    def test_worker_model(self) -> None:
+        with patch.dict(
+            os.environ,
+            {
+                "OPENSLIDES_BACKEND_WORKER_CLASS": "gevent",
+                "OPENSLIDES_BACKEND_WORKERS": "4",
+                "OPENSLIDES_BACKEND_KEEPALIVE": "5",
+            },
+        ):
+            application = OpenSlidesBackendGunicornApplication(
+                view_name="PresenterView"
+            )
+        self.assertEqual(application.cfg.worker_class_str, "gevent")
+        self.assertEqual(application.cfg.workers, 4)
+        self.assertEqual(application.cfg.keepalive, 5)
+        self.assertFalse(application.cfg.preload_app)